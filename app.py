@@ -163,13 +163,14 @@ if not CONFIG_PATH.exists():
     show_config_setup()
     st.stop()
 
-# Initialize session state and data
+# Initialize session state and data. st.navigation runs every page through
+# this script, so the cached load_data() below is the single bootstrap: the
+# CSVs, config and state files are read once per server process, not per rerun.
 @st.cache_resource
 def load_data():
     """Load card processor, benefits calculator, stays manager, and summary service."""
     processor = CardProcessor()
-    processor.process_personal_card()
-    processor.process_business_card()
+    processor.process_all()
 
     calculator = BenefitsCalculator(
         config_path="benefits_config.yaml",
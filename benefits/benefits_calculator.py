@@ -1,11 +1,240 @@
 import json
 import yaml
-from datetime import datetime, date
+from bisect import insort
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List
 import pandas as pd
 import calendar
 
+try:
+    import orjson
+except ImportError:  # optional speedup; the standard library codec works the same
+    orjson = None
+
+# Calendar period suffix -> (start_month, end_month, end_day). end_day is None
+# for February, whose length depends on the year.
+_SUFFIX_RANGES = {
+    'H1': (1, 6, 30), 'H2': (7, 12, 31),
+    'Q1': (1, 3, 31), 'Q2': (4, 6, 30), 'Q3': (7, 9, 30), 'Q4': (10, 12, 31),
+}
+for _month in range(1, 13):
+    _last_day = None if _month == 2 else calendar.monthrange(2001, _month)[1]
+    # Monthly: '2026-Jan', plus the older '2026-M01' format
+    _SUFFIX_RANGES[calendar.month_abbr[_month]] = (_month, _month, _last_day)
+    _SUFFIX_RANGES[f"M{_month:02d}"] = (_month, _month, _last_day)
+del _month, _last_day
+
+
+# Period suffixes appended to the year string, per frequency
+_CALENDAR_PERIOD_SUFFIXES = {
+    'yearly': ('',),
+    'half_yearly': ('-H1', '-H2'),
+    'quarterly': ('-Q1', '-Q2', '-Q3', '-Q4'),
+    'monthly': tuple('-' + calendar.month_abbr[month] for month in range(1, 13)),
+}
+# Anniversary suffixes are followed by the two-digit renewal month. Every 4
+# years benefits (e.g., Global Entry/TSA PreCheck) use the yearly
+# anniversary period for the year they can be used in.
+_ANNIVERSARY_PERIOD_SUFFIXES = {
+    'yearly': ('-A',),
+    'half_yearly': ('-AH1-', '-AH2-'),
+    'quarterly': ('-AQ1-', '-AQ2-', '-AQ3-', '-AQ4-'),
+    'every_4_years': ('-A',),
+}
+
+
+def _is_anniversary_period(period: str) -> bool:
+    """
+    Check whether a period string is a card anniversary period.
+
+    Anniversary periods have 'A' right after the year followed by a digit,
+    'H' or 'Q' ('2026-A12', '2026-AH1-11', '2026-AQ1-11'), which keeps month
+    abbreviations like '2026-Apr' and '2026-Aug' on the calendar side.
+    """
+    return len(period) > 6 and period[5] == 'A' and period[6] in '0123456789HQ'
+
+
+def _parse_iso(value: str) -> tuple:
+    """Split an ISO 'YYYY-MM-DD' string into (year, month, day) ints without building a date."""
+    return int(value[0:4]), int(value[5:7]), int(value[8:10])
+
+
+@lru_cache(maxsize=1024)
+def _anniv_range(renewal_month: int, renewal_day: int, year: int) -> tuple:
+    """
+    Date range of the anniversary year starting on the renewal date in `year`.
+
+    The range ends the day before the next renewal date. A Feb 29 renewal day
+    is clamped to Feb 28 in non-leap years.
+    """
+    start_day = min(renewal_day, calendar.monthrange(year, renewal_month)[1])
+    next_day = min(renewal_day, calendar.monthrange(year + 1, renewal_month)[1])
+    start_date = date(year, renewal_month, start_day)
+    end_date = date(year + 1, renewal_month, next_day) - timedelta(days=1)
+    return start_date, end_date
+
+
+@lru_cache(maxsize=1024)
+def _anniv_range_ord(renewal_month: int, renewal_day: int, year: int) -> tuple:
+    """Ordinal (start, end) of _anniv_range, for integer overlap checks."""
+    start_date, end_date = _anniv_range(renewal_month, renewal_day, year)
+    return start_date.toordinal(), end_date.toordinal()
+
+
+@lru_cache(maxsize=1024)
+def _calendar_range(period: str) -> tuple:
+    """Date range of a calendar period string, or (None, None) if invalid."""
+    try:
+        year_str, sep, suffix = period.partition('-')
+        year = int(year_str)
+        if not sep:
+            # Yearly: just '2026'
+            return date(year, 1, 1), date(year, 12, 31)
+
+        bounds = _SUFFIX_RANGES.get(suffix)
+        if bounds is None:
+            return None, None
+        start_month, end_month, end_day = bounds
+        if end_day is None:
+            # February: depends on leap year
+            end_day = calendar.monthrange(year, end_month)[1]
+        return date(year, start_month, 1), date(year, end_month, end_day)
+    except (ValueError, AttributeError):
+        return None, None
+
+
+@lru_cache(maxsize=1024)
+def _calendar_range_ord(period: str) -> tuple:
+    """Ordinal (start, end) of _calendar_range, or None if the period is invalid."""
+    start_date, end_date = _calendar_range(period)
+    if start_date is None:
+        return None
+    return start_date.toordinal(), end_date.toordinal()
+
+
+def _dumps_state(state: Dict) -> bytes:
+    """Serialize benefits state as indented JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(state, option=orjson.OPT_INDENT_2)
+    return json.dumps(state, indent=2).encode()
+
+
+_loads_state = orjson.loads if orjson is not None else json.loads
+
+
+@dataclass(frozen=True)
+class Benefit:
+    """One benefit definition from the config."""
+    # Declared by hand rather than slots=True, which needs Python 3.10
+    __slots__ = ('id', 'category', 'amount', 'frequency', 'renewal_type')
+    id: str
+    category: str
+    amount: float
+    frequency: str
+    renewal_type: str
+
+
+@dataclass(frozen=True)
+class CardMeta:
+    """Per-card config fields, read once from the config instead of on every call."""
+    display_name: str
+    annual_fee: float
+    renewal: tuple  # (renewal_month, renewal_day)
+    year: int
+    # Card key without its _YYYY suffix; calendar-year benefit ids share it across card years
+    calendar_key: str
+    benefits: tuple
+
+
+def _build_card_meta(config: Dict) -> Dict[str, CardMeta]:
+    """Build CardMeta for every card in a parsed config, leaving the config untouched."""
+    cards = {}
+    for card_key, card in config.get('cards', {}).items():
+        # Remove _YYYY suffix for calendar year benefits (e.g., schwab_platinum_2025 -> schwab_platinum)
+        prefix, sep, suffix = card_key.rpartition('_')
+        cards[card_key] = CardMeta(
+            display_name=card.get('display_name', card_key),
+            annual_fee=card.get('annual_fee', 0),
+            renewal=(card.get('renewal_month', 1), card.get('renewal_day', 1)),
+            year=card.get('year'),
+            calendar_key=prefix if sep and suffix.isdigit() else card_key,
+            benefits=tuple(
+                Benefit(
+                    id=benefit['id'],
+                    category=benefit['category'],
+                    amount=benefit['amount'],
+                    frequency=benefit.get('frequency', 'yearly'),
+                    renewal_type=benefit.get('renewal_type', 'calendar_year'),
+                )
+                for benefit in card.get('benefits', [])
+            ),
+        )
+    return cards
+
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+@lru_cache(maxsize=32)
+def _load_config_cached(path_str: str, mtime_ns: int) -> Dict:
+    """
+    Parse a benefits config file, cached on its path and modification time.
+
+    The returned dict is shared between calculators loading the same
+    unchanged file, so it must be treated as read-only.
+    """
+    with open(path_str, 'r') as f:
+        return yaml.load(f, Loader=_YAML_LOADER) or {"cards": {}}
+
+
+@lru_cache(maxsize=512)
+def _gen_periods(frequency: str, renewal_type: str, renewal_month: int, current_year: int) -> tuple:
+    """
+    Build the period identifiers for one benefit definition.
+
+    Pure function of its arguments, so results are shared across calls and
+    calculators.
+
+    Args:
+        frequency: Benefit frequency (yearly, half_yearly, quarterly, monthly, every_4_years)
+        renewal_type: 'calendar_year' or 'card_anniversary'
+        renewal_month: Card renewal month (1-12), used for anniversary periods
+        current_year: Year treated as "now"
+
+    Returns:
+        Tuple of period strings (e.g., ("2026-Q1", "2025-Q1", ...))
+    """
+    if renewal_type == 'calendar_year':
+        # Calendar-based periods: '2026', '2026-H1', '2026-Q1', '2026-Jan'
+        suffixes = _CALENDAR_PERIOD_SUFFIXES.get(frequency, ())
+    elif renewal_type == 'card_anniversary':
+        # Card anniversary-based periods carry the renewal month:
+        # '2026-A07', '2026-AH1-07', '2026-AQ1-07'
+        # This allows tracking across card renewal dates
+        month_str = f"{renewal_month:02d}"
+        suffixes = tuple(suffix + month_str for suffix in _ANNIVERSARY_PERIOD_SUFFIXES.get(frequency, ()))
+    else:
+        return ()
+    
+    periods = []
+    extend = periods.extend
+    # Generate periods for current year and past years (2 years back)
+    # and future years (1 year ahead)
+    for year in range(current_year - 2, current_year + 2):
+        year_str = str(year)
+        extend([year_str + suffix for suffix in suffixes])
+    
+    return tuple(periods)
+
+
+@lru_cache(maxsize=512)
+def _gen_period_set(frequency: str, renewal_type: str, renewal_month: int, current_year: int) -> frozenset:
+    """Cached frozenset of _gen_periods, for O(1) membership checks."""
+    return frozenset(_gen_periods(frequency, renewal_type, renewal_month, current_year))
 
 
 class BenefitsCalculator:
@@ -14,19 +243,27 @@ class BenefitsCalculator:
     Handles complex date logic (calendar year vs. card anniversary dates).
     """
     
-    def __init__(self, config_path="benefits_config.yaml", state_path="benefits_state.json"):
+    def __init__(self, config_path="benefits_config.yaml", state_path="benefits_state.json", today: date = None):
         """
         Initialize the benefits calculator.
         
         Args:
             config_path: Path to benefits_config.yaml
             state_path: Path to benefits_state.json
+            today: Date treated as "now" (defaults to date.today())
         """
         self.config_path = Path(config_path)
         self.state_path = Path(state_path)
         self.config = self._load_config()
+        self._cards = _build_card_meta(self.config)
         self.state = self._load_state()
-        self.today = date.today()
+        # (benefit_id, period) -> state entry; shares entry dicts with self.state
+        self._state_index = self._index_state()
+        # Set by mutators that actually changed an entry; cleared by save_state
+        self._dirty = False
+        self.today = today or date.today()
+        # benefit_id -> sorted posted period years; built lazily, reset on mutation
+        self._posted_years_index = None
     
     def _load_config(self) -> Dict:
         """Load benefits configuration from YAML."""
@@ -34,22 +271,74 @@ class BenefitsCalculator:
             print(f"Warning: Config file {self.config_path} not found")
             return {"cards": {}}
         
-        with open(self.config_path, 'r') as f:
-            return yaml.safe_load(f) or {"cards": {}}
+        mtime_ns = self.config_path.stat().st_mtime_ns
+        return _load_config_cached(str(self.config_path.resolve()), mtime_ns)
     
     def _load_state(self) -> Dict:
-        """Load benefits state from JSON."""
+        """Load benefits state from JSON; a missing file is empty state, created on first save."""
         if not self.state_path.exists():
-            print(f"Warning: State file {self.state_path} not found")
             return {}
         
-        with open(self.state_path, 'r') as f:
-            return json.load(f)
+        return _loads_state(self.state_path.read_bytes() or b'{}')
+    
+    def _index_state(self) -> Dict[tuple, Dict]:
+        """Index the flat 'benefit_id|period' state by (benefit_id, period) tuples."""
+        index = {}
+        for key, state_entry in self.state.items():
+            benefit_id, _, period = key.rpartition('|')
+            index[(benefit_id, period)] = state_entry
+        return index
+    
+    def _add_state_entry(self, benefit_id: str, period: str, state_entry: Dict) -> Dict:
+        """Add a new state entry to both the flat state and the tuple index."""
+        self.state[f"{benefit_id}|{period}"] = state_entry
+        self._state_index[(benefit_id, period)] = state_entry
+        return state_entry
+    
+    def _get_state_entry(self, benefit_id: str, period: str, default: Dict) -> Dict:
+        """
+        Get the state entry for a benefit period, adding `default` as the entry if missing.
+        
+        `default` is stored as-is, so callers pass a fresh dict.
+        """
+        state_entry = self._state_index.get((benefit_id, period))
+        if state_entry is None:
+            state_entry = self._add_state_entry(benefit_id, period, default)
+        return state_entry
     
     def save_state(self):
         """Save benefits state to JSON."""
-        with open(self.state_path, 'w') as f:
-            json.dump(self.state, f, indent=2)
+        self._dirty = False
+        self._posted_years_index = None
+        self.state_path.write_bytes(_dumps_state(self.state))
+    
+    def flush(self):
+        """Save benefits state to JSON if it changed since the last save."""
+        if self._dirty:
+            self.save_state()
+    
+    def _get_posted_years_index(self) -> Dict[str, List[int]]:
+        """
+        Map each benefit_id to the sorted years of its posted periods.
+        
+        Built with one pass over the state and reused until the next save.
+        
+        Returns:
+            Dictionary of benefit_id -> sorted list of period years
+        """
+        if self._posted_years_index is None:
+            index = {}
+            for (benefit_id, stored_period), state_entry in self._state_index.items():
+                if not state_entry.get('posted', False):
+                    continue
+                # Extract the year from the period (e.g., "2025-A11" -> 2025)
+                try:
+                    stored_year = int(stored_period.partition('-')[0])
+                except ValueError:
+                    continue
+                insort(index.setdefault(benefit_id, []), stored_year)
+            self._posted_years_index = index
+        return self._posted_years_index
     
     def toggle_benefit(self, benefit_id: str, period: str, anniversary_year: int = None):
         """
@@ -60,19 +349,26 @@ class BenefitsCalculator:
             period: Period identifier (e.g., "2026-Q1" or "2026")
             anniversary_year: Optional anniversary year for calendar benefits (tracks which year it was used in)
         """
-        key = f"{benefit_id}|{period}"
-        if key not in self.state:
-            self.state[key] = {'posted': False, 'post_date': None, 'custom_amount': None, 'posted_anniversary_year': None}
-        
-        self.state[key]['posted'] = not self.state[key]['posted']
-        if self.state[key]['posted']:
-            self.state[key]['post_date'] = self.today.isoformat()
-            if anniversary_year:
-                self.state[key]['posted_anniversary_year'] = anniversary_year
+        state_entry = self._state_index.get((benefit_id, period))
+        if state_entry is None:
+            # First toggle of this period: the new entry starts out posted
+            self._add_state_entry(benefit_id, period, {
+                'posted': True,
+                'post_date': self.today.isoformat(),
+                'custom_amount': None,
+                'posted_anniversary_year': anniversary_year or None,
+            })
+        elif state_entry['posted']:
+            state_entry['posted'] = False
+            state_entry['post_date'] = None
+            state_entry['posted_anniversary_year'] = None
         else:
-            self.state[key]['post_date'] = None
-            self.state[key]['posted_anniversary_year'] = None
-        self.save_state()
+            state_entry['posted'] = True
+            state_entry['post_date'] = self.today.isoformat()
+            if anniversary_year:
+                state_entry['posted_anniversary_year'] = anniversary_year
+        self._dirty = True
+        self.flush()
     
     def set_custom_amount(self, benefit_id: str, period: str, custom_amount: float = None):
         """
@@ -83,12 +379,17 @@ class BenefitsCalculator:
             period: Period identifier
             custom_amount: Custom amount used, or None to use the full amount
         """
-        key = f"{benefit_id}|{period}"
-        if key not in self.state:
-            self.state[key] = {'posted': False, 'post_date': None, 'custom_amount': None}
+        current = self._state_index.get((benefit_id, period), {})
+        if current.get('custom_amount') == custom_amount:
+            # Unchanged (a missing entry already reads as no custom amount)
+            return
         
-        self.state[key]['custom_amount'] = custom_amount
-        self.save_state()
+        state_entry = self._get_state_entry(
+            benefit_id, period, {'posted': False, 'post_date': None, 'custom_amount': None}
+        )
+        state_entry['custom_amount'] = custom_amount
+        self._dirty = True
+        self.flush()
     
     def get_custom_amount(self, benefit_id: str, period: str, default_amount: float = None):
         """
@@ -102,13 +403,12 @@ class BenefitsCalculator:
         Returns:
             Custom amount if set, otherwise default_amount
         """
-        key = f"{benefit_id}|{period}"
-        state_entry = self.state.get(key, {})
-        custom_amount = state_entry.get('custom_amount')
+        state_entry = self._state_index.get((benefit_id, period))
+        if state_entry is None:
+            return default_amount
         
-        if custom_amount is not None:
-            return custom_amount
-        return default_amount
+        custom_amount = state_entry.get('custom_amount')
+        return default_amount if custom_amount is None else custom_amount
     
     def set_benefit_posted(self, benefit_id: str, period: str, posted: bool, post_date: str = None):
         """
@@ -120,16 +420,18 @@ class BenefitsCalculator:
             posted: Whether the benefit has posted
             post_date: Date posted (YYYY-MM-DD format), defaults to today
         """
-        key = f"{benefit_id}|{period}"
-        if key not in self.state:
-            self.state[key] = {'posted': False, 'post_date': None, 'custom_amount': None}
+        new_post_date = (post_date or self.today.isoformat()) if posted else None
+        current = self._state_index.get((benefit_id, period))
+        if current is not None and current['posted'] == posted and current.get('post_date') == new_post_date:
+            return
         
-        self.state[key]['posted'] = posted
-        if posted:
-            self.state[key]['post_date'] = post_date or self.today.isoformat()
-        else:
-            self.state[key]['post_date'] = None
-        self.save_state()
+        state_entry = self._get_state_entry(
+            benefit_id, period, {'posted': False, 'post_date': None, 'custom_amount': None}
+        )
+        state_entry['posted'] = posted
+        state_entry['post_date'] = new_post_date
+        self._dirty = True
+        self.flush()
     
     def get_card_benefits(self, card_key: str) -> List[Dict]:
         """
@@ -141,43 +443,40 @@ class BenefitsCalculator:
         Returns:
             List of benefit dicts with id, category, amount, period, posted status
         """
-        if card_key not in self.config.get('cards', {}):
+        card = self._cards.get(card_key)
+        if card is None:
             return []
         
-        card = self.config['cards'][card_key]
         benefits_list = []
         
-        for benefit in card.get('benefits', []):
-            periods = self._generate_periods(benefit, card_key)
+        for benefit in card.benefits:
+            periods = _gen_periods(benefit.frequency, benefit.renewal_type, card.renewal[0], self.today.year)
+            
+            # Create unique ID by combining card base name and benefit id
+            # For calendar year benefits, strip the year suffix so they share state across card years
+            # For anniversary benefits, include the year since they're specific to that card's anniversary
+            if benefit.renewal_type == 'calendar_year':
+                unique_benefit_id = f"{card.calendar_key}_{benefit.id}"
+            else:
+                unique_benefit_id = f"{card_key}_{benefit.id}"
             
             for period in periods:
-                # Create unique ID by combining card base name and benefit id
-                # For calendar year benefits, strip the year suffix so they share state across card years
-                # For anniversary benefits, include the year since they're specific to that card's anniversary
-                renewal_type = benefit.get('renewal_type', 'calendar_year')
-                if renewal_type == 'calendar_year':
-                    # Remove _YYYY suffix for calendar year benefits (e.g., schwab_platinum_2025 -> schwab_platinum)
-                    base_card_key = '_'.join(card_key.rsplit('_', 1)[:-1]) if '_' in card_key and card_key.split('_')[-1].isdigit() else card_key
-                    unique_benefit_id = f"{base_card_key}_{benefit['id']}"
-                else:
-                    # Keep year for anniversary benefits
-                    unique_benefit_id = f"{card_key}_{benefit['id']}"
-                
-                state_key = f"{unique_benefit_id}|{period}"
-                state_entry = self.state.get(state_key, {'posted': False, 'post_date': None, 'custom_amount': None})
+                state_entry = self._state_index.get(
+                    (unique_benefit_id, period), {'posted': False, 'post_date': None, 'custom_amount': None}
+                )
                 
                 benefits_list.append({
                     'benefit_id': unique_benefit_id,
-                    'category': benefit['category'],
-                    'amount': benefit['amount'],
-                    'frequency': benefit['frequency'],
+                    'category': benefit.category,
+                    'amount': benefit.amount,
+                    'frequency': benefit.frequency,
                     'posted_anniversary_year': state_entry.get('posted_anniversary_year'),
                     'period': period,
                     'posted': state_entry['posted'],
                     'post_date': state_entry.get('post_date'),
                     'custom_amount': state_entry.get('custom_amount'),
                     'card_key': card_key,
-                    'card_name': card.get('display_name', card_key),
+                    'card_name': card.display_name,
                 })
         
         return benefits_list
@@ -190,81 +489,30 @@ class BenefitsCalculator:
             List of benefit dicts
         """
         all_benefits = []
-        for card_key in self.config.get('cards', {}).keys():
+        for card_key in self._cards:
             all_benefits.extend(self.get_card_benefits(card_key))
         return all_benefits
     
-    def _generate_periods(self, benefit: Dict, card_key: str) -> List[str]:
+    def _generate_periods(self, benefit: Dict, card_key: str) -> frozenset:
         """
         Generate period identifiers for a benefit based on its frequency and renewal logic.
         
+        Returned as a set for membership checks; get_card_benefits uses the
+        ordered _gen_periods tuple instead.
+        
         Args:
             benefit: Benefit definition from config
             card_key: Card identifier
             
         Returns:
-            List of period strings (e.g., ["2026-Q1", "2025-Q1", ...])
+            Frozenset of period strings (e.g., {"2026-Q1", "2025-Q1", ...})
         """
-        frequency = benefit.get('frequency', 'yearly')
-        renewal_type = benefit.get('renewal_type', 'calendar_year')
-        
-        card = self.config['cards'][card_key]
-        renewal_month = card.get('renewal_month', 1)
-        renewal_day = card.get('renewal_day', 1)
-        
-        periods = []
-        current_year = self.today.year
-        current_month = self.today.month
-        
-        # Generate periods for current year and past years (2 years back)
-        # and future years (1 year ahead)
-        for year_offset in range(-2, 2):
-            year = current_year + year_offset
-            
-            if renewal_type == 'calendar_year':
-                # Calendar-based periods
-                if frequency == 'yearly':
-                    periods.append(str(year))
-                elif frequency == 'half_yearly':
-                    periods.append(f"{year}-H1")
-                    periods.append(f"{year}-H2")
-                elif frequency == 'quarterly':
-                    periods.append(f"{year}-Q1")
-                    periods.append(f"{year}-Q2")
-                    periods.append(f"{year}-Q3")
-                    periods.append(f"{year}-Q4")
-                elif frequency == 'monthly':
-                    for month in range(1, 13):
-                        periods.append(f"{year}-{calendar.month_abbr[month]}")
-            
-            elif renewal_type == 'card_anniversary':
-                # Card anniversary-based periods
-                # Period format: "YYYY-AA" where AA is anniversary year
-                # This allows tracking across card renewal dates
-                
-                if frequency == 'yearly':
-                    # Yearly benefit renews on card anniversary
-                    # Period should span from last renewal to next renewal
-                    periods.append(f"{year}-A{renewal_month:02d}")
-                
-                elif frequency == 'half_yearly':
-                    # H1: anniversary month to ~6 months later
-                    # H2: 6 months after anniversary to anniversary
-                    periods.append(f"{year}-AH1-{renewal_month:02d}")
-                    periods.append(f"{year}-AH2-{renewal_month:02d}")
-                
-                elif frequency == 'quarterly':
-                    # Quarterly periods relative to anniversary
-                    for q in range(1, 5):
-                        periods.append(f"{year}-AQ{q}-{renewal_month:02d}")
-                
-                elif frequency == 'every_4_years':
-                    # Every 4 years benefit (e.g., Global Entry/TSA PreCheck)
-                    # Generate periods at 4-year intervals
-                    # The period represents the anniversary year when it can be used
-                    periods.append(f"{year}-A{renewal_month:02d}")
-        
-        return periods
+        return _gen_period_set(
+            benefit.get('frequency', 'yearly'),
+            benefit.get('renewal_type', 'calendar_year'),
+            self._cards[card_key].renewal[0],
+            self.today.year,
+        )
     
     def get_card_summary(self, card_key: str) -> Dict:
         """
@@ -276,10 +524,10 @@ class BenefitsCalculator:
         Returns:
             Dictionary with total annual fee, total benefits posted, total potential benefits
         """
-        if card_key not in self.config.get('cards', {}):
+        card = self._cards.get(card_key)
+        if card is None:
             return {}
         
-        card = self.config['cards'][card_key]
         benefits = self.get_card_benefits(card_key)
         
         # Filter to "active" periods (current year and recent)
@@ -290,7 +538,7 @@ class BenefitsCalculator:
                str(current_year - 1) in b['period']
         ]
         
-        total_annual_fee = card.get('annual_fee', 0)
+        total_annual_fee = card.annual_fee
         
         # Current year benefits
         current_year_benefits = [
@@ -309,7 +557,7 @@ class BenefitsCalculator:
         )
         
         return {
-            'card_name': card.get('display_name', card_key),
+            'card_name': card.display_name,
             'annual_fee': total_annual_fee,
             'total_posted': total_posted,
             'total_potential': total_potential,
@@ -329,9 +577,10 @@ class BenefitsCalculator:
         Returns:
             Month number (1-12)
         """
-        if card_key not in self.config.get('cards', {}):
+        card = self._cards.get(card_key)
+        if card is None:
             return None
-        return self.config['cards'][card_key].get('renewal_month', 1)
+        return card.renewal[0]
     
     def get_anniversary_year_range(self, card_key: str, anniversary_year: int) -> tuple:
         """
@@ -344,20 +593,13 @@ class BenefitsCalculator:
         Returns:
             Tuple of (start_date, end_date) for the anniversary year
         """
-        if card_key not in self.config.get('cards', {}):
+        card = self._cards.get(card_key)
+        if card is None:
             return None, None
         
-        card = self.config['cards'][card_key]
-        renewal_month = card.get('renewal_month', 1)
-        renewal_day = card.get('renewal_day', 1)
-        
-        # Anniversary year "2025" with July (7) renewal starts July 2025 and ends July 14, 2026
+        # Anniversary year "2025" with July 15 renewal starts July 15, 2025 and ends July 14, 2026
         # The year is associated with when the fee is paid (beginning of period)
-        from datetime import timedelta
-        start_date = date(anniversary_year, renewal_month, renewal_day)
-        end_date = start_date + timedelta(days=364)  # 365 days total = almost 1 year
-        
-        return start_date, end_date
+        return _anniv_range(*card.renewal, anniversary_year)
     
     def get_benefit_renewal_type(self, benefit: Dict) -> str:
         """
@@ -370,12 +612,7 @@ class BenefitsCalculator:
         Returns:
             'card_anniversary' or 'calendar_year'
         """
-        period = benefit.get('period', '')
-        # Anniversary periods contain '-A' followed by a digit or 'H' or 'Q': 
-        # '2026-A12', '2026-AH1-11', '2026-AQ1-11', etc.
-        # Must not match month abbreviations like '2026-Apr' or '2026-Aug'
-        import re
-        if re.search(r'-A[0-9HQ]', period):
+        if _is_anniversary_period(benefit.get('period', '')):
             return 'card_anniversary'
         return 'calendar_year'
     
@@ -394,31 +631,28 @@ class BenefitsCalculator:
         if not benefit['posted'] or not benefit['post_date']:
             return None
         
-        if card_key not in self.config.get('cards', {}):
+        card = self._cards.get(card_key)
+        if card is None:
             return None
         
-        card = self.config['cards'][card_key]
-        renewal_month = card.get('renewal_month', 1)
-        renewal_day = card.get('renewal_day', 1)
+        renewal_month, renewal_day = card.renewal
         
-        post_date = date.fromisoformat(benefit['post_date'])
+        # Compare (month, day) ints rather than building date objects
+        post_year, post_month, post_day = _parse_iso(benefit['post_date'])
+        if renewal_month == 2 and renewal_day == 29 and not calendar.isleap(post_year):
+            # Feb 29 renewals fall on Feb 28 in non-leap years, as in _anniv_range
+            renewal_day = 28
         
         # Determine which anniversary year this post_date falls into
         # If renewal is July 15, then:
         #   - Anniversary year 2025 covers July 15, 2025 to July 14, 2026
         #   - Anniversary year 2026 covers July 15, 2026 to July 14, 2027
         # The year is associated with when the fee is paid (beginning of period)
-        
-        renewal_date_in_post_year = date(post_date.year, renewal_month, renewal_day)
-        
-        if post_date >= renewal_date_in_post_year:
+        if (post_month, post_day) >= (renewal_month, renewal_day):
             # Post date is on or after this year's renewal, so it's part of this anniversary year
-            anniversary_year = post_date.year
-        else:
-            # Post date is before this year's renewal, so it's part of previous anniversary year
-            anniversary_year = post_date.year - 1
-        
-        return anniversary_year
+            return post_year
+        # Post date is before this year's renewal, so it's part of previous anniversary year
+        return post_year - 1
     
     def get_benefit_period_anniversary_year(self, benefit: Dict) -> int:
         """
@@ -432,17 +666,13 @@ class BenefitsCalculator:
             Anniversary year (int), or None if not an anniversary period
         """
         period = benefit.get('period', '')
+        if not _is_anniversary_period(period):
+            return None
         
-        # Anniversary periods: '2026-A11', '2026-AH1-11', '2026-AQ1-11', etc.
-        # Extract the first 4-digit year
-        if '-A' in period:
-            year_str = period.split('-')[0]
-            try:
-                return int(year_str)
-            except ValueError:
-                return None
-        
-        return None
+        try:
+            return int(period[:4])
+        except ValueError:
+            return None
     
     def get_calendar_period_date_range(self, period: str) -> tuple:
         """
@@ -454,55 +684,7 @@ class BenefitsCalculator:
         Returns:
             Tuple of (start_date, end_date) or (None, None) if invalid
         """
-        try:
-            # Check for monthly period with abbreviated month name (2026-Jan, 2026-Feb, etc.)
-            month_num = None
-            for m in range(1, 13):
-                if period.endswith(calendar.month_abbr[m]):
-                    year_str = period.split('-')[0]
-                    try:
-                        year = int(year_str)
-                        month_num = m
-                        _, last_day = calendar.monthrange(year, month_num)
-                        return date(year, month_num, 1), date(year, month_num, last_day)
-                    except ValueError:
-                        pass
-            
-            if '-M' in period:
-                # Fallback for old format: Monthly: 2026-M01, M02, ..., M12
-                year_str, month_part = period.split('-M')
-                year = int(year_str)
-                month = int(month_part)
-                # Get the last day of the month
-                _, last_day = calendar.monthrange(year, month)
-                return date(year, month, 1), date(year, month, last_day)
-            elif '-H' in period:
-                # Half-yearly: 2026-H1 or 2026-H2
-                year_str, half = period.split('-H')
-                year = int(year_str)
-                if half == '1':
-                    return date(year, 1, 1), date(year, 6, 30)
-                else:  # H2
-                    return date(year, 7, 1), date(year, 12, 31)
-            elif '-Q' in period:
-                # Quarterly: 2026-Q1, Q2, Q3, Q4
-                year_str, quarter = period.split('-Q')
-                year = int(year_str)
-                quarter_num = int(quarter)
-                if quarter_num == 1:
-                    return date(year, 1, 1), date(year, 3, 31)
-                elif quarter_num == 2:
-                    return date(year, 4, 1), date(year, 6, 30)
-                elif quarter_num == 3:
-                    return date(year, 7, 1), date(year, 9, 30)
-                else:  # Q4
-                    return date(year, 10, 1), date(year, 12, 31)
-            else:
-                # Yearly: just '2026'
-                year = int(period)
-                return date(year, 1, 1), date(year, 12, 31)
-        except (ValueError, AttributeError):
-            return None, None
+        return _calendar_range(period)
     
     def calendar_period_overlaps_anniversary_year(self, card_key: str, period: str, anniversary_year: int) -> bool:
         """
@@ -516,17 +698,15 @@ class BenefitsCalculator:
         Returns:
             True if there's overlap, False otherwise
         """
-        # Get date ranges
-        period_start, period_end = self.get_calendar_period_date_range(period)
-        if not period_start or not period_end:
-            return False
-        
-        anniv_start, anniv_end = self.get_anniversary_year_range(card_key, anniversary_year)
-        if not anniv_start or not anniv_end:
+        period_range = _calendar_range_ord(period)
+        card = self._cards.get(card_key)
+        if period_range is None or card is None:
             return False
         
-        # Check for overlap: periods overlap if one starts before the other ends
-        return period_start <= anniv_end and period_end >= anniv_start
+        # Compare ordinals: the intervals overlap if each starts before the other ends
+        period_start, period_end = period_range
+        anniv_start, anniv_end = _anniv_range_ord(*card.renewal, anniversary_year)
+        return period_start <= anniv_end and anniv_start <= period_end
     
     def get_posted_calendar_benefit_anniversary_year(self, card_key: str, benefit: Dict) -> int:
         """
@@ -543,19 +723,12 @@ class BenefitsCalculator:
         if not benefit['posted'] or not benefit['post_date']:
             return None
         
-        post_date = date.fromisoformat(benefit['post_date'])
-        
-        # Check which anniversary year this post_date falls into
-        # We'll check a range of possible anniversary years
-        current_year = self.today.year
-        for year_offset in range(-2, 3):
-            anniversary_year = current_year + year_offset
-            anniv_start, anniv_end = self.get_anniversary_year_range(card_key, anniversary_year)
-            if anniv_start and anniv_end:
-                if anniv_start <= post_date <= anniv_end:
-                    return anniversary_year
-        
-        return None
+        # Anniversary years are contiguous, so the post date's anniversary year is
+        # the one it falls within; only years near today are considered
+        anniversary_year = self.get_benefit_anniversary_year(card_key, benefit)
+        if anniversary_year is None or abs(anniversary_year - self.today.year) > 2:
+            return None
+        return anniversary_year
 
     def get_all_cards_summary(self) -> pd.DataFrame:
         """
@@ -565,7 +738,7 @@ class BenefitsCalculator:
             DataFrame with card summaries
         """
         summaries = []
-        for card_key in self.config.get('cards', {}).keys():
+        for card_key in self._cards:
             summary = self.get_card_summary(card_key)
             if summary:
                 summary['card_key'] = card_key
@@ -610,31 +783,18 @@ class BenefitsCalculator:
             - last_used_year: Anniversary year when it was last used (if applicable)
         """
         # Get the card's anniversary information
-        if card_key not in self.config.get('cards', {}):
+        if card_key not in self._cards:
             return True, None, None
         
-        card = self.config['cards'][card_key]
-        renewal_month = card.get('renewal_month', 1)
-        
         # Extract the period year from the current period
         try:
             current_period_year = int(period.split('-')[0])
         except (ValueError, IndexError):
             return True, None, None
         
-        # Look for any posted instances of this benefit across all periods
-        last_used_year = None
-        for key, state_entry in self.state.items():
-            if state_entry.get('posted', False) and key.startswith(f"{benefit_id}|"):
-                # Extract the period from the state key
-                stored_period = key.split('|')[1]
-                # Extract the year from the period (e.g., "2025-A11" -> 2025)
-                try:
-                    stored_year = int(stored_period.split('-')[0])
-                    if last_used_year is None or stored_year > last_used_year:
-                        last_used_year = stored_year
-                except (ValueError, IndexError):
-                    continue
+        # Most recent posted use of this benefit across all periods
+        posted_years = self._get_posted_years_index().get(benefit_id)
+        last_used_year = posted_years[-1] if posted_years else None
         
         # If never used, it's available
         if last_used_year is None:
@@ -1,9 +1,117 @@
 import os
+import threading
 import pandas as pd
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import pyarrow  # noqa: F401
+except ImportError:
+    _CSV_ENGINE = None
+else:
+    # Multi-threaded Arrow CSV reader; pandas picks its default parser otherwise
+    _CSV_ENGINE = 'pyarrow'
+
+# Bonus nights for reaching each tier (index = tier); tiers past the end of
+# the table earn its last entry
+_PERSONAL_NIGHTS_BY_TIER = np.array([0, 2, 4, 6, 8, 10, 12, 14, 16, 18, 20, 22])
+_BUSINESS_NIGHTS_BY_TIER = np.array([0, 5, 10, 15, 20, 25, 30])
+
+
+def _tier_nights(table, tier):
+    """Look up bonus nights for a tier or array of tiers, clamped to the table."""
+    return table[np.clip(np.nan_to_num(tier), 0, len(table) - 1).astype(np.intp)]
+
+
+def _shift1(values):
+    """
+    Shift values down one row, starting from 0 at the beginning of history.
+    
+    Args:
+        values: ndarray of running totals
+        
+    Returns:
+        float ndarray where row i holds values[i - 1] and row 0 holds 0.0
+    """
+    values = np.asarray(values, dtype=float)
+    out = np.empty_like(values)
+    if len(values):
+        out[0] = 0.0
+        out[1:] = values[:-1]
+    return out
+
+
+def _yearly_cumsum(amount, year):
+    """
+    Running total of amount that restarts for each year, like
+    groupby('year').cumsum() but without the groupby machinery.
+    
+    Rows don't need to be grouped by year already (transactions are sorted
+    by transaction date, years come from the post date). Each year's total
+    is a plain cumsum over its own slice rather than a global cumsum minus
+    an offset, so tier thresholds aren't crossed by float rounding.
+    
+    Args:
+        amount: float ndarray of transaction amounts
+        year: ndarray of years, NaN where the post date didn't parse
+        
+    Returns:
+        float ndarray aligned with amount; NaN where year or amount is NaN
+    """
+    amount = np.asarray(amount, dtype=float)
+    year = np.asarray(year, dtype=float)
+    out = np.full(len(amount), np.nan)
+    if not len(amount):
+        return out
+    
+    valid_amount = np.nan_to_num(amount)
+    order = np.argsort(year, kind='stable')
+    sorted_year = year[order]
+    # Start of each run of equal years; NaN years sort last and are left as NaN
+    starts = np.flatnonzero(np.r_[True, sorted_year[1:] != sorted_year[:-1]])
+    ends = np.r_[starts[1:], len(order)]
+    for start, end in zip(starts, ends):
+        if np.isnan(sorted_year[start]):
+            break
+        rows = order[start:end]
+        out[rows] = np.cumsum(valid_amount[rows])
+    
+    out[np.isnan(amount)] = np.nan
+    return out
+
+
+def _group_shift1(values, year):
+    """
+    Shift values down one row within each year, like
+    groupby('year').shift(1) but without the groupby machinery.
+    
+    As with _yearly_cumsum, rows of a year don't need to be adjacent.
+    
+    Args:
+        values: ndarray of running totals
+        year: ndarray of years, NaN where the post date didn't parse
+        
+    Returns:
+        float ndarray where each row holds the previous value from the same
+        year; NaN for the first row of a year and where year is NaN
+    """
+    values = np.asarray(values, dtype=float)
+    year = np.asarray(year, dtype=float)
+    out = np.full(len(values), np.nan)
+    if not len(values):
+        return out
+    
+    order = np.argsort(year, kind='stable')
+    sorted_year = year[order]
+    shifted = np.r_[np.nan, values[order][:-1]]
+    # NaN != NaN, so every NaN year starts its own run and stays NaN
+    shifted[np.r_[True, sorted_year[1:] != sorted_year[:-1]]] = np.nan
+    out[order] = shifted
+    return out
+
+
 class CardProcessor:
     """
     Processes credit card CSV files and calculates bonus nights.
@@ -20,6 +128,18 @@ class CardProcessor:
         self.base_path = Path(base_path)
         self.personal_df = None
         self.business_df = None
+        # (folder signature, processed DataFrame) from the last successful load
+        self._personal_cache = None
+        self._business_cache = None
+        # Bumped whenever transactions are reprocessed so callers can cache summaries
+        self.version = 0
+        # process_all updates both cards from worker threads
+        self._version_lock = threading.Lock()
+    
+    def _bump_version(self):
+        """Record that personal_df or business_df changed."""
+        with self._version_lock:
+            self.version += 1
     
     def load_csvs_from_folder(self, folder_name):
         """
@@ -40,7 +160,7 @@ class CardProcessor:
         
         for file in folder_path.glob("*.CSV"):
             try:
-                df = pd.read_csv(file)
+                df = pd.read_csv(file, engine=_CSV_ENGINE)
                 df['file'] = str(file)
                 dfs.append(df)
             except Exception as e:
@@ -51,23 +171,48 @@ class CardProcessor:
         
         return pd.concat(dfs, ignore_index=True)
     
+    def _folder_signature(self, folder_name):
+        """
+        Identify the CSV files in a folder by path, modification time and size.
+        
+        Args:
+            folder_name: Name of folder (e.g., 'hyatt personal')
+            
+        Returns:
+            Hashable tuple that changes whenever a CSV is added, removed or rewritten
+        """
+        folder_path = self.base_path / folder_name
+        files = []
+        for file in folder_path.glob("*.CSV"):
+            stat = file.stat()
+            files.append((str(file), stat.st_mtime_ns, stat.st_size))
+        return (str(folder_path), tuple(sorted(files)))
+    
     def remove_duplicates(self, df):
         """
         Remove duplicates across files.
-        Keep duplicate if it appears in multiple files; otherwise remove it.
+        Overlapping statement exports repeat the same transactions, so a
+        transaction is kept as many times as it appears in any single file:
+        identical purchases within one file are all kept, while copies of them
+        in other files are dropped.
+        
+        The free-text Memo column is dropped first: it is empty in card
+        exports, isn't used downstream, and as an object column it would push
+        the duplicate hashing onto pandas' slow path.
         
         Args:
             df: DataFrame with 'file' column
             
         Returns:
-            Deduplicated DataFrame
+            Deduplicated DataFrame without the 'file' and 'Memo' columns
         """
         if df.empty:
             return df
         
+        df = df.drop(columns=['Memo'], errors='ignore')
         group_cols = [
             'Transaction Date', 'Post Date', 'Description', 
-            'Category', 'Type', 'Amount', 'Memo'
+            'Category', 'Type', 'Amount'
         ]
         # Only group on columns that exist
         group_cols = [col for col in group_cols if col in df.columns]
@@ -75,40 +220,32 @@ class CardProcessor:
         if not group_cols:
             return df
         
-        df_grouped = df.groupby(group_cols, dropna=False).agg({
-            'file': lambda x: list(x)
-        }).reset_index()
-        
-        # Mark true duplicates (appear in multiple files)
-        df_grouped['true_duplicate'] = df_grouped['file'].apply(
-            lambda files: len(files) > 1 and len(set(files)) > 1
+        # Number each copy of a transaction within its file (0, 1, ...); the
+        # n-th copy from every file is the same transaction, so keep the first
+        file_cols = ['file'] if 'file' in df.columns else []
+        occurrence = df.groupby(group_cols + file_cols, dropna=False, sort=False).cumcount()
+        deduped = df.assign(_occurrence=occurrence).drop_duplicates(
+            subset=group_cols + ['_occurrence'], keep='first'
         )
         
-        # Expand back to original structure, keeping first occurrence of duplicates
-        result = []
-        for idx, row in df_grouped.iterrows():
-            num_files = len(row['file'])
-            if not row['true_duplicate']:
-                # Not a true duplicate, keep all instances
-                for _ in range(num_files):
-                    result.append(row.drop('file'))
-            else:
-                # True duplicate, keep only first
-                result.append(row.drop('file'))
-        
-        result_df = pd.concat([df.drop('file', axis=1)[
-            [col for col in df.columns if col != 'file']
-        ]] if result else [pd.DataFrame()], ignore_index=True)
-        
-        return result_df
+        return deduped.drop(columns=['_occurrence'] + file_cols).reset_index(drop=True)
     
     def process_personal_card(self):
         """
         Load and process personal card data with bonus night calculations.
+        Reuses the last result while the folder's CSV files are unchanged.
         
         Returns:
             DataFrame with processed personal card data
         """
+        signature = self._folder_signature("transactions/hyatt personal")
+        if self._personal_cache is not None and self._personal_cache[0] == signature:
+            cached_df = self._personal_cache[1]
+            if self.personal_df is not cached_df:
+                self.personal_df = cached_df
+                self._bump_version()
+            return cached_df
+        
         df = self.load_csvs_from_folder("transactions/hyatt personal")
         
         if df.empty:
@@ -132,31 +269,32 @@ class CardProcessor:
         # Negate amounts (they're negative in CSV)
         df['Amount'] = -df['Amount']
         
-        # Calculate cumulative spending
+        # Calculate cumulative spending and bonus nights based on $5,000 thresholds
         df = df.sort_values('Transaction Date')
-        df['cumsum'] = df['Amount'].cumsum()
-        
-        # Calculate year-to-date cumulative
-        df['cumsum_year'] = df.groupby('year')['Amount'].cumsum()
-        
-        # Calculate bonus nights based on $5,000 thresholds
-        df['previous_cumsum'] = df['cumsum'].shift(1)
-        df['nights'] = df.apply(
-            self._calculate_personal_bonus,
-            axis=1
-        )
+        self._prepare_bonus_columns(df, 'personal')
         
         self.personal_df = df
+        self._personal_cache = (signature, df)
+        self._bump_version()
         return df
     
     def process_business_card(self):
         """
         Load and process business card data with bonus night calculations.
         Business card resets annual counter by year.
+        Reuses the last result while the folder's CSV files are unchanged.
         
         Returns:
             DataFrame with processed business card data
         """
+        signature = self._folder_signature("transactions/hyatt business")
+        if self._business_cache is not None and self._business_cache[0] == signature:
+            cached_df = self._business_cache[1]
+            if self.business_df is not cached_df:
+                self.business_df = cached_df
+                self._bump_version()
+            return cached_df
+        
         df = self.load_csvs_from_folder("transactions/hyatt business")
         
         if df.empty:
@@ -180,19 +318,61 @@ class CardProcessor:
         # Negate amounts (they're negative in CSV)
         df['Amount'] = -df['Amount']
         
-        # Calculate year-to-date cumulative (resets by year)
-        df['cumsum_year'] = df.groupby('year')['Amount'].cumsum()
-        df['previous_cumsum_year'] = df.groupby('year')['cumsum_year'].shift(1)
-        
-        # Calculate bonus nights based on $10,000 thresholds per year
-        df['nights'] = df.apply(
-            self._calculate_business_bonus,
-            axis=1
-        )
+        # Calculate year-to-date cumulative (resets by year) and bonus nights
+        # based on $10,000 thresholds per year
+        self._prepare_bonus_columns(df, 'business')
         
         self.business_df = df
+        self._business_cache = (signature, df)
+        self._bump_version()
         return df
     
+    def process_all(self):
+        """
+        Process the personal and business cards concurrently.
+        The two folders are independent, and pandas releases the GIL while
+        parsing CSVs and running its array kernels.
+        
+        Returns:
+            Tuple of (personal DataFrame, business DataFrame)
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            personal = executor.submit(self.process_personal_card)
+            business = executor.submit(self.process_business_card)
+            return personal.result(), business.result()
+    
+    @staticmethod
+    def _prepare_bonus_columns(df, kind):
+        """
+        Add the running totals and bonus nights for a card's transactions.
+        
+        Personal cards get 'cumsum', 'cumsum_year', 'previous_cumsum' and
+        'nights'; business cards get 'cumsum_year', 'previous_cumsum_year'
+        and 'nights'. Everything is computed from the Amount and year arrays
+        and then assigned to df in place.
+        
+        Args:
+            df: DataFrame sorted by transaction date, with positive 'Amount'
+                and a 'year' column
+            kind: 'personal' or 'business'
+        """
+        amount = df['Amount'].to_numpy(dtype=float)
+        year = df['year'].to_numpy()
+        columns = {'cumsum_year': _yearly_cumsum(amount, year)}
+        
+        if kind == 'personal':
+            # Like Series.cumsum: missing amounts are skipped, not propagated
+            cumsum = np.nancumsum(amount)
+            cumsum[np.isnan(amount)] = np.nan
+            columns = {'cumsum': cumsum, **columns, 'previous_cumsum': _shift1(cumsum)}
+            columns['nights'] = CardProcessor._calculate_personal_bonus_vec(columns)
+        else:
+            columns['previous_cumsum_year'] = _group_shift1(columns['cumsum_year'], year)
+            columns['nights'] = CardProcessor._calculate_business_bonus_vec(columns)
+        
+        for name, values in columns.items():
+            df[name] = values
+    
     @staticmethod
     def _calculate_personal_bonus(row):
         """
@@ -211,16 +391,11 @@ class CardProcessor:
             if tiers_crossed == 1:
                 return 2 if current_tier == 1 else 2 * tiers_crossed
             # For multi-tier crosses, use max nights for highest tier
-            nights_map = {1: 2, 2: 4, 3: 6, 4: 8, 5: 10, 
-                         6: 12, 7: 14, 8: 16, 9: 18, 10: 20, 11: 22}
-            return nights_map.get(current_tier, 22)
+            return int(_tier_nights(_PERSONAL_NIGHTS_BY_TIER, current_tier))
         
         # Check if we dropped below a tier
         elif current_tier < previous_tier and current_tier > 0:
-            tiers_dropped = previous_tier - current_tier
-            nights_map = {1: 2, 2: 4, 3: 6, 4: 8, 5: 10, 
-                         6: 12, 7: 14, 8: 16, 9: 18, 10: 20, 11: 22}
-            return -nights_map.get(previous_tier, 22)
+            return -int(_tier_nights(_PERSONAL_NIGHTS_BY_TIER, previous_tier))
         
         return None
     
@@ -238,22 +413,84 @@ class CardProcessor:
         
         # Check if we crossed into a new tier
         if current_tier > previous_tier and current_tier > 0:
-            nights_map = {1: 5, 2: 10, 3: 15, 4: 20, 5: 25, 6: 30}
-            return nights_map.get(current_tier, 30)
+            return int(_tier_nights(_BUSINESS_NIGHTS_BY_TIER, current_tier))
         
         # Check if we dropped below a tier
         elif current_tier < previous_tier and current_tier > 0:
-            nights_map = {1: 5, 2: 10, 3: 15, 4: 20, 5: 25, 6: 30}
-            return -nights_map.get(previous_tier, 30)
+            return -int(_tier_nights(_BUSINESS_NIGHTS_BY_TIER, previous_tier))
         
         return None
     
-    def get_spending_summary(self, card_type='personal'):
+    @staticmethod
+    def _calculate_personal_bonus_vec(df):
+        """
+        Vectorized _calculate_personal_bonus over every row of a DataFrame.
+        
+        Args:
+            df: DataFrame (or dict of arrays) with 'cumsum' and 'previous_cumsum' columns
+            
+        Returns:
+            float ndarray of bonus nights, NaN where no tier changed
+        """
+        # np.trunc matches int() truncation toward zero for negative balances
+        current_tier = np.trunc(np.asarray(df['cumsum'], dtype=float) / 5000)
+        previous_tier = np.trunc(np.nan_to_num(np.asarray(df['previous_cumsum'], dtype=float)) / 5000)
+        
+        crossed_up = (current_tier > previous_tier) & (current_tier > 0)
+        dropped = (current_tier < previous_tier) & (current_tier > 0)
+        # Single tier crossings always give 2 nights; multi-tier jumps use the
+        # highest tier's value
+        up_nights = np.where(
+            current_tier - previous_tier == 1, 2, _tier_nights(_PERSONAL_NIGHTS_BY_TIER, current_tier)
+        )
+        down_nights = -_tier_nights(_PERSONAL_NIGHTS_BY_TIER, previous_tier)
+        
+        return np.select([crossed_up, dropped], [up_nights, down_nights], default=np.nan)
+    
+    @staticmethod
+    def _calculate_business_bonus_vec(df):
+        """
+        Vectorized _calculate_business_bonus over every row of a DataFrame.
+        
+        Args:
+            df: DataFrame (or dict of arrays) with 'cumsum_year' and 'previous_cumsum_year' columns
+            
+        Returns:
+            float ndarray of bonus nights, NaN where no tier changed
+        """
+        current_tier = np.trunc(np.asarray(df['cumsum_year'], dtype=float) / 10000)
+        previous_tier = np.trunc(np.nan_to_num(np.asarray(df['previous_cumsum_year'], dtype=float)) / 10000)
+        
+        crossed_up = (current_tier > previous_tier) & (current_tier > 0)
+        dropped = (current_tier < previous_tier) & (current_tier > 0)
+        up_nights = _tier_nights(_BUSINESS_NIGHTS_BY_TIER, current_tier)
+        down_nights = -_tier_nights(_BUSINESS_NIGHTS_BY_TIER, previous_tier)
+        
+        return np.select([crossed_up, dropped], [up_nights, down_nights], default=np.nan)
+    
+    @staticmethod
+    def _first_row_per_year(df):
+        """
+        Position of the first row for each year, found in one pass.
+        
+        Args:
+            df: DataFrame with a 'year' column
+            
+        Returns:
+            Dictionary mapping year to the positional index of its first row
+        """
+        years = df['year'].to_numpy(dtype=float)
+        valid = np.flatnonzero(~np.isnan(years))
+        unique_years, first = np.unique(years[valid], return_index=True)
+        return {int(year): int(valid[i]) for year, i in zip(unique_years, first)}
+    
+    def get_spending_summary(self, card_type='personal', today=None):
         """
         Get current spending summary for a card.
         
         Args:
             card_type: 'personal' or 'business'
+            today: Date to treat as today (defaults to the current date)
             
         Returns:
             Dictionary with spending summary
@@ -263,40 +500,36 @@ class CardProcessor:
         if df is None or df.empty:
             return {}
         
-        # Get latest row for current spending
-        latest = df.iloc[-1]
-        current_year = pd.Timestamp.now().year
-        current_year_df = df[df['year'] == current_year]
+        # Year-to-date spending is the running total on the last row posted this year
+        current_year = (today or pd.Timestamp.now()).year
+        in_year = np.flatnonzero(df['year'].to_numpy() == current_year)
+        ytd_spending = df['cumsum_year'].iat[in_year[-1]] if len(in_year) else 0
         
         if card_type == 'personal':
-            total_spending = latest['cumsum']
-            ytd_spending = current_year_df['cumsum_year'].iloc[-1] if not current_year_df.empty else 0
+            # Personal tiers are $5,000 of lifetime spending
+            total_spending = df['cumsum'].iat[-1]
             current_tier = int(total_spending / 5000)
             next_tier_threshold = (current_tier + 1) * 5000
-            spend_to_next = next_tier_threshold - total_spending
-            
-            # For $15k annual certificate
-            ytd_to_certificate = 15000 - ytd_spending if ytd_spending < 15000 else 0
             
             return {
                 'total_spending': round(total_spending, 2),
                 'ytd_spending': round(ytd_spending, 2),
                 'current_tier': current_tier,
-                'spend_to_next_bonus': round(max(0, spend_to_next), 2),
-                'spend_to_certificate': round(max(0, ytd_to_certificate), 2),
+                'spend_to_next_bonus': round(max(0, next_tier_threshold - total_spending), 2),
+                # For $15k annual certificate
+                'spend_to_certificate': round(max(0, 15000 - ytd_spending), 2),
                 'current_threshold': round((current_tier) * 5000, 2),
                 'next_threshold': round(next_tier_threshold, 2),
             }
         else:  # business
-            ytd_spending = current_year_df['cumsum_year'].iloc[-1] if not current_year_df.empty else 0
+            # Business tiers are $10,000 of spending in the current year
             current_tier = int(ytd_spending / 10000)
             next_tier_threshold = (current_tier + 1) * 10000
-            spend_to_next = next_tier_threshold - ytd_spending
             
             return {
                 'ytd_spending': round(ytd_spending, 2),
                 'current_tier': current_tier,
-                'spend_to_next_bonus': round(max(0, spend_to_next), 2),
+                'spend_to_next_bonus': round(max(0, next_tier_threshold - ytd_spending), 2),
                 'current_threshold': round((current_tier) * 10000, 2),
                 'next_threshold': round(next_tier_threshold, 2),
             }
@@ -318,22 +551,25 @@ class CardProcessor:
         
         return int(df['nights'].sum())
     
-    def _get_most_recent_post_date(self):
+    def _get_most_recent_post_date(self, today=None):
         """
         Get the statement close date (23rd of month).
         This is typically when transactions post to the account.
         
+        Args:
+            today: Date to treat as today (defaults to the current date)
+            
         Returns:
             datetime for the 23rd of current month or previous month if today <= 2nd
         """
-        today = pd.Timestamp.now()
+        today = pd.Timestamp(today) if today is not None else pd.Timestamp.now()
         if today.day > 2:
             return today.replace(day=23)
         else:
             # If today is on the 1st or 2nd, use last month's 23rd
             return (today - pd.DateOffset(months=1)).replace(day=23)
     
-    def get_yearly_bonus_nights_breakdown(self, card_type='personal'):
+    def get_yearly_bonus_nights_breakdown(self, card_type='personal', today=None):
         """
         Get posted vs. pending bonus nights for the current calendar year.
         Posted: transactions on or before statement close date (23rd of month)
@@ -341,6 +577,7 @@ class CardProcessor:
         
         Args:
             card_type: 'personal' or 'business'
+            today: Date to treat as today (defaults to the current date)
             
         Returns:
             Dictionary with posted, pending, and total for current year
@@ -350,23 +587,27 @@ class CardProcessor:
         if df is None or df.empty:
             return {'posted': 0, 'pending': 0, 'total': 0}
         
-        current_year = pd.Timestamp.now().year
-        recent_post_date = self._get_most_recent_post_date()
+        # Resolve "now" once and reuse it for the year and the statement date
+        today = pd.Timestamp(today) if today is not None else pd.Timestamp.now()
+        current_year = today.year
+        recent_post_date = self._get_most_recent_post_date(today)
         
         # Filter to current year
-        year_df = df[df['year'] == current_year]
+        in_year = df['year'].to_numpy() == current_year
         
-        if year_df.empty:
+        if not in_year.any():
             return {'posted': 0, 'pending': 0, 'total': 0}
         
-        # Posted: on or before statement close date
-        posted_df = year_df[year_df['Post Date'] <= recent_post_date]
-        posted = int(posted_df['nights'].sum(skipna=True))
-        
-        total = int(year_df['nights'].sum(skipna=True))
-        pending = total - posted
+        # Posted: on or before statement close date, compared as int64
+        # nanoseconds (rows without a post date have no year, so no NaT here)
+        nights = df['nights'].to_numpy(dtype=float)[in_year]
+        post_ns = df['Post Date'].to_numpy(dtype='datetime64[ns]').view(np.int64)[in_year]
+        cutoff_ns = np.datetime64(recent_post_date, 'ns').astype(np.int64)
+        is_posted = post_ns <= cutoff_ns
+        posted = int(np.nansum(nights[is_posted]))
+        pending = int(np.nansum(nights[~is_posted]))
         
-        return {'posted': posted, 'pending': pending, 'total': total}
+        return {'posted': posted, 'pending': pending, 'total': posted + pending}
 
 
 if __name__ == "__main__":
@@ -5,10 +5,42 @@ This module provides utilities to parse various period formats used in the
 benefits tracker and sort them chronologically.
 """
 
-from datetime import datetime
-from typing import Tuple, List
+import re
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, Final, Iterable, Iterator, List, Tuple
 
 
+# Period suffix -> the month it sorts by. Monthly suffixes are stored
+# lowercase since they match case-insensitively; quarters and half-years
+# sort by their first month and must be uppercase
+_SUFFIX_TO_MONTH: Final[Dict[str, int]] = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+    'Q1': 1, 'Q2': 4, 'Q3': 7, 'Q4': 10,
+    'H1': 1, 'H2': 7,
+}
+
+# Every year a benefit period can realistically carry, keyed by its digits
+_YEARS: Final[Dict[str, int]] = {str(year): year for year in range(1900, 2100)}
+
+
+def _year4(digits: str) -> int:
+    """Parse a 4-digit ASCII year, looking common years up instead of calling int()"""
+    year = _YEARS.get(digits)
+    return year if year is not None else int(digits)
+
+
+# Anniversary periods end in the renewal month, which may be missing
+# (e.g. "2025-A"); every other format is looked up in _SUFFIX_TO_MONTH
+_ANNIVERSARY_RE: Final = re.compile(
+    r"(?P<year>\d{4})-A(?:[HQ][1-4]-)?(?P<anniversary>\d{1,2})?",
+    re.ASCII,
+)
+
+
+# Benefit lists repeat a small set of period strings, so each is parsed once
+@lru_cache(maxsize=1024)
 def parse_period_for_sorting(period: str) -> Tuple[int, int]:
     """
     Parse period string into sortable tuple (year, month).
@@ -18,6 +50,7 @@ def parse_period_for_sorting(period: str) -> Tuple[int, int]:
     - "2026-Q1" -> (2026, 1)
     - "2025-H2" -> (2025, 7)
     - "2026-A11" -> (2026, 11)
+    - "2026-AH1-11" -> (2026, 11)
     - "2026" -> (2026, 0)
 
     Args:
@@ -36,59 +69,27 @@ def parse_period_for_sorting(period: str) -> Tuple[int, int]:
         >>> parse_period_for_sorting("2025-H2")
         (2025, 7)
     """
-    try:
-        # Handle "2025-May" format
-        if '-' in period:
-            parts = period.split('-')
-            year = int(parts[0])
-
-            # Try parsing month abbreviation first
-            try:
-                date_obj = datetime.strptime(period, "%Y-%b")
-                return (date_obj.year, date_obj.month)
-            except ValueError:
-                pass
-
-            # Handle anniversary format FIRST (before Q/H check)
-            # Examples: A11, AH1-11, AQ1-11
-            if 'A' in parts[1]:
-                # Extract month number from the end of the period string
-                # Examples: "2025-A11" -> 11, "2025-AH1-11" -> 11, "2025-AQ1-11" -> 11
-                month_part = parts[-1] if len(parts) > 2 else parts[1].replace('A', '')
-
-                # Try to extract 2-digit month from the end
-                if len(month_part) >= 2 and month_part[-2:].isdigit():
-                    month = int(month_part[-2:])
-                    return (year, month)
-                # Single digit month
-                elif len(month_part) >= 1 and month_part[-1:].isdigit():
-                    month = int(month_part[-1:])
-                    return (year, month)
-                # Otherwise just use 0
-                return (year, 0)
-
-            # Handle quarters: Q1=Jan, Q2=Apr, Q3=Jul, Q4=Oct
-            if 'Q' in parts[1]:
-                quarter_num = int(parts[1].replace('Q', ''))
-                month = (quarter_num - 1) * 3 + 1
-                return (year, month)
-
-            # Handle half-years: H1=Jan, H2=Jul
-            if 'H' in parts[1]:
-                half_num = int(parts[1].replace('H', ''))
-                month = 1 if half_num == 1 else 7
-                return (year, month)
-
-            # If we get here, format is unrecognized - return invalid
-            return (0, 0)
-        else:
-            # Just year: "2025"
-            return (int(period), 0)
-
-    except (ValueError, IndexError):
+    # Plain years, "2025-Jan", "2025-Q1" and "2025-H1" are fixed width: one
+    # table lookup on the suffix
+    if period.isascii() and period[:4].isdigit():
+        length = len(period)
+        if length == 4:
+            return (_year4(period), 0)
+        if period[4:5] == '-' and (length == 7 or length == 8):
+            suffix = period[5:]
+            month_num = _SUFFIX_TO_MONTH.get(suffix.lower() if length == 8 else suffix)
+            if month_num is not None:
+                return (_year4(period[:4]), month_num)
+
+    match = _ANNIVERSARY_RE.fullmatch(period)
+    if match is None:
         # Fallback: sort invalid periods to the end
         return (0, 0)
 
+    # Anniversary periods sort by renewal month, or span the year without one
+    anniversary = match['anniversary']
+    return (_year4(match['year']), int(anniversary) if anniversary is not None else 0)
+
 
 def sort_benefits_by_period(benefits: List[dict]) -> List[dict]:
     """
@@ -110,4 +111,51 @@ def sort_benefits_by_period(benefits: List[dict]) -> List[dict]:
         >>> [b['period'] for b in sorted_benefits]
         ['2025-Jan', '2025-Jun', '2025-Dec']
     """
-    return sorted(benefits, key=lambda x: parse_period_for_sorting(x['period']))
+    # Decorate each benefit with its key once; the index keeps ties in their
+    # original order without ever comparing the benefit dicts themselves
+    decorated = [
+        (parse_period_for_sorting(benefit['period']), i, benefit)
+        for i, benefit in enumerate(benefits)
+    ]
+    decorated.sort()
+    return [benefit for _, _, benefit in decorated]
+
+
+class SortedBenefits:
+    """
+    A list of benefits kept in period order as benefits are added.
+
+    Each add() is a binary search over the stored sort keys, so building the
+    list one benefit at a time avoids re-sorting it after every insert. The
+    order matches sort_benefits_by_period: ties keep the order they were added.
+
+    Examples:
+        >>> benefits = SortedBenefits([{'period': '2025-Dec'}])
+        >>> benefits.add({'period': '2025-Jan'})
+        >>> [b['period'] for b in benefits]
+        ['2025-Jan', '2025-Dec']
+    """
+
+    def __init__(self, benefits: Iterable[dict] = ()):
+        """
+        Args:
+            benefits: Initial benefit dicts with 'period' key, in any order
+        """
+        self._benefits = sort_benefits_by_period(list(benefits))
+        self._keys = [parse_period_for_sorting(benefit['period']) for benefit in self._benefits]
+
+    def add(self, benefit: dict):
+        """Insert a benefit after any others with the same period key."""
+        key = parse_period_for_sorting(benefit['period'])
+        i = bisect_right(self._keys, key)
+        self._keys.insert(i, key)
+        self._benefits.insert(i, benefit)
+
+    def __len__(self) -> int:
+        return len(self._benefits)
+
+    def __iter__(self) -> Iterator[dict]:
+        return iter(self._benefits)
+
+    def __getitem__(self, index):
+        return self._benefits[index]
@@ -6,10 +6,23 @@ and reusability across different interfaces.
 """
 
 from datetime import date
-from typing import Dict, List
+from typing import Dict, List, NamedTuple
 import pandas as pd
 
 
+class NightsSummary(NamedTuple):
+    """Nights totals returned by HyattSummaryService.calculate_nights_summary."""
+    cc_yearly_start: int
+    cc_nights_posted: int
+    cc_nights_pending: int
+    current_nights: int
+    upcoming_nights: int
+    goh_nights: int
+    goh_nights_upcoming: int
+    nights_posted: int
+    nights_total: int
+
+
 class HyattSummaryService:
     """
     Aggregates data from CardProcessor, BenefitsCalculator, and StaysManager.
@@ -30,7 +43,7 @@ class HyattSummaryService:
         self.stays_manager = stays_manager
         self.cc_yearly_start = 5  # Annual credit card bonus nights
 
-    def calculate_nights_summary(self, reference_date: date = None) -> Dict:
+    def calculate_nights_summary(self, reference_date: date = None) -> NightsSummary:
         """
         Calculate comprehensive nights summary from all sources.
 
@@ -44,7 +57,7 @@ class HyattSummaryService:
             reference_date: Date to use as "today" (defaults to actual today)
 
         Returns:
-            Dictionary with keys:
+            NightsSummary with fields:
             - cc_yearly_start: Annual CC bonus (int)
             - cc_nights_posted: CC nights that have posted (int)
             - cc_nights_pending: CC nights pending post (int)
@@ -58,9 +71,13 @@ class HyattSummaryService:
         if reference_date is None:
             reference_date = pd.Timestamp.now().date()
 
-        # Get CC bonus nights breakdown
-        personal_breakdown = self.card_processor.get_yearly_bonus_nights_breakdown('personal')
-        business_breakdown = self.card_processor.get_yearly_bonus_nights_breakdown('business')
+        # Get CC bonus nights breakdown for the same "today"
+        personal_breakdown = self.card_processor.get_yearly_bonus_nights_breakdown(
+            'personal', today=reference_date
+        )
+        business_breakdown = self.card_processor.get_yearly_bonus_nights_breakdown(
+            'business', today=reference_date
+        )
 
         cc_nights_posted = personal_breakdown['posted'] + business_breakdown['posted']
         cc_nights_pending = personal_breakdown['pending'] + business_breakdown['pending']
@@ -106,17 +123,17 @@ class HyattSummaryService:
             upcoming_nights
         )
 
-        return {
-            'cc_yearly_start': self.cc_yearly_start,
-            'cc_nights_posted': cc_nights_posted,
-            'cc_nights_pending': cc_nights_pending,
-            'current_nights': current_nights,
-            'upcoming_nights': upcoming_nights,
-            'goh_nights': goh_nights,
-            'goh_nights_upcoming': goh_nights_upcoming,
-            'nights_posted': nights_posted,
-            'nights_total': nights_total,
-        }
+        return NightsSummary(
+            cc_yearly_start=self.cc_yearly_start,
+            cc_nights_posted=cc_nights_posted,
+            cc_nights_pending=cc_nights_pending,
+            current_nights=current_nights,
+            upcoming_nights=upcoming_nights,
+            goh_nights=goh_nights,
+            goh_nights_upcoming=goh_nights_upcoming,
+            nights_posted=nights_posted,
+            nights_total=nights_total,
+        )
 
     def get_filtered_benefits_for_year(
         self,
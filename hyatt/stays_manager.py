@@ -1,16 +1,65 @@
 import json
+import os
+from contextlib import contextmanager
 from datetime import date
 from pathlib import Path
-from typing import Dict, List
+from typing import ClassVar, Dict, Iterable, List, Tuple
+import numpy as np
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:  # optional speedup; the standard library codec works the same
+    orjson = None
+
+# The log is only folded back into the snapshot once it is this long and at
+# least twice the number of records the snapshot held
+_COMPACT_MIN_ENTRIES = 64
+
+
+def _dumps_state(state: Dict) -> bytes:
+    """Serialize the stays snapshot as indented JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(state, option=orjson.OPT_INDENT_2)
+    return json.dumps(state, indent=2).encode()
+
+
+def _dumps_entry(entry: Dict) -> bytes:
+    """Serialize one log entry as a single JSON line."""
+    if orjson is not None:
+        return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(entry).encode() + b'\n'
+
+
+_loads_state = orjson.loads if orjson is not None else json.loads
+
+
+def _copy_state(state: Dict) -> Dict:
+    """Copy stays state down to the record dicts, which are flat."""
+    copied = dict(state)
+    for key in ("stays", "goh_nights"):
+        copied[key] = [dict(record) for record in state[key]]
+    return copied
+
 
 class StaysManager:
     """
     Manages persistent storage of hotel stays and guest-of-honor (GOH) nights.
-    Stores data in JSON format, mirroring the benefits_calculator pattern.
+
+    The state lives in a JSON snapshot, mirroring the benefits_calculator
+    pattern, plus an append-only JSON Lines log next to it
+    (``stays_state.json.log``). Each add or delete appends one line to the
+    log; loading replays the log over the snapshot, and the log is folded
+    back into the snapshot once it outgrows it. Log entries carry a sequence
+    number and the snapshot records the last one it includes, so replaying a
+    log the snapshot already covers is harmless. Mutations made inside
+    ``batch()`` are written together when the block ends.
     """
 
+    # Resolved snapshot path -> ((mtime_ns, size), state), shared by every
+    # manager so re-creating one for an unchanged snapshot skips the parse
+    _snapshot_cache: ClassVar[Dict[str, Tuple[Tuple[int, int], Dict]]] = {}
+
     def __init__(self, state_path="stays_state.json"):
         """
         Initialize the stays manager.
@@ -19,29 +68,175 @@ class StaysManager:
             state_path: Path to stays_state.json
         """
         self.state_path = Path(state_path)
+        self.log_path = self.state_path.with_name(self.state_path.name + '.log')
+        self._cache_key = str(self.state_path.resolve())
         self.state = self._load_state()
+        # Sequence number of the last logged operation reflected in self.state
+        self._log_seq = self.state.pop("log_seq", 0)
+        self._snapshot_size = self._record_count()
+        self._log_entries = self._replay_log()
+        # Serialized log lines not yet on disk, and how many batch() blocks are open
+        self._pending: List[bytes] = []
+        self._batch_depth = 0
+        # Bumped on every mutation so callers can cache derived summaries
+        self.version = 0
+        # Columnar views of the state, rebuilt lazily after a mutation: parallel
+        # lists of names and parsed dates, and the DataFrames built from them
+        self._stay_columns = None
+        self._goh_columns = None
+        self._stays_df = None
+        self._goh_df = None
+        # Stored ISO date string -> date, shared by get_stays/get_goh_nights
+        self._date_cache: Dict[str, date] = {}
 
     def _load_state(self) -> Dict:
-        """Load stays state from JSON."""
-        if not self.state_path.exists():
+        """Load stays state from JSON, reusing the last parse of an unchanged snapshot."""
+        try:
+            signature = self._snapshot_signature()
+        except OSError:
             return {"stays": [], "goh_nights": []}
 
+        cached = self._snapshot_cache.get(self._cache_key)
+        if cached is not None and cached[0] == signature:
+            return _copy_state(cached[1])
+
         try:
-            with open(self.state_path, 'r') as f:
-                content = json.load(f)
-                # Ensure both keys exist
-                if "stays" not in content:
-                    content["stays"] = []
-                if "goh_nights" not in content:
-                    content["goh_nights"] = []
-                return content
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            content = _loads_state(self.state_path.read_bytes())
         except (json.JSONDecodeError, IOError):
             return {"stays": [], "goh_nights": []}
 
+        # Ensure both keys exist
+        if "stays" not in content:
+            content["stays"] = []
+        if "goh_nights" not in content:
+            content["goh_nights"] = []
+        self._snapshot_cache[self._cache_key] = (signature, _copy_state(content))
+        return content
+
+    def _snapshot_signature(self) -> Tuple[int, int]:
+        """Return the snapshot's (mtime_ns, size), which changes whenever it is rewritten."""
+        stat = self.state_path.stat()
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _record_count(self) -> int:
+        """Return the number of stays and GOH nights held in memory."""
+        return len(self.state["stays"]) + len(self.state["goh_nights"])
+
+    def _replay_log(self) -> int:
+        """
+        Apply the operations in the log that the loaded snapshot does not include.
+
+        Replay stops at the first unreadable line, which can only be a write
+        that was cut short. The log is truncated there so later appends start
+        on a fresh line instead of being glued onto the torn one.
+
+        Returns:
+            Number of readable entries left in the log
+        """
+        if not self.log_path.exists():
+            return 0
+
+        entries = 0
+        good_bytes = 0
+        with open(self.log_path, 'r+b') as f:
+            for line in f:
+                try:
+                    # A line missing its newline was cut short, even if it parses
+                    if not line.endswith(b'\n'):
+                        raise ValueError("incomplete log line")
+                    entry = _loads_state(line)
+                    seq = entry["seq"]
+                    if seq > self._log_seq:
+                        self._apply(entry)
+                        self._log_seq = seq
+                # json.JSONDecodeError and orjson.JSONDecodeError are ValueErrors
+                except (ValueError, KeyError, TypeError):
+                    f.truncate(good_bytes)
+                    break
+                entries += 1
+                good_bytes += len(line)
+        return entries
+
+    def _apply(self, entry: Dict):
+        """Apply one logged operation to the in-memory state."""
+        op = entry["op"]
+        if op == "add_stay":
+            self.state["stays"].append(entry["stay"])
+        elif op == "add_goh_night":
+            self.state["goh_nights"].append(entry["goh"])
+        elif op in ("delete_stays", "delete_goh_nights"):
+            key = "stays" if op == "delete_stays" else "goh_nights"
+            targets = set(entry["indices"])
+            self.state[key] = [item for i, item in enumerate(self.state[key]) if i not in targets]
+        else:
+            raise KeyError(op)
+
+    def _append_log(self, entry: Dict):
+        """Queue one operation for the log, writing it now unless a batch is open."""
+        self._log_seq += 1
+        self._pending.append(_dumps_entry(dict(entry, seq=self._log_seq)))
+        if not self._batch_depth:
+            self.flush()
+
+    def flush(self):
+        """Append any queued operations to the log, compacting once the log outgrows the snapshot."""
+        if not self._pending:
+            return
+
+        # Append mode opens with O_APPEND, so the lines land whole at the end
+        with open(self.log_path, 'ab') as f:
+            f.write(b''.join(self._pending))
+        self._log_entries += len(self._pending)
+        self._pending = []
+        if self._log_entries > max(_COMPACT_MIN_ENTRIES, 2 * self._snapshot_size):
+            self.save_state()
+
+    @contextmanager
+    def batch(self):
+        """
+        Collect the log writes of several mutations into one write.
+
+        The in-memory state updates immediately; the log is written when the
+        outermost batch ends, even if it ends with an exception.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
+
     def save_state(self):
-        """Save stays state to JSON."""
-        with open(self.state_path, 'w') as f:
-            json.dump(self.state, f, indent=2)
+        """Save the full stays state to JSON and clear the log it now includes."""
+        snapshot = dict(self.state, log_seq=self._log_seq)
+        # Write beside the snapshot and swap it in, so a crash mid-write
+        # leaves the previous snapshot intact
+        tmp_path = self.state_path.with_name(self.state_path.name + '.tmp')
+        tmp_path.write_bytes(_dumps_state(snapshot))
+        os.replace(tmp_path, self.state_path)
+        self._snapshot_cache[self._cache_key] = (self._snapshot_signature(), _copy_state(snapshot))
+        # A crash before this unlink is safe: log_seq makes replay skip these entries
+        self.log_path.unlink(missing_ok=True)
+        self._pending = []
+        self._snapshot_size = self._record_count()
+        self._log_entries = 0
+
+    def _to_date(self, value: str) -> date:
+        """Convert a stored date string to a date, parsing each distinct string once."""
+        parsed = self._date_cache.get(value)
+        if parsed is None:
+            parsed = self._date_cache[value] = pd.Timestamp(value).date()
+        return parsed
+
+    def _mark_changed(self):
+        """Bump the version and drop the cached columnar views after a mutation."""
+        self.version += 1
+        self._stay_columns = None
+        self._goh_columns = None
+        self._stays_df = None
+        self._goh_df = None
 
     def add_stay(self, name: str, check_in: date, check_out: date) -> bool:
         """
@@ -64,7 +259,8 @@ class StaysManager:
             "check_out": check_out.isoformat() if isinstance(check_out, date) else str(check_out),
         }
         self.state["stays"].append(stay)
-        self.save_state()
+        self._append_log({"op": "add_stay", "stay": stay})
+        self._mark_changed()
         return True
 
     def delete_stay(self, index: int) -> bool:
@@ -79,10 +275,35 @@ class StaysManager:
         """
         if 0 <= index < len(self.state["stays"]):
             self.state["stays"].pop(index)
-            self.save_state()
+            self._append_log({"op": "delete_stays", "indices": [index]})
+            self._mark_changed()
             return True
         return False
 
+    def delete_stays(self, indices: Iterable[int]) -> int:
+        """
+        Delete several stays by index with a single log entry.
+
+        Args:
+            indices: Indices of stays to delete; out-of-range entries are ignored
+
+        Returns:
+            Number of stays deleted
+        """
+        existing = self.state["stays"]
+        targets = {int(i) for i in indices if 0 <= int(i) < len(existing)}
+        if not targets:
+            return 0
+
+        self.state["stays"] = [item for i, item in enumerate(existing) if i not in targets]
+        self._append_log({"op": "delete_stays", "indices": sorted(targets)})
+        self._mark_changed()
+        return len(targets)
+
+    def has_stays(self) -> bool:
+        """Return True if at least one stay is stored."""
+        return bool(self.state["stays"])
+
     def get_stays(self) -> List[Dict]:
         """
         Get all stays with dates converted to date objects.
@@ -90,14 +311,47 @@ class StaysManager:
         Returns:
             List of stay dicts with check_in/check_out as date objects
         """
-        stays = []
-        for stay in self.state["stays"]:
-            stays.append({
-                "name": stay["name"],
-                "check_in": pd.Timestamp(stay["check_in"]).date(),
-                "check_out": pd.Timestamp(stay["check_out"]).date(),
+        names, check_ins, check_outs = self._get_stay_columns()
+        return [
+            {"name": name, "check_in": check_in, "check_out": check_out}
+            for name, check_in, check_out in zip(names, check_ins, check_outs)
+        ]
+
+    def _get_stay_columns(self) -> Tuple[List[str], List[date], List[date]]:
+        """Return parallel name, check-in and check-out lists, cached until the next mutation."""
+        if self._stay_columns is None:
+            to_date = self._to_date
+            stays = self.state["stays"]
+            self._stay_columns = (
+                [stay["name"] for stay in stays],
+                [to_date(stay["check_in"]) for stay in stays],
+                [to_date(stay["check_out"]) for stay in stays],
+            )
+        return self._stay_columns
+
+    def get_stays_df(self) -> pd.DataFrame:
+        """
+        Get all stays as a DataFrame, cached until the next mutation.
+
+        The returned frame is shared between calls, so callers should derive
+        new columns with ``assign`` rather than modifying it in place.
+
+        Returns:
+            DataFrame with name, check_in, check_out and nights columns, where
+            the dates are datetime64 values and nights is an integer count
+        """
+        if self._stays_df is None:
+            stays = self.state["stays"]
+            check_in = pd.to_datetime([stay["check_in"] for stay in stays])
+            check_out = pd.to_datetime([stay["check_out"] for stay in stays])
+            self._stays_df = pd.DataFrame({
+                "name": self._get_stay_columns()[0],
+                "check_in": check_in,
+                "check_out": check_out,
+                # One array subtraction for every stay's length
+                "nights": (check_out.values - check_in.values) // np.timedelta64(1, 'D'),
             })
-        return stays
+        return self._stays_df
 
     def add_goh_night(self, name: str, goh_date: date) -> bool:
         """
@@ -118,7 +372,8 @@ class StaysManager:
             "date": goh_date.isoformat() if isinstance(goh_date, date) else str(goh_date),
         }
         self.state["goh_nights"].append(goh)
-        self.save_state()
+        self._append_log({"op": "add_goh_night", "goh": goh})
+        self._mark_changed()
         return True
 
     def delete_goh_night(self, index: int) -> bool:
@@ -133,10 +388,35 @@ class StaysManager:
         """
         if 0 <= index < len(self.state["goh_nights"]):
             self.state["goh_nights"].pop(index)
-            self.save_state()
+            self._append_log({"op": "delete_goh_nights", "indices": [index]})
+            self._mark_changed()
             return True
         return False
 
+    def delete_goh_nights(self, indices: Iterable[int]) -> int:
+        """
+        Delete several GOH nights by index with a single log entry.
+
+        Args:
+            indices: Indices of GOH nights to delete; out-of-range entries are ignored
+
+        Returns:
+            Number of GOH nights deleted
+        """
+        existing = self.state["goh_nights"]
+        targets = {int(i) for i in indices if 0 <= int(i) < len(existing)}
+        if not targets:
+            return 0
+
+        self.state["goh_nights"] = [item for i, item in enumerate(existing) if i not in targets]
+        self._append_log({"op": "delete_goh_nights", "indices": sorted(targets)})
+        self._mark_changed()
+        return len(targets)
+
+    def has_goh(self) -> bool:
+        """Return True if at least one GOH night is stored."""
+        return bool(self.state["goh_nights"])
+
     def get_goh_nights(self) -> List[Dict]:
         """
         Get all GOH nights with dates converted to date objects.
@@ -144,10 +424,34 @@ class StaysManager:
         Returns:
             List of GOH night dicts with date as date object
         """
-        goh_nights = []
-        for goh in self.state["goh_nights"]:
-            goh_nights.append({
-                "name": goh["name"],
-                "date": pd.Timestamp(goh["date"]).date(),
+        names, dates = self._get_goh_columns()
+        return [{"name": name, "date": goh_date} for name, goh_date in zip(names, dates)]
+
+    def _get_goh_columns(self) -> Tuple[List[str], List[date]]:
+        """Return parallel name and date lists, cached until the next mutation."""
+        if self._goh_columns is None:
+            to_date = self._to_date
+            goh_nights = self.state["goh_nights"]
+            self._goh_columns = (
+                [goh["name"] for goh in goh_nights],
+                [to_date(goh["date"]) for goh in goh_nights],
+            )
+        return self._goh_columns
+
+    def get_goh_df(self) -> pd.DataFrame:
+        """
+        Get all GOH nights as a DataFrame, cached until the next mutation.
+
+        The returned frame is shared between calls, so callers should derive
+        new columns with ``assign`` rather than modifying it in place.
+
+        Returns:
+            DataFrame with name and date columns, where date is datetime64
+        """
+        if self._goh_df is None:
+            goh_nights = self.state["goh_nights"]
+            self._goh_df = pd.DataFrame({
+                "name": self._get_goh_columns()[0],
+                "date": pd.to_datetime([goh["date"] for goh in goh_nights]),
             })
-        return goh_nights
+        return self._goh_df
@@ -1,270 +1,390 @@
 """Hyatt Nights page for tracking stays and nights."""
 import streamlit as st
 import pandas as pd
+import numpy as np
+from datetime import date
+from functools import lru_cache
+
+
+@lru_cache(maxsize=512)
+def _fmt_money(value: float) -> str:
+    """Format a dollar amount; memoized since values repeat across reruns."""
+    return f"${value:,.2f}"
+
+
+# Read-only aggregations are cached on the stays/transaction version counters,
+# so reruns triggered by unrelated widgets reduce to a cache lookup. Leading
+# underscores tell st.cache_data not to hash the service objects.
+@st.cache_data(show_spinner=False)
+def _cached_nights_summary(_summary_service, stays_version, tx_version, reference_date):
+    return _summary_service.calculate_nights_summary(reference_date)
+
+
+@st.cache_data(show_spinner=False)
+def _cached_spending_summary(_processor, card_type, tx_version, reference_date):
+    return _processor.get_spending_summary(card_type, today=reference_date)
+
+
+@st.cache_data(show_spinner=False)
+def _cached_bonus_breakdown(_processor, card_type, tx_version, reference_date):
+    return _processor.get_yearly_bonus_nights_breakdown(card_type, today=reference_date)
+
 
 def run():
     """Render the Hyatt Nights page."""
     st.title("🏨 Hyatt Nights")
-    st.markdown("Track your Hyatt nights, bonus night earnings, and elite status nights.")
+    # Intro text and page CSS share one markdown element
+    st.markdown(
+        """
+        <style>
+        /* Make the add-form submit buttons fill their column */
+        button[data-testid="stBaseButton-secondaryFormSubmit"] {
+            width: 100%;
+        }
+        </style>
+
+        Track your Hyatt nights, bonus night earnings, and elite status nights.
+        """,
+        unsafe_allow_html=True
+    )
     
     # ========================================================================
     # OVERALL / ELITE NIGHTS SECTION
     # ========================================================================
     st.subheader("Summary")
 
+    # Evaluate "today" once and pass it to every calculation on the page, so
+    # the cached summaries share one key for the whole render
+    today = date.today()
+
     # Get all calculated data from service
     summary_service = st.session_state.summary_service
-    nights_summary = summary_service.calculate_nights_summary()
-
-    cc_nights_pending_col, upcoming_nights_col, goh_upcoming_col = st.columns(3)
-    cc_nights_posted_col, current_nights_col, goh_posted_col = st.columns(3)
-    cc_yearly_col, nights_posted_col, nights_total_col = st.columns(3)
-
-    with cc_yearly_col:
-        st.metric("CC Yearly Start", nights_summary['cc_yearly_start'])
-    with cc_nights_posted_col:
-        st.metric("CC Nights (posted)", nights_summary['cc_nights_posted'])
-    with cc_nights_pending_col:
-        st.metric("CC Nights (pending)", nights_summary['cc_nights_pending'])
-
-    with upcoming_nights_col:
-        st.metric("Nights (upcoming)", nights_summary['upcoming_nights'])
-    with current_nights_col:
-        st.metric("Nights (posted)", nights_summary['current_nights'])
-    with goh_upcoming_col:
-        st.metric("GOH (upcoming)", nights_summary['goh_nights_upcoming'])
-    with goh_posted_col:
-        st.metric("GOH (posted)", nights_summary['goh_nights'])
-
-    with nights_posted_col:
-        st.metric("Nights Posted", nights_summary['nights_posted'])
-    with nights_total_col:
-        st.metric("Nights Total", nights_summary['nights_total'])
-        
+    stays_manager = st.session_state.stays_manager
+    processor = st.session_state.processor
+
+    _summary_fragment(summary_service, stays_manager, processor, today)
+
     # Edit Elite Nights - Stays
-    with st.expander("✏️ Stays (Current & Upcoming)"):
-        st.markdown("**Add a new stay:**")
-        add_col1, add_col2, add_col3, add_col4 = st.columns([2, 2, 2, 1])
-        
-        stays_manager = st.session_state.stays_manager
-        
-        with add_col1:
-            stay_name = st.text_input("Hotel/Location", key="stay_name_input")
-        with add_col2:
-            check_in = st.date_input("Check-in", key="stay_checkin_input")
-        with add_col3:
-            check_out = st.date_input("Check-out", key="stay_checkout_input")
-        with add_col4:
-            if st.button("➕ Add Stay", width='stretch'):
-                if stay_name and check_in and check_out and check_out > check_in:
-                    if stays_manager.add_stay(stay_name, check_in, check_out):
-                        st.success(f"Added {stay_name}")
-                        st.rerun()
-                    else:
-                        st.error("Failed to add stay")
-                else:
-                    st.error("Please fill all fields and ensure check-out is after check-in")
-        
-        st.markdown("**Current and upcoming stays:**")
-        
-        stays = stays_manager.get_stays()
-        if stays:
-            for idx, stay in enumerate(stays):
-                col1, col2, col3, col4, col5 = st.columns([2, 2, 2, 1, 1])
-                nights = (stay['check_out'] - stay['check_in']).days
-                is_past = stay['check_out'] <= pd.Timestamp.now().date()
-                
-                with col1:
-                    st.write(f"**{stay['name']}**")
-                with col2:
-                    st.write(f"{stay['check_in']} → {stay['check_out']}")
-                with col3:
-                    status = "✅ Completed" if is_past else "⏳ Upcoming"
-                    st.write(f"{nights} nights {status}")
-                with col4:
-                    if st.button("✏️", key=f"edit_stay_{idx}", width='stretch'):
-                        st.session_state.editing_stay = idx
-                with col5:
-                    if st.button("🗑️", key=f"delete_stay_{idx}", width='stretch'):
-                        stays_manager.delete_stay(idx)
-                        st.rerun()
-        else:
-            st.info("No stays added yet")
-        
+    _stays_fragment(stays_manager, today)
+
     # Edit Elite Nights - GOH
-    with st.expander("✏️ GOH Nights"):
-        st.markdown("**Add a new GOH night:**")
-        goh_col1, goh_col2, goh_col3 = st.columns([2, 2, 1])
-        
-        with goh_col1:
-            goh_name = st.text_input("Guest Name / Description", key="goh_name_input")
-        with goh_col2:
-            goh_date = st.date_input("Date", key="goh_date_input")
-        with goh_col3:
-            if st.button("➕ Add GOH", width='stretch'):
-                if goh_name and goh_date:
-                    if stays_manager.add_goh_night(goh_name, goh_date):
-                        st.success(f"Added {goh_name}")
-                        st.rerun()
-                    else:
-                        st.error("Failed to add GOH night")
-                else:
-                    st.error("Please fill all fields")
-        
-        st.markdown("**Current and upcoming GOH nights:**")
-        
-        goh_nights_list = stays_manager.get_goh_nights()
-        if goh_nights_list:
-            for idx, goh in enumerate(goh_nights_list):
-                col1, col2, col3, col4 = st.columns([2, 2, 1, 1])
-                is_past = goh['date'] <= pd.Timestamp.now().date()
-                
-                with col1:
-                    st.write(f"**{goh['name']}**")
-                with col2:
-                    st.write(f"{goh['date']}")
-                with col3:
-                    status = "✅" if is_past else "⏳"
-                    st.write(status)
-                with col4:
-                    if st.button("🗑️", key=f"delete_goh_{idx}", width='stretch'):
-                        stays_manager.delete_goh_night(idx)
-                        st.rerun()
-        else:
-            st.info("No GOH nights added yet")
+    _goh_fragment(stays_manager, today)
         
     st.markdown("---")
     
     # ========================================================================
-    # PERSONAL CARD SECTION
+    # CARD SECTIONS
     # ========================================================================
-    st.subheader("💳 Personal Card (Chase ending 4100/1695)")
+    # Lazy tabs: only the selected tab's body runs, so the inactive card's
+    # spending aggregation is skipped
+    personal_tab, business_tab = st.tabs(
+        ["💳 Personal Card (Chase ending 4100/1695)", "💳 Business Card (Chase 1505)"],
+        key="card_section_tabs",
+        on_change="rerun"
+    )
 
-    processor = st.session_state.processor
-    personal_summary = processor.get_spending_summary('personal')
-    personal_breakdown = processor.get_yearly_bonus_nights_breakdown('personal')
+    with personal_tab:
+        if personal_tab.open:
+            _render_personal_card(processor, today)
+
+    with business_tab:
+        if business_tab.open:
+            _render_business_card(processor, today)
+
+
+def _render_personal_card(processor, today):
+    """Render the personal card spending and bonus nights metrics."""
+    personal_summary = _cached_spending_summary(processor, 'personal', processor.version, today)
+    if not personal_summary:
+        st.warning("No personal card data available")
+        return
+
+    personal_breakdown = _cached_bonus_breakdown(processor, 'personal', processor.version, today)
+
+    # Row 1: All-time and YTD spending
+    personal_col1, personal_col2 = st.columns(2)
     
-    if personal_summary:
-        # Row 1: All-time and YTD spending
-        personal_col1, personal_col2 = st.columns(2)
-        
-        with personal_col1:
-            st.metric(
-                "Total Spending All Time",
-                f"${personal_summary['total_spending']:,.2f}",
-                delta=None
-            )
-        
-        with personal_col2:
-            st.metric(
-                "Total Spending This Year",
-                f"${personal_summary['ytd_spending']:,.2f}",
-                delta=None
-            )
-        
-        # Row 2: Progress metrics
-        personal_col3, personal_col4 = st.columns(2)
-        
-        with personal_col3:
-            spend_to_next = personal_summary['spend_to_next_bonus']
-            st.metric(
-                "Spend Until Next 2 Nights",
-                f"${spend_to_next:,.2f}",
-                help=f"Each $5,000 = 2 nights. Current tier: {personal_summary['current_tier']}"
-            )
-        
-        with personal_col4:
-            cert_spend = personal_summary['spend_to_certificate']
-            if cert_spend > 0:
-                st.metric(
-                    "Spend Until Certificate",
-                    f"${cert_spend:,.2f}",
-                    help="Annual certificate at $15,000 YTD"
-                )
-            else:
-                st.metric(
-                    "Spend Until Certificate",
-                    "✅ Unlocked",
-                    help="Annual certificate already unlocked"
-                )
-        
-        # Row 3: Bonus nights breakdown
-        personal_col5, personal_col6, personal_col7 = st.columns(3)
-        
-        with personal_col5:
-            st.metric(
-                "Nights This Year (Posted)",
-                personal_breakdown['posted']
-            )
-        
-        with personal_col6:
+    with personal_col1:
+        st.metric(
+            "Total Spending All Time",
+            _fmt_money(personal_summary['total_spending']),
+            delta=None
+        )
+    
+    with personal_col2:
+        st.metric(
+            "Total Spending This Year",
+            _fmt_money(personal_summary['ytd_spending']),
+            delta=None
+        )
+    
+    # Row 2: Progress metrics
+    personal_col3, personal_col4 = st.columns(2)
+    
+    with personal_col3:
+        spend_to_next = personal_summary['spend_to_next_bonus']
+        st.metric(
+            "Spend Until Next 2 Nights",
+            _fmt_money(spend_to_next),
+            help=f"Each $5,000 = 2 nights. Current tier: {personal_summary['current_tier']}"
+        )
+    
+    with personal_col4:
+        cert_spend = personal_summary['spend_to_certificate']
+        if cert_spend > 0:
             st.metric(
-                "Nights This Year (Pending)",
-                personal_breakdown['pending']
+                "Spend Until Certificate",
+                _fmt_money(cert_spend),
+                help="Annual certificate at $15,000 YTD"
             )
-        
-        with personal_col7:
+        else:
             st.metric(
-                "Nights This Year (Total)",
-                personal_breakdown['total']
+                "Spend Until Certificate",
+                "✅ Unlocked",
+                help="Annual certificate already unlocked"
             )
-    else:
-        st.warning("No personal card data available")
     
-    st.markdown("---")
+    # Row 3: Bonus nights breakdown
+    personal_col5, personal_col6, personal_col7 = st.columns(3)
     
-    # ========================================================================
-    # BUSINESS CARD SECTION
-    # ========================================================================
-    st.subheader("💳 Business Card (Chase 1505)")
+    with personal_col5:
+        st.metric(
+            "Nights This Year (Posted)",
+            personal_breakdown['posted']
+        )
+    
+    with personal_col6:
+        st.metric(
+            "Nights This Year (Pending)",
+            personal_breakdown['pending']
+        )
+    
+    with personal_col7:
+        st.metric(
+            "Nights This Year (Total)",
+            personal_breakdown['total']
+        )
+
+
+def _render_business_card(processor, today):
+    """Render the business card spending and bonus nights metrics."""
+    business_summary = _cached_spending_summary(processor, 'business', processor.version, today)
+    if not business_summary:
+        st.warning("No business card data available")
+        return
 
-    business_summary = processor.get_spending_summary('business')
-    business_breakdown = processor.get_yearly_bonus_nights_breakdown('business')
+    business_breakdown = _cached_bonus_breakdown(processor, 'business', processor.version, today)
+
+    # Row 1: YTD spending
+    business_col1 = st.columns(1)[0]
     
-    if business_summary:
-        # Row 1: YTD spending
-        business_col1 = st.columns(1)[0]
-        
-        with business_col1:
-            st.metric(
-                "Total Spending This Year",
-                f"${business_summary['ytd_spending']:,.2f}",
-                help="Resets January 1"
-            )
-        
-        business_col2, business_col3 = st.columns(2)
-        
-        with business_col2:
-            spend_to_next = business_summary['spend_to_next_bonus']
-            st.metric(
-                "Spend Until Next 5 Nights",
-                f"${spend_to_next:,.2f}",
-                help=f"Each $10,000 = 5 nights. Current tier: {business_summary['current_tier']}"
-            )
+    with business_col1:
+        st.metric(
+            "Total Spending This Year",
+            _fmt_money(business_summary['ytd_spending']),
+            help="Resets January 1"
+        )
+    
+    business_col2, business_col3 = st.columns(2)
+    
+    with business_col2:
+        spend_to_next = business_summary['spend_to_next_bonus']
+        st.metric(
+            "Spend Until Next 5 Nights",
+            _fmt_money(spend_to_next),
+            help=f"Each $10,000 = 5 nights. Current tier: {business_summary['current_tier']}"
+        )
+    
+    # Row 3: Bonus nights breakdown
+    business_col4, business_col5, business_col6 = st.columns(3)
+    
+    with business_col4:
+        st.metric(
+            "Nights This Year (Posted)",
+            business_breakdown['posted']
+        )
+    
+    with business_col5:
+        st.metric(
+            "Nights This Year (Pending)",
+            business_breakdown['pending']
+        )
+    
+    with business_col6:
+        st.metric(
+            "Nights This Year (Total)",
+            business_breakdown['total']
+        )
+
+
+# Stay/GOH mutations happen in button callbacks that rerun only the summary and
+# the edited fragment, so the card sections are not recomputed
+@st.fragment(key="hyatt_summary")
+def _summary_fragment(summary_service, stays_manager, processor, today):
+    """Render the nights summary metrics; rerun by key after stay/GOH edits."""
+    nights_summary = _cached_nights_summary(
+        summary_service, stays_manager.version, processor.version, today
+    )
+
+    # One 3-column layout with three stacked metrics per column renders the
+    # same 3x3 grid as three separate st.columns rows
+    left_col, middle_col, right_col = st.columns(3)
+
+    left_col.metric("CC Nights (pending)", nights_summary.cc_nights_pending)
+    left_col.metric("CC Nights (posted)", nights_summary.cc_nights_posted)
+    left_col.metric("CC Yearly Start", nights_summary.cc_yearly_start)
+
+    middle_col.metric("Nights (upcoming)", nights_summary.upcoming_nights)
+    middle_col.metric("Nights (posted)", nights_summary.current_nights)
+    middle_col.metric("Nights Posted", nights_summary.nights_posted)
+
+    right_col.metric("GOH (upcoming)", nights_summary.goh_nights_upcoming)
+    right_col.metric("GOH (posted)", nights_summary.goh_nights)
+    right_col.metric("Nights Total", nights_summary.nights_total)
+
+
+def _add_stay(stays_manager):
+    """Button callback: add the stay from the input widgets."""
+    stay_name = st.session_state.stay_name_input
+    check_in = st.session_state.stay_checkin_input
+    check_out = st.session_state.stay_checkout_input
+    if not (stay_name and check_in and check_out and check_out > check_in):
+        st.session_state.stay_add_error = "Please fill all fields and ensure check-out is after check-in"
+    elif stays_manager.add_stay(stay_name, check_in, check_out):
+        st.rerun(["hyatt_summary", "hyatt_stays"])
+    else:
+        st.session_state.stay_add_error = "Failed to add stay"
+
+
+def _delete_stays(stays_manager, indices):
+    """Button callback: delete the ticked stays."""
+    if stays_manager.delete_stays(indices):
+        st.rerun(["hyatt_summary", "hyatt_stays"])
+
+
+def _add_goh(stays_manager):
+    """Button callback: add the GOH night from the input widgets."""
+    goh_name = st.session_state.goh_name_input
+    goh_date = st.session_state.goh_date_input
+    if not (goh_name and goh_date):
+        st.session_state.goh_add_error = "Please fill all fields"
+    elif stays_manager.add_goh_night(goh_name, goh_date):
+        st.rerun(["hyatt_summary", "hyatt_goh"])
+    else:
+        st.session_state.goh_add_error = "Failed to add GOH night"
+
+
+def _delete_goh_nights(stays_manager, indices):
+    """Button callback: delete the ticked GOH nights."""
+    if stays_manager.delete_goh_nights(indices):
+        st.rerun(["hyatt_summary", "hyatt_goh"])
+
+
+@st.fragment(key="hyatt_stays")
+def _stays_fragment(stays_manager, today):
+    """Add, list, and delete stays; widget edits rerun only this fragment."""
+    with st.expander("✏️ Stays (Current & Upcoming)"):
+        st.markdown("**Add a new stay:**")
+        # A form so typing in the inputs doesn't rerun; only submit does
+        with st.form("add_stay_form", clear_on_submit=True, border=False):
+            add_col1, add_col2, add_col3, add_col4 = st.columns([2, 2, 2, 1])
+
+            with add_col1:
+                st.text_input("Hotel/Location", key="stay_name_input")
+            with add_col2:
+                st.date_input("Check-in", key="stay_checkin_input")
+            with add_col3:
+                st.date_input("Check-out", key="stay_checkout_input")
+            with add_col4:
+                st.form_submit_button("➕ Add Stay", on_click=_add_stay, args=(stays_manager,))
+        if "stay_add_error" in st.session_state:
+            st.error(st.session_state.pop("stay_add_error"))
         
-        # Row 3: Bonus nights breakdown
-        st.markdown("")  # spacing
-        business_col4, business_col5, business_col6 = st.columns(3)
+        st.markdown("**Current and upcoming stays:**")
         
-        with business_col4:
-            st.metric(
-                "Nights This Year (Posted)",
-                business_breakdown['posted']
-            )
+        if not stays_manager.has_stays():
+            st.info("No stays added yet")
+            return
+
+        stays_df = stays_manager.get_stays_df()
+        # Status labels come from one array select over a single date
+        # comparison, with no intermediate is_past column
+        is_past = stays_df['check_out'].to_numpy(dtype='datetime64[D]') <= np.datetime64(today)
+        stays_df = stays_df.assign(status=np.where(is_past, "✅ Completed", "⏳ Upcoming"))
+        # One editor with a delete checkbox column instead of per-row
+        # buttons; the key follows the version so ticks clear after a delete
+        edited = st.data_editor(
+            stays_df[['name', 'check_in', 'check_out', 'nights', 'status']].assign(delete=False),
+            column_config={
+                'name': "Hotel/Location",
+                'check_in': st.column_config.DateColumn("Check-in"),
+                'check_out': st.column_config.DateColumn("Check-out"),
+                'nights': "Nights",
+                'status': "Status",
+                'delete': st.column_config.CheckboxColumn("Delete"),
+            },
+            disabled=['name', 'check_in', 'check_out', 'nights', 'status'],
+            num_rows="fixed",
+            key=f"stays_editor_{stays_manager.version}",
+        )
+
+        to_delete = edited.index[edited['delete']]
+        st.button(
+            "🗑️ Delete selected",
+            key="delete_stays",
+            disabled=to_delete.empty,
+            on_click=_delete_stays,
+            args=(stays_manager, to_delete.tolist()),
+        )
+
+
+@st.fragment(key="hyatt_goh")
+def _goh_fragment(stays_manager, today):
+    """Add, list, and delete GOH nights; widget edits rerun only this fragment."""
+    with st.expander("✏️ GOH Nights"):
+        st.markdown("**Add a new GOH night:**")
+        with st.form("add_goh_form", clear_on_submit=True, border=False):
+            goh_col1, goh_col2, goh_col3 = st.columns([2, 2, 1])
+
+            with goh_col1:
+                st.text_input("Guest Name / Description", key="goh_name_input")
+            with goh_col2:
+                st.date_input("Date", key="goh_date_input")
+            with goh_col3:
+                st.form_submit_button("➕ Add GOH", on_click=_add_goh, args=(stays_manager,))
+        if "goh_add_error" in st.session_state:
+            st.error(st.session_state.pop("goh_add_error"))
         
-        with business_col5:
-            st.metric(
-                "Nights This Year (Pending)",
-                business_breakdown['pending']
-            )
+        st.markdown("**Current and upcoming GOH nights:**")
         
-        with business_col6:
-            st.metric(
-                "Nights This Year (Total)",
-                business_breakdown['total']
-            )
-    else:
-        st.warning("No business card data available")
+        if not stays_manager.has_goh():
+            st.info("No GOH nights added yet")
+            return
+
+        goh_df = stays_manager.get_goh_df()
+        is_past = goh_df['date'].to_numpy(dtype='datetime64[D]') <= np.datetime64(today)
+        goh_df = goh_df.assign(status=np.where(is_past, "✅", "⏳"))
+        edited = st.data_editor(
+            goh_df[['name', 'date', 'status']].assign(delete=False),
+            column_config={
+                'name': "Guest Name / Description",
+                'date': st.column_config.DateColumn("Date"),
+                'status': "Status",
+                'delete': st.column_config.CheckboxColumn("Delete"),
+            },
+            disabled=['name', 'date', 'status'],
+            num_rows="fixed",
+            key=f"goh_editor_{stays_manager.version}",
+        )
+
+        to_delete = edited.index[edited['delete']]
+        st.button(
+            "🗑️ Delete selected",
+            key="delete_goh",
+            disabled=to_delete.empty,
+            on_click=_delete_goh_nights,
+            args=(stays_manager, to_delete.tolist()),
+        )
 
 
 # Run the page
@@ -15,12 +15,15 @@ import yaml
 import json
 from datetime import date, datetime
 from pathlib import Path
-from benefits.benefits_calculator import BenefitsCalculator
+from benefits.benefits_calculator import BenefitsCalculator, _anniv_range
 
+# Date the calc fixture treats as "now"
+TODAY = date(2025, 6, 15)
 
-@pytest.fixture
-def sample_config(tmp_path):
-    """Create a sample benefits config YAML file."""
+
+@pytest.fixture(scope="session")
+def sample_config(tmp_path_factory):
+    """Write the sample benefits config YAML once for the whole session."""
     config = {
         'cards': {
             'test_card_2025': {
@@ -95,7 +98,7 @@ def sample_config(tmp_path):
         }
     }
 
-    config_path = tmp_path / "test_config.yaml"
+    config_path = tmp_path_factory.mktemp("cfg") / "test_config.yaml"
     with open(config_path, 'w') as f:
         yaml.dump(config, f)
 
@@ -104,20 +107,21 @@ def sample_config(tmp_path):
 
 @pytest.fixture
 def empty_state(tmp_path):
-    """Create an empty state file."""
-    state_path = tmp_path / "test_state.json"
-    state_path.write_text("{}")
-    return state_path
+    """Path for a state file that does not exist yet; the calculator treats it as empty."""
+    return tmp_path / "test_state.json"
+
+
+@pytest.fixture
+def calc(sample_config, empty_state):
+    """Calculator on the shared sample config with a fresh, empty state file, as of TODAY."""
+    return BenefitsCalculator(config_path=sample_config, state_path=empty_state, today=TODAY)
 
 
 class TestPeriodGeneration:
     """Test period generation for different frequencies."""
 
-    def test_yearly_calendar_periods(self, sample_config, empty_state):
+    def test_yearly_calendar_periods(self, calc):
         """Yearly calendar benefits should generate yearly periods."""
-        calc = BenefitsCalculator(config_path=sample_config, state_path=empty_state)
-        calc.today = date(2025, 6, 15)
-
         benefit = {
             'frequency': 'yearly',
             'renewal_type': 'calendar_year'
@@ -131,11 +135,8 @@ class TestPeriodGeneration:
         assert '2025' in periods
         assert '2026' in periods
 
-    def test_quarterly_calendar_periods(self, sample_config, empty_state):
+    def test_quarterly_calendar_periods(self, calc):
         """Quarterly calendar benefits should generate Q1-Q4 for each year."""
-        calc = BenefitsCalculator(config_path=sample_config, state_path=empty_state)
-        calc.today = date(2025, 6, 15)
-
         benefit = {
             'frequency': 'quarterly',
             'renewal_type': 'calendar_year'
@@ -149,11 +150,8 @@ class TestPeriodGeneration:
         assert '2025-Q3' in periods
         assert '2025-Q4' in periods
 
-    def test_monthly_calendar_periods(self, sample_config, empty_state):
+    def test_monthly_calendar_periods(self, calc):
         """Monthly calendar benefits should generate all 12 months."""
-        calc = BenefitsCalculator(config_path=sample_config, state_path=empty_state)
-        calc.today = date(2025, 6, 15)
-
         benefit = {
             'frequency': 'monthly',
             'renewal_type': 'calendar_year'
@@ -166,11 +164,8 @@ class TestPeriodGeneration:
         assert '2025-Feb' in periods
         assert '2025-Dec' in periods
 
-    def test_half_yearly_calendar_periods(self, sample_config, empty_state):
+    def test_half_yearly_calendar_periods(self, calc):
         """Half-yearly calendar benefits should generate H1 and H2."""
-        calc = BenefitsCalculator(config_path=sample_config, state_path=empty_state)
-        calc.today = date(2025, 6, 15)
-
         benefit = {
             'frequency': 'half_yearly',
             'renewal_type': 'calendar_year'
@@ -181,11 +176,8 @@ class TestPeriodGeneration:
         assert '2025-H1' in periods
         assert '2025-H2' in periods
 
-    def test_anniversary_yearly_periods(self, sample_config, empty_state):
+    def test_anniversary_yearly_periods(self, calc):
         """Anniversary yearly benefits should use anniversary period format."""
-        calc = BenefitsCalculator(config_path=sample_config, state_path=empty_state)
-        calc.today = date(2025, 6, 15)
-
         benefit = {
             'frequency': 'yearly',
             'renewal_type': 'card_anniversary'
@@ -199,11 +191,8 @@ class TestPeriodGeneration:
         assert '2024-A07' in periods
         assert '2026-A07' in periods
 
-    def test_every_4_years_periods(self, sample_config, empty_state):
+    def test_every_4_years_periods(self, calc):
         """Every 4 years benefits should generate anniversary periods."""
-        calc = BenefitsCalculator(config_path=sample_config, state_path=empty_state)
-        calc.today = date(2025, 6, 15)
-
         benefit = {
             'frequency': 'every_4_years',
             'renewal_type': 'card_anniversary'
@@ -214,24 +203,53 @@ class TestPeriodGeneration:
         # Should still generate yearly periods (availability checked separately)
         assert '2025-A11' in periods
         assert '2024-A11' in periods
+        assert len(periods) == 4
+
+    def test_today_defaults_to_current_date(self, sample_config, empty_state):
+        """Without an explicit today, the calculator uses the current date."""
+        calc = BenefitsCalculator(config_path=sample_config, state_path=empty_state)
+
+        assert calc.today == date.today()
+
+    def test_periods_cached_per_definition_and_year(self, calc):
+        """Identical benefit definitions reuse the cached periods until the year changes."""
+        benefit = {'frequency': 'quarterly', 'renewal_type': 'calendar_year'}
+
+        first = calc._generate_periods(benefit, 'test_card_2025')
+        second = calc._generate_periods(dict(benefit), 'test_card_2026')
+        assert first is second
+
+        calc.today = date(2026, 1, 2)
+        later = calc._generate_periods(benefit, 'test_card_2025')
+        assert '2027-Q1' in later
+        assert '2027-Q1' not in first
 
 
 class TestAnniversaryYearLogic:
     """Test anniversary year calculations."""
 
-    def test_get_anniversary_year_range(self, sample_config, empty_state):
+    def test_get_anniversary_year_range(self, calc):
         """Anniversary year 2025 with July renewal should span July 2025 - July 2026."""
-        calc = BenefitsCalculator(config_path=sample_config, state_path=empty_state)
-
         start_date, end_date = calc.get_anniversary_year_range('test_card_2025', 2025)
 
         assert start_date == date(2025, 7, 15)
         assert end_date == date(2026, 7, 14)
 
-    def test_benefit_anniversary_year_from_post_date_after_renewal(self, sample_config, empty_state):
-        """Post date after renewal date should count toward current anniversary year."""
-        calc = BenefitsCalculator(config_path=sample_config, state_path=empty_state)
+    def test_anniversary_year_range_spanning_leap_day(self):
+        """The range should run up to the day before the next renewal, even across Feb 29."""
+        assert _anniv_range(1, 15, 2024) == (date(2024, 1, 15), date(2025, 1, 14))
+
+    def test_anniversary_year_range_clamps_feb_29_renewal(self):
+        """A Feb 29 renewal day should fall back to Feb 28 in non-leap years."""
+        assert _anniv_range(2, 29, 2024) == (date(2024, 2, 29), date(2025, 2, 27))
+        assert _anniv_range(2, 29, 2025) == (date(2025, 2, 28), date(2026, 2, 27))
+
+    def test_unknown_card_anniversary_year_range(self, calc):
+        """Unknown cards should have no anniversary range."""
+        assert calc.get_anniversary_year_range('missing_card', 2025) == (None, None)
 
+    def test_benefit_anniversary_year_from_post_date_after_renewal(self, calc):
+        """Post date after renewal date should count toward current anniversary year."""
         benefit = {
             'posted': True,
             'post_date': '2024-08-01'  # After July 15, 2024
@@ -242,10 +260,8 @@ class TestAnniversaryYearLogic:
         # August 2024 is after July 15, 2024 renewal -> counts toward 2024 anniversary year
         assert anniv_year == 2024
 
-    def test_benefit_anniversary_year_from_post_date_before_renewal(self, sample_config, empty_state):
+    def test_benefit_anniversary_year_from_post_date_before_renewal(self, calc):
         """Post date before renewal date should count toward current anniversary year."""
-        calc = BenefitsCalculator(config_path=sample_config, state_path=empty_state)
-
         benefit = {
             'posted': True,
             'post_date': '2024-06-01'  # Before July 15, 2024
@@ -256,10 +272,22 @@ class TestAnniversaryYearLogic:
         # June 2024 is before July 15, 2024 renewal -> counts toward 2023 anniversary year
         assert anniv_year == 2023
 
-    def test_get_benefit_period_anniversary_year(self, sample_config, empty_state):
-        """Extract anniversary year from period string."""
-        calc = BenefitsCalculator(config_path=sample_config, state_path=empty_state)
+    def test_posted_calendar_benefit_anniversary_year(self, calc):
+        """Posted calendar benefits map to the anniversary year containing their post date."""
+        benefit = {'posted': True, 'post_date': '2025-03-01'}
+        assert calc.get_posted_calendar_benefit_anniversary_year('test_card_2025', benefit) == 2024
+
+        # Too far from today to be considered
+        benefit = {'posted': True, 'post_date': '2019-03-01'}
+        assert calc.get_posted_calendar_benefit_anniversary_year('test_card_2025', benefit) is None
 
+    def test_benefit_anniversary_year_on_renewal_day(self, calc):
+        """A post date on the renewal day itself starts the new anniversary year."""
+        assert calc.get_benefit_anniversary_year('test_card_2025', {'posted': True, 'post_date': '2024-07-15'}) == 2024
+        assert calc.get_benefit_anniversary_year('test_card_2025', {'posted': True, 'post_date': '2024-07-14'}) == 2023
+
+    def test_get_benefit_period_anniversary_year(self, calc):
+        """Extract anniversary year from period string."""
         benefit = {'period': '2025-A07'}
         assert calc.get_benefit_period_anniversary_year(benefit) == 2025
 
@@ -273,19 +301,15 @@ class TestAnniversaryYearLogic:
 class TestCalendarPeriodLogic:
     """Test calendar period date ranges and overlaps."""
 
-    def test_get_calendar_period_date_range_yearly(self, sample_config, empty_state):
+    def test_get_calendar_period_date_range_yearly(self, calc):
         """Yearly period should span full calendar year."""
-        calc = BenefitsCalculator(config_path=sample_config, state_path=empty_state)
-
         start, end = calc.get_calendar_period_date_range('2025')
 
         assert start == date(2025, 1, 1)
         assert end == date(2025, 12, 31)
 
-    def test_get_calendar_period_date_range_quarterly(self, sample_config, empty_state):
+    def test_get_calendar_period_date_range_quarterly(self, calc):
         """Quarterly periods should span 3 months each."""
-        calc = BenefitsCalculator(config_path=sample_config, state_path=empty_state)
-
         start, end = calc.get_calendar_period_date_range('2025-Q1')
         assert start == date(2025, 1, 1)
         assert end == date(2025, 3, 31)
@@ -302,10 +326,8 @@ class TestCalendarPeriodLogic:
         assert start == date(2025, 10, 1)
         assert end == date(2025, 12, 31)
 
-    def test_get_calendar_period_date_range_half_yearly(self, sample_config, empty_state):
+    def test_get_calendar_period_date_range_half_yearly(self, calc):
         """Half-yearly periods should span 6 months each."""
-        calc = BenefitsCalculator(config_path=sample_config, state_path=empty_state)
-
         start, end = calc.get_calendar_period_date_range('2025-H1')
         assert start == date(2025, 1, 1)
         assert end == date(2025, 6, 30)
@@ -314,10 +336,8 @@ class TestCalendarPeriodLogic:
         assert start == date(2025, 7, 1)
         assert end == date(2025, 12, 31)
 
-    def test_get_calendar_period_date_range_monthly(self, sample_config, empty_state):
+    def test_get_calendar_period_date_range_monthly(self, calc):
         """Monthly periods should span single month."""
-        calc = BenefitsCalculator(config_path=sample_config, state_path=empty_state)
-
         start, end = calc.get_calendar_period_date_range('2025-Jan')
         assert start == date(2025, 1, 1)
         assert end == date(2025, 1, 31)
@@ -330,10 +350,19 @@ class TestCalendarPeriodLogic:
         assert start == date(2025, 12, 1)
         assert end == date(2025, 12, 31)
 
-    def test_calendar_period_overlaps_anniversary_year(self, sample_config, empty_state):
-        """Calendar periods should correctly detect overlap with anniversary years."""
-        calc = BenefitsCalculator(config_path=sample_config, state_path=empty_state)
+    def test_get_calendar_period_date_range_leap_february(self, calc):
+        """February should end on the 29th in leap years, in both month formats."""
+        assert calc.get_calendar_period_date_range('2024-Feb') == (date(2024, 2, 1), date(2024, 2, 29))
+        assert calc.get_calendar_period_date_range('2024-M02') == (date(2024, 2, 1), date(2024, 2, 29))
+
+    def test_get_calendar_period_date_range_invalid(self, calc):
+        """Anniversary and malformed periods have no calendar range."""
+        assert calc.get_calendar_period_date_range('2025-A07') == (None, None)
+        assert calc.get_calendar_period_date_range('2025-Q5') == (None, None)
+        assert calc.get_calendar_period_date_range('junk') == (None, None)
 
+    def test_calendar_period_overlaps_anniversary_year(self, calc):
+        """Calendar periods should correctly detect overlap with anniversary years."""
         # Anniversary year 2025 spans July 15, 2025 - July 14, 2026
         # 2025-H1 (Jan-Jun 2025) does NOT overlap
         assert calc.calendar_period_overlaps_anniversary_year('test_card_2025', '2025-H1', 2025) is False
@@ -347,26 +376,25 @@ class TestCalendarPeriodLogic:
         # 2026-H2 (Jul-Dec 2026) overlaps (through July 14, 2026)
         assert calc.calendar_period_overlaps_anniversary_year('test_card_2025', '2026-H2', 2025) is True
 
+    def test_overlap_with_invalid_period_or_card(self, calc):
+        """Invalid periods and unknown cards should never overlap."""
+        assert calc.calendar_period_overlaps_anniversary_year('test_card_2025', '2025-X9', 2025) is False
+        assert calc.calendar_period_overlaps_anniversary_year('missing_card', '2025-H2', 2025) is False
+
 
 class TestBenefitToggling:
     """Test toggling benefit posted status."""
 
-    def test_toggle_benefit_on(self, sample_config, empty_state):
+    def test_toggle_benefit_on(self, calc):
         """Toggling benefit on should mark as posted with date."""
-        calc = BenefitsCalculator(config_path=sample_config, state_path=empty_state)
-        calc.today = date(2025, 6, 15)
-
         calc.toggle_benefit('test_benefit', '2025-Q1')
 
         key = 'test_benefit|2025-Q1'
         assert calc.state[key]['posted'] is True
         assert calc.state[key]['post_date'] == '2025-06-15'
 
-    def test_toggle_benefit_off(self, sample_config, empty_state):
+    def test_toggle_benefit_off(self, calc):
         """Toggling benefit off should clear post date."""
-        calc = BenefitsCalculator(config_path=sample_config, state_path=empty_state)
-        calc.today = date(2025, 6, 15)
-
         # Turn on then off
         calc.toggle_benefit('test_benefit', '2025-Q1')
         calc.toggle_benefit('test_benefit', '2025-Q1')
@@ -375,11 +403,21 @@ class TestBenefitToggling:
         assert calc.state[key]['posted'] is False
         assert calc.state[key]['post_date'] is None
 
-    def test_toggle_with_anniversary_year_tracking(self, sample_config, empty_state):
-        """Toggling calendar benefit should track anniversary year."""
-        calc = BenefitsCalculator(config_path=sample_config, state_path=empty_state)
-        calc.today = date(2025, 6, 15)
+    def test_toggle_existing_entry_keeps_custom_amount(self, calc):
+        """Re-toggling an existing entry should flip its status without resetting other fields."""
+        calc.set_custom_amount('test_benefit', '2025-Q1', 40.0)
+        calc.toggle_benefit('test_benefit', '2025-Q1', anniversary_year=2025)
+        calc.toggle_benefit('test_benefit', '2025-Q1')
+        calc.toggle_benefit('test_benefit', '2025-Q1')
+
+        entry = calc.state['test_benefit|2025-Q1']
+        assert entry['posted'] is True
+        assert entry['post_date'] == '2025-06-15'
+        assert entry['custom_amount'] == 40.0
+        assert entry['posted_anniversary_year'] is None
 
+    def test_toggle_with_anniversary_year_tracking(self, calc):
+        """Toggling calendar benefit should track anniversary year."""
         calc.toggle_benefit('test_benefit', '2025-Q1', anniversary_year=2025)
 
         key = 'test_benefit|2025-Q1'
@@ -390,50 +428,58 @@ class TestBenefitToggling:
 class TestCustomAmounts:
     """Test custom amount tracking for partial benefit usage."""
 
-    def test_set_custom_amount(self, sample_config, empty_state):
+    def test_set_custom_amount(self, calc):
         """Setting custom amount should store in state."""
-        calc = BenefitsCalculator(config_path=sample_config, state_path=empty_state)
-
         calc.set_custom_amount('test_benefit', '2025-Q1', 75.0)
 
         key = 'test_benefit|2025-Q1'
         assert calc.state[key]['custom_amount'] == 75.0
 
-    def test_get_custom_amount_when_set(self, sample_config, empty_state):
+    def test_get_custom_amount_when_set(self, calc):
         """Getting custom amount should return stored value."""
-        calc = BenefitsCalculator(config_path=sample_config, state_path=empty_state)
-
         calc.set_custom_amount('test_benefit', '2025-Q1', 75.0)
         amount = calc.get_custom_amount('test_benefit', '2025-Q1', default_amount=100.0)
 
         assert amount == 75.0
 
-    def test_get_custom_amount_when_not_set(self, sample_config, empty_state):
+    def test_get_custom_amount_when_not_set(self, calc):
         """Getting custom amount should return default when not set."""
-        calc = BenefitsCalculator(config_path=sample_config, state_path=empty_state)
-
         amount = calc.get_custom_amount('test_benefit', '2025-Q1', default_amount=100.0)
 
         assert amount == 100.0
 
-    def test_clear_custom_amount(self, sample_config, empty_state):
-        """Setting custom amount to None should clear it."""
-        calc = BenefitsCalculator(config_path=sample_config, state_path=empty_state)
+    def test_get_custom_amount_after_clearing(self, calc):
+        """An entry whose custom amount was cleared should fall back to the default."""
+        calc.set_custom_amount('test_benefit', '2025-Q1', 75.0)
+        calc.set_custom_amount('test_benefit', '2025-Q1', None)
+
+        assert calc.get_custom_amount('test_benefit', '2025-Q1', default_amount=100.0) == 100.0
 
+    def test_clear_custom_amount(self, calc):
+        """Setting custom amount to None should clear it."""
         calc.set_custom_amount('test_benefit', '2025-Q1', 75.0)
         calc.set_custom_amount('test_benefit', '2025-Q1', None)
 
         key = 'test_benefit|2025-Q1'
         assert calc.state[key]['custom_amount'] is None
 
+    def test_unchanged_custom_amount_skips_save(self, calc, empty_state):
+        """Re-setting the same custom amount should not rewrite the state file."""
+        calc.set_custom_amount('test_benefit', '2025-Q1', 75.0)
+        empty_state.write_text("{}")
+
+        calc.set_custom_amount('test_benefit', '2025-Q1', 75.0)
+        calc.set_custom_amount('other_benefit', '2025-Q1', None)
+
+        assert empty_state.read_text() == "{}"
+        assert 'other_benefit|2025-Q1' not in calc.state
+
 
 class TestEvery4YearsBenefits:
     """Test the every_4_years benefit availability logic."""
 
-    def test_every_4_years_available_when_never_used(self, sample_config, empty_state):
+    def test_every_4_years_available_when_never_used(self, calc):
         """Every 4 years benefit should be available when never used."""
-        calc = BenefitsCalculator(config_path=sample_config, state_path=empty_state)
-
         is_available, next_year, last_year = calc.is_every_4_years_benefit_available(
             'venture_x_2025_GE_precheck',
             'venture_x_2025',
@@ -444,16 +490,10 @@ class TestEvery4YearsBenefits:
         assert next_year is None
         assert last_year is None
 
-    def test_every_4_years_not_available_when_recently_used(self, sample_config, empty_state):
+    def test_every_4_years_not_available_when_recently_used(self, calc):
         """Every 4 years benefit should NOT be available if used in last 4 years."""
-        calc = BenefitsCalculator(config_path=sample_config, state_path=empty_state)
-
         # Mark as used in 2023
-        calc.state['venture_x_2025_GE_precheck|2023-A11'] = {
-            'posted': True,
-            'post_date': '2023-11-15',
-            'custom_amount': None
-        }
+        calc.set_benefit_posted('venture_x_2025_GE_precheck', '2023-A11', True, '2023-11-15')
 
         # Check availability for 2025 (only 2 years later)
         is_available, next_year, last_year = calc.is_every_4_years_benefit_available(
@@ -466,16 +506,10 @@ class TestEvery4YearsBenefits:
         assert next_year == 2027  # Available again in 2027
         assert last_year == 2023
 
-    def test_every_4_years_available_after_4_years(self, sample_config, empty_state):
+    def test_every_4_years_available_after_4_years(self, calc):
         """Every 4 years benefit should be available again after 4 years."""
-        calc = BenefitsCalculator(config_path=sample_config, state_path=empty_state)
-
         # Mark as used in 2021
-        calc.state['venture_x_2025_GE_precheck|2021-A11'] = {
-            'posted': True,
-            'post_date': '2021-11-15',
-            'custom_amount': None
-        }
+        calc.set_benefit_posted('venture_x_2025_GE_precheck', '2021-A11', True, '2021-11-15')
 
         # Check availability for 2025 (4 years later)
         is_available, next_year, last_year = calc.is_every_4_years_benefit_available(
@@ -488,16 +522,21 @@ class TestEvery4YearsBenefits:
         assert next_year is None
         assert last_year == 2021
 
-    def test_get_every_4_years_benefit_info(self, sample_config, empty_state):
-        """Test convenience method for getting every_4_years info."""
-        calc = BenefitsCalculator(config_path=sample_config, state_path=empty_state)
+    def test_every_4_years_reflects_later_toggles(self, calc):
+        """Availability should update after the benefit is toggled on and off."""
+        args = ('venture_x_2025_GE_precheck', 'venture_x_2025', '2025-A11')
+        assert calc.is_every_4_years_benefit_available(*args) == (True, None, None)
+
+        calc.toggle_benefit('venture_x_2025_GE_precheck', '2024-A11')
+        assert calc.is_every_4_years_benefit_available(*args) == (False, 2028, 2024)
 
+        calc.toggle_benefit('venture_x_2025_GE_precheck', '2024-A11')
+        assert calc.is_every_4_years_benefit_available(*args) == (True, None, None)
+
+    def test_get_every_4_years_benefit_info(self, calc):
+        """Test convenience method for getting every_4_years info."""
         # Mark as used in 2023
-        calc.state['venture_x_2025_GE_precheck|2023-A11'] = {
-            'posted': True,
-            'post_date': '2023-11-15',
-            'custom_amount': None
-        }
+        calc.set_benefit_posted('venture_x_2025_GE_precheck', '2023-A11', True, '2023-11-15')
 
         benefit = {
             'benefit_id': 'venture_x_2025_GE_precheck',
@@ -517,10 +556,8 @@ class TestEvery4YearsBenefits:
 class TestBenefitRenewalType:
     """Test determining benefit renewal type from period."""
 
-    def test_get_benefit_renewal_type_calendar(self, sample_config, empty_state):
+    def test_get_benefit_renewal_type_calendar(self, calc):
         """Calendar periods should return calendar_year."""
-        calc = BenefitsCalculator(config_path=sample_config, state_path=empty_state)
-
         benefit = {'period': '2025-Q1'}
         assert calc.get_benefit_renewal_type(benefit) == 'calendar_year'
 
@@ -530,25 +567,27 @@ class TestBenefitRenewalType:
         benefit = {'period': '2025'}
         assert calc.get_benefit_renewal_type(benefit) == 'calendar_year'
 
-    def test_get_benefit_renewal_type_anniversary(self, sample_config, empty_state):
+    def test_get_benefit_renewal_type_anniversary(self, calc):
         """Anniversary periods (with -A) should return card_anniversary."""
-        calc = BenefitsCalculator(config_path=sample_config, state_path=empty_state)
-
         benefit = {'period': '2025-A07'}
         assert calc.get_benefit_renewal_type(benefit) == 'card_anniversary'
 
         benefit = {'period': '2025-AH1-07'}
         assert calc.get_benefit_renewal_type(benefit) == 'card_anniversary'
 
+    def test_month_abbreviations_starting_with_a_are_calendar(self, calc):
+        """'Apr' and 'Aug' monthly periods must not look like anniversary periods."""
+        for period in ('2025-Apr', '2025-Aug'):
+            benefit = {'period': period}
+            assert calc.get_benefit_renewal_type(benefit) == 'calendar_year'
+            assert calc.get_benefit_period_anniversary_year(benefit) is None
+
 
 class TestCardSummary:
     """Test card summary calculations."""
 
-    def test_get_card_summary(self, sample_config, empty_state):
+    def test_get_card_summary(self, calc):
         """Card summary should calculate totals correctly."""
-        calc = BenefitsCalculator(config_path=sample_config, state_path=empty_state)
-        calc.today = date(2025, 6, 15)
-
         # Get all benefits first to see what IDs are generated
         all_benefits = calc.get_card_benefits('test_card_2025')
 
@@ -595,3 +634,89 @@ class TestStatePersistence:
 
         key = 'test_benefit|2025-Q1'
         assert calc2.state[key]['posted'] is True
+
+    def test_unchanged_posted_status_skips_save(self, calc, empty_state):
+        """Setting the posted status to its current value should not rewrite the state file."""
+        calc.set_benefit_posted('test_benefit', '2025-Q1', True, '2025-02-01')
+        empty_state.write_text("{}")
+
+        calc.set_benefit_posted('test_benefit', '2025-Q1', True, '2025-02-01')
+        calc.flush()
+        assert empty_state.read_text() == "{}"
+
+        calc.set_benefit_posted('test_benefit', '2025-Q1', True, '2025-03-01')
+        assert json.loads(empty_state.read_text())['test_benefit|2025-Q1']['post_date'] == '2025-03-01'
+
+    def test_missing_state_file_created_on_first_save(self, calc, empty_state):
+        """A missing state file should load as empty and be written on the first change."""
+        assert calc.state == {}
+        assert not empty_state.exists()
+
+        calc.toggle_benefit('test_benefit', '2025-Q1')
+
+        assert json.loads(empty_state.read_text())['test_benefit|2025-Q1']['posted'] is True
+
+    def test_empty_state_file_loads_as_empty(self, sample_config, tmp_path):
+        """A zero-byte state file should load as empty state."""
+        state_path = tmp_path / "test_state.json"
+        state_path.write_bytes(b'')
+
+        calc = BenefitsCalculator(config_path=sample_config, state_path=state_path)
+
+        assert calc.state == {}
+
+    def test_loaded_state_is_indexed_by_benefit_and_period(self, sample_config, tmp_path):
+        """Entries loaded from disk should be reachable through the (benefit_id, period) index."""
+        state_path = tmp_path / "test_state.json"
+        state_path.write_text(json.dumps({
+            'card_x_benefit|2025-Q1': {'posted': True, 'post_date': '2025-02-01', 'custom_amount': 40.0},
+        }))
+        calc = BenefitsCalculator(config_path=sample_config, state_path=state_path)
+
+        assert calc.get_custom_amount('card_x_benefit', '2025-Q1', 100) == 40.0
+
+        # Updates go through the shared entry, so the flat form written to disk stays in sync
+        calc.set_custom_amount('card_x_benefit', '2025-Q1', 55.0)
+        assert json.loads(state_path.read_text())['card_x_benefit|2025-Q1']['custom_amount'] == 55.0
+
+
+class TestConfigLoading:
+    """Test config parsing and caching."""
+
+    def test_config_parsed_once_per_unchanged_file(self, sample_config, empty_state):
+        """Calculators on the same unchanged config should share the parsed dict."""
+        calc1 = BenefitsCalculator(config_path=sample_config, state_path=empty_state)
+        calc2 = BenefitsCalculator(config_path=sample_config, state_path=empty_state)
+
+        assert calc1.config is calc2.config
+        assert 'test_card_2025' in calc1.config['cards']
+
+    def test_card_meta_built_from_config(self, calc):
+        """Per-card metadata should mirror the config without modifying it."""
+        card = calc._cards['test_card_2025']
+
+        assert card.renewal == (7, 15)
+        assert card.annual_fee == 695
+        assert card.calendar_key == 'test_card'
+        assert len(card.benefits) == len(calc.config['cards']['test_card_2025']['benefits'])
+        assert card.benefits[0].id == 'quarterly_benefit'
+        assert card.benefits[0].frequency == 'quarterly'
+        assert isinstance(calc.config['cards']['test_card_2025']['benefits'][0], dict)
+
+    def test_config_reloaded_after_file_changes(self, tmp_path, empty_state):
+        """Editing the config file should invalidate the cached parse."""
+        import os
+        config_path = tmp_path / "config.yaml"
+        with open(config_path, 'w') as f:
+            yaml.dump({'cards': {'test_card_2025': {'display_name': 'Old', 'benefits': []}}}, f)
+        calc1 = BenefitsCalculator(config_path=config_path, state_path=empty_state)
+
+        with open(config_path, 'w') as f:
+            yaml.dump({'cards': {'new_card_2025': {'display_name': 'New', 'benefits': []}}}, f)
+        stat = os.stat(config_path)
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        calc2 = BenefitsCalculator(config_path=config_path, state_path=empty_state)
+
+        assert 'test_card_2025' in calc1.config['cards']
+        assert list(calc2.config['cards']) == ['new_card_2025']
@@ -13,16 +13,48 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, date, timedelta
 from pathlib import Path
-from benefits.card_processor import CardProcessor
+from unittest.mock import Mock
+from benefits.card_processor import CardProcessor, _group_shift1, _shift1, _yearly_cumsum
+
+# Times the fixed_now fixture pins Timestamp.now to
+FEB_15 = pd.Timestamp('2025-02-15')
+FEB_1 = pd.Timestamp('2025-02-01')
+
+# Statement exports used by the integration tests
+PERSONAL_CSV = (
+    b"Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n"
+    b"01/10/2025,01/12/2025,Store A,Shopping,Sale,-5100.00,\n"
+    b"01/20/2025,01/22/2025,Store B,Dining,Sale,-1000.00,\n"
+    b"02/05/2025,02/07/2025,Store C,Shopping,Sale,-5200.00,"
+)
+BUSINESS_CSV = (
+    b"Transaction Date,Post Date,Description,Category,Type,Amount,Memo\n"
+    b"12/10/2024,12/12/2024,Store A,Shopping,Sale,-12000.00,\n"
+    b"01/10/2025,01/12/2025,Store B,Shopping,Sale,-11000.00,"
+)
+
+
+@pytest.fixture(scope="module")
+def processor():
+    """One CardProcessor shared by the tests that don't load any transactions into it."""
+    return CardProcessor()
+
+
+@pytest.fixture
+def fixed_now(monkeypatch):
+    """Pin pandas.Timestamp.now to a given time; returns the mock so calls can be counted."""
+    def _set(ts):
+        now = Mock(return_value=pd.Timestamp(ts))
+        monkeypatch.setattr(pd.Timestamp, 'now', now)
+        return now
+    return _set
 
 
 class TestDuplicateRemoval:
     """Test the duplicate removal logic across CSV files."""
 
-    def test_remove_duplicates_no_duplicates(self):
+    def test_remove_duplicates_no_duplicates(self, processor):
         """When no duplicates exist, all rows should be kept."""
-        processor = CardProcessor()
-
         df = pd.DataFrame({
             'Transaction Date': ['01/15/2025', '01/16/2025'],
             'Post Date': ['01/17/2025', '01/18/2025'],
@@ -37,10 +69,8 @@ class TestDuplicateRemoval:
         result = processor.remove_duplicates(df)
         assert len(result) == 2
 
-    def test_remove_duplicates_same_file(self):
-        """Duplicates within the same file should be removed."""
-        processor = CardProcessor()
-
+    def test_remove_duplicates_same_file(self, processor):
+        """Repeated transactions within the same file should all be kept."""
         df = pd.DataFrame({
             'Transaction Date': ['01/15/2025', '01/15/2025'],
             'Post Date': ['01/17/2025', '01/17/2025'],
@@ -53,13 +83,11 @@ class TestDuplicateRemoval:
         })
 
         result = processor.remove_duplicates(df)
-        # Same transaction in same file = keep all (this is the actual behavior)
+        # Identical purchases within one statement are separate transactions
         assert len(result) == 2
 
-    def test_remove_duplicates_across_files(self):
-        """Duplicates across different files - current implementation returns all rows."""
-        processor = CardProcessor()
-
+    def test_remove_duplicates_across_files(self, processor):
+        """The same transaction exported in different files should be kept once."""
         df = pd.DataFrame({
             'Transaction Date': ['01/15/2025', '01/15/2025'],
             'Post Date': ['01/17/2025', '01/17/2025'],
@@ -72,14 +100,29 @@ class TestDuplicateRemoval:
         })
 
         result = processor.remove_duplicates(df)
-        # NOTE: Current implementation appears to have a bug in line 99-101
-        # It returns the original df without actual deduplication
-        # This test documents the ACTUAL behavior, not the intended behavior
-        assert len(result) == 2
+        assert len(result) == 1
+        assert 'file' not in result.columns
+        assert 'Memo' not in result.columns
+
+    def test_remove_duplicates_overlapping_files_keep_repeats(self, processor):
+        """Repeats within a file survive, but their copies in an overlapping file do not."""
+        df = pd.DataFrame({
+            'Transaction Date': ['01/15/2025'] * 4 + ['01/20/2025'],
+            'Post Date': ['01/17/2025'] * 4 + ['01/22/2025'],
+            'Description': ['Coffee'] * 4 + ['Store B'],
+            'Category': ['Dining'] * 4 + ['Shopping'],
+            'Type': ['Sale'] * 5,
+            'Amount': [-5.0] * 4 + [-50.0],
+            'Memo': [np.nan] * 5,
+            'file': ['jan.CSV', 'jan.CSV', 'feb.CSV', 'feb.CSV', 'feb.CSV']
+        })
+
+        result = processor.remove_duplicates(df)
+        assert len(result) == 3
+        assert (result['Description'] == 'Coffee').sum() == 2
 
-    def test_remove_duplicates_empty_dataframe(self):
+    def test_remove_duplicates_empty_dataframe(self, processor):
         """Empty dataframe should return empty."""
-        processor = CardProcessor()
         df = pd.DataFrame()
         result = processor.remove_duplicates(df)
         assert result.empty
@@ -88,210 +131,161 @@ class TestDuplicateRemoval:
 class TestPersonalCardBonusNights:
     """Test personal card bonus night calculations."""
 
-    def test_first_tier_crossing(self):
-        """Crossing $5,000 for the first time should award 2 nights."""
-        processor = CardProcessor()
-
-        row = pd.Series({
-            'cumsum': 5100.0,
-            'previous_cumsum': 4900.0,
-        })
-
-        nights = processor._calculate_personal_bonus(row)
-        assert nights == 2
-
-    def test_second_tier_crossing(self):
-        """Crossing from tier 1 to tier 2 should award 2 nights."""
-        processor = CardProcessor()
-
-        row = pd.Series({
-            'cumsum': 10100.0,
-            'previous_cumsum': 9900.0,
-        })
-
-        nights = processor._calculate_personal_bonus(row)
-        # Single tier crossing always gives 2 nights
-        assert nights == 2
-
-    def test_multi_tier_jump(self):
-        """Jumping multiple tiers at once should use highest tier value."""
-        processor = CardProcessor()
-
-        # Jump from $4k to $11k (tier 0 to tier 2)
-        row = pd.Series({
-            'cumsum': 11000.0,
-            'previous_cumsum': 4000.0,
-        })
-
-        nights = processor._calculate_personal_bonus(row)
-        # Should give tier 2 reward = 4 nights
-        assert nights == 4
-
-    def test_below_first_tier(self):
-        """Staying below $5,000 should award no nights."""
-        processor = CardProcessor()
-
-        row = pd.Series({
-            'cumsum': 3000.0,
-            'previous_cumsum': 2000.0,
-        })
-
-        nights = processor._calculate_personal_bonus(row)
-        assert nights is None
-
-    def test_tier_drop_with_refund(self):
-        """Dropping below a tier (refund) should return negative nights."""
-        processor = CardProcessor()
-
-        # Drop from tier 2 to tier 1
-        row = pd.Series({
-            'cumsum': 7000.0,
-            'previous_cumsum': 11000.0,
+    @pytest.mark.parametrize("cumsum,previous_cumsum,expected", [
+        # Crossing $5,000 for the first time awards 2 nights
+        pytest.param(5100.0, 4900.0, 2, id="first_tier_crossing"),
+        # Single tier crossings always give 2 nights
+        pytest.param(10100.0, 9900.0, 2, id="second_tier_crossing"),
+        pytest.param(55100.0, 54900.0, 2, id="very_high_tier"),
+        # Multi-tier jumps use the highest tier's value: $4k -> $11k is tier 2 = 4 nights
+        pytest.param(11000.0, 4000.0, 4, id="multi_tier_jump"),
+        pytest.param(55100.0, 4900.0, 22, id="multi_tier_jump_to_high_tier"),
+        # Dropping from tier 2 to tier 1 (refund) loses the tier 2 bonus
+        pytest.param(7000.0, 11000.0, -4, id="tier_drop_with_refund"),
+        # Staying below $5,000 or within a tier awards nothing
+        pytest.param(3000.0, 2000.0, None, id="below_first_tier"),
+        pytest.param(6000.0, 5500.0, None, id="same_tier_no_change"),
+    ])
+    def test_bonus_nights(self, processor, cumsum, previous_cumsum, expected):
+        """Bonus nights awarded for moving between $5,000 tiers."""
+        row = {'cumsum': cumsum, 'previous_cumsum': previous_cumsum}
+
+        assert processor._calculate_personal_bonus(row) == expected
+
+    def test_vectorized_matches_row_calculation(self, processor):
+        """The vectorized calculation should agree with the per-row one."""
+        df = pd.DataFrame({
+            'cumsum': [5100.0, 10100.0, 11000.0, 3000.0, 7000.0, 6000.0, 55100.0, 55100.0, 80000.0, 2000.0, -100.0],
+            'previous_cumsum': [np.nan, 9900.0, 4000.0, 2000.0, 11000.0, 5500.0, 54900.0, 4900.0, 70000.0, 6000.0, 100.0],
         })
 
-        nights = processor._calculate_personal_bonus(row)
-        assert nights == -4  # Lose tier 2 bonus
+        expected = [
+            processor._calculate_personal_bonus({'cumsum': cumsum, 'previous_cumsum': previous})
+            for cumsum, previous in zip(df['cumsum'], df['previous_cumsum'])
+        ]
+        result = processor._calculate_personal_bonus_vec(df)
 
-    def test_same_tier_no_change(self):
-        """Staying in the same tier should award no nights."""
-        processor = CardProcessor()
-
-        row = pd.Series({
-            'cumsum': 6000.0,
-            'previous_cumsum': 5500.0,
-        })
+        assert [None if pd.isna(n) else n for n in result] == expected
 
-        nights = processor._calculate_personal_bonus(row)
-        assert nights is None
 
-    def test_very_high_tier(self):
-        """Test single tier crossing at high tier still gives 2 nights."""
-        processor = CardProcessor()
+class TestBusinessCardBonusNights:
+    """Test business card bonus night calculations."""
 
-        row = pd.Series({
-            'cumsum': 55100.0,  # tier 11
-            'previous_cumsum': 54900.0,  # tier 10
+    @pytest.mark.parametrize("cumsum_year,previous_cumsum_year,expected", [
+        # 5 nights per $10,000 tier reached in a year
+        pytest.param(10100.0, 9900.0, 5, id="first_tier_crossing"),
+        pytest.param(20100.0, 19900.0, 10, id="second_tier_crossing"),
+        # Tier 6 ($60k) caps at 30 nights, and stays capped beyond it
+        pytest.param(60100.0, 59900.0, 30, id="max_tier_reached"),
+        pytest.param(70100.0, 69900.0, 30, id="beyond_max_tier"),
+        # Dropping from tier 2 to tier 1 loses the tier 2 bonus
+        pytest.param(12000.0, 21000.0, -10, id="tier_drop_with_refund"),
+        pytest.param(8000.0, 5000.0, None, id="below_first_tier"),
+    ])
+    def test_bonus_nights(self, processor, cumsum_year, previous_cumsum_year, expected):
+        """Bonus nights awarded for moving between yearly $10,000 tiers."""
+        row = {'cumsum_year': cumsum_year, 'previous_cumsum_year': previous_cumsum_year}
+
+        assert processor._calculate_business_bonus(row) == expected
+
+    def test_vectorized_matches_row_calculation(self, processor):
+        """The vectorized calculation should agree with the per-row one."""
+        df = pd.DataFrame({
+            'cumsum_year': [10100.0, 20100.0, 60100.0, 70100.0, 8000.0, 12000.0, 35000.0, 5000.0],
+            'previous_cumsum_year': [np.nan, 19900.0, 59900.0, 69900.0, 5000.0, 21000.0, 1000.0, 15000.0],
         })
 
-        nights = processor._calculate_personal_bonus(row)
-        # Single tier crossing always gives 2 nights
-        assert nights == 2
+        expected = [
+            processor._calculate_business_bonus({'cumsum_year': cumsum, 'previous_cumsum_year': previous})
+            for cumsum, previous in zip(df['cumsum_year'], df['previous_cumsum_year'])
+        ]
+        result = processor._calculate_business_bonus_vec(df)
 
-    def test_multi_tier_jump_to_high_tier(self):
-        """Jumping multiple tiers to tier 11 should give 22 nights."""
-        processor = CardProcessor()
+        assert [None if pd.isna(n) else n for n in result] == expected
 
-        row = pd.Series({
-            'cumsum': 55100.0,  # tier 11
-            'previous_cumsum': 4900.0,  # tier 0
-        })
 
-        nights = processor._calculate_personal_bonus(row)
-        # Multi-tier jump uses nights_map for highest tier
-        assert nights == 22
+class TestYearlyCumsum:
+    """Test the year-resetting running total."""
 
+    def test_matches_groupby_cumsum_with_interleaved_years(self):
+        """Years need not be contiguous, since rows are sorted by transaction date."""
+        amount = np.array([100.0, 200.0, 50.0, 25.0, 10.0])
+        year = np.array([2024, 2025, 2024, 2025, np.nan])
 
-class TestBusinessCardBonusNights:
-    """Test business card bonus night calculations."""
+        result = _yearly_cumsum(amount, year)
 
-    def test_first_tier_crossing(self):
-        """Crossing $10,000 in a year should award 5 nights."""
-        processor = CardProcessor()
+        expected = pd.DataFrame({'a': amount, 'y': year}).groupby('y')['a'].cumsum().to_numpy()
+        np.testing.assert_array_equal(result, expected)
+        np.testing.assert_array_equal(result[:4], [100.0, 200.0, 150.0, 225.0])
+        assert np.isnan(result[4])
 
-        row = pd.Series({
-            'cumsum_year': 10100.0,
-            'previous_cumsum_year': 9900.0,
-        })
 
-        nights = processor._calculate_business_bonus(row)
-        assert nights == 5
+class TestGroupShift1:
+    """Test the within-year shift used for previous_cumsum_year."""
 
-    def test_second_tier_crossing(self):
-        """Crossing $20,000 in a year should award 10 nights."""
-        processor = CardProcessor()
+    def test_matches_groupby_shift_with_interleaved_years(self):
+        """Each row gets the previous value from its own year, even when years interleave."""
+        values = np.array([100.0, 200.0, 150.0, 225.0, 10.0, 260.0])
+        year = np.array([2024, 2025, 2024, 2025, np.nan, 2024])
 
-        row = pd.Series({
-            'cumsum_year': 20100.0,
-            'previous_cumsum_year': 19900.0,
-        })
+        result = _group_shift1(values, year)
 
-        nights = processor._calculate_business_bonus(row)
-        assert nights == 10
+        expected = pd.Series(values).groupby(year).shift(1).to_numpy()
+        np.testing.assert_array_equal(result, expected)
+        np.testing.assert_array_equal(result, [np.nan, np.nan, 100.0, 200.0, np.nan, 150.0])
 
-    def test_max_tier_reached(self):
-        """Tier 6 ($60k) caps at 30 nights."""
-        processor = CardProcessor()
+    def test_empty(self):
+        """No rows, no years: an empty result."""
+        assert len(_group_shift1(np.array([]), np.array([]))) == 0
 
-        row = pd.Series({
-            'cumsum_year': 60100.0,
-            'previous_cumsum_year': 59900.0,
-        })
 
-        nights = processor._calculate_business_bonus(row)
-        assert nights == 30
+class TestFirstRowPerYear:
+    """Tests for CardProcessor._first_row_per_year."""
 
-    def test_beyond_max_tier(self):
-        """Beyond tier 6, still caps at 30 nights."""
-        processor = CardProcessor()
+    def test_first_position_of_each_year(self):
+        """Years map to their first row position; rows without a year are skipped."""
+        df = pd.DataFrame({'year': [np.nan, 2025.0, 2024.0, 2025.0, 2024.0]})
 
-        row = pd.Series({
-            'cumsum_year': 70100.0,
-            'previous_cumsum_year': 69900.0,
-        })
+        assert CardProcessor._first_row_per_year(df) == {2024: 2, 2025: 1}
 
-        nights = processor._calculate_business_bonus(row)
-        assert nights == 30
 
-    def test_below_first_tier(self):
-        """Below $10,000 should award no nights."""
-        processor = CardProcessor()
+class TestShift1:
+    """Test the one-row shift used for previous running totals."""
 
-        row = pd.Series({
-            'cumsum_year': 8000.0,
-            'previous_cumsum_year': 5000.0,
-        })
-
-        nights = processor._calculate_business_bonus(row)
-        assert nights is None
+    def test_first_row_starts_at_zero(self):
+        """The first row has no previous total, so it starts from 0."""
+        np.testing.assert_array_equal(_shift1(np.array([5100.0, 6100.0, 11300.0])), [0.0, 5100.0, 6100.0])
 
-    def test_tier_drop_with_refund(self):
-        """Dropping below a tier should return negative nights."""
-        processor = CardProcessor()
-
-        row = pd.Series({
-            'cumsum_year': 12000.0,
-            'previous_cumsum_year': 21000.0,
-        })
-
-        nights = processor._calculate_business_bonus(row)
-        assert nights == -10  # Lose tier 2 bonus
+    def test_empty(self):
+        """An empty array shifts to an empty array."""
+        assert len(_shift1(np.array([]))) == 0
 
 
 class TestPostedVsPending:
     """Test the posted vs. pending logic based on statement close date."""
 
-    def test_get_most_recent_post_date_mid_month(self):
+    def test_get_most_recent_post_date_mid_month(self, processor, fixed_now):
         """Mid-month should return 23rd of current month."""
-        from unittest.mock import patch
-        processor = CardProcessor()
+        fixed_now(FEB_15)
 
-        # Mock Timestamp.now to return Feb 15
-        with patch('pandas.Timestamp.now', return_value=pd.Timestamp('2025-02-15')):
-            recent_date = processor._get_most_recent_post_date()
-            assert recent_date.day == 23
-            assert recent_date.month == 2
+        recent_date = processor._get_most_recent_post_date()
+        assert recent_date.day == 23
+        assert recent_date.month == 2
 
-    def test_get_most_recent_post_date_early_month(self):
+    def test_get_most_recent_post_date_early_month(self, processor, fixed_now):
         """1st or 2nd of month should return 23rd of previous month."""
-        from unittest.mock import patch
-        processor = CardProcessor()
+        fixed_now(FEB_1)
+
+        recent_date = processor._get_most_recent_post_date()
+        assert recent_date.day == 23
+        assert recent_date.month == 1
 
-        with patch('pandas.Timestamp.now', return_value=pd.Timestamp('2025-02-01')):
-            recent_date = processor._get_most_recent_post_date()
-            assert recent_date.day == 23
-            assert recent_date.month == 1
+    def test_get_most_recent_post_date_explicit_today(self, processor):
+        """An explicit today should be used instead of the current time."""
+        recent_date = processor._get_most_recent_post_date(today=date(2025, 3, 2))
+        assert recent_date == pd.Timestamp('2025-02-23')
 
-    def test_breakdown_with_posted_transactions(self):
+    def test_breakdown_with_posted_transactions(self, fixed_now):
         """Transactions before statement close are posted."""
         processor = CardProcessor()
 
@@ -308,89 +302,97 @@ class TestPostedVsPending:
         })
 
         df['year'] = df['Post Date'].dt.year
-        df['cumsum'] = df['Amount'].cumsum()
-        df['cumsum_year'] = df.groupby('year')['Amount'].cumsum()
-        df['previous_cumsum'] = df['cumsum'].shift(1)
-        df['nights'] = df.apply(processor._calculate_personal_bonus, axis=1)
+        processor._prepare_bonus_columns(df, 'personal')
 
         processor.personal_df = df
 
         # Mock current time to be mid-February
-        with patch('pandas.Timestamp.now', return_value=pd.Timestamp('2025-02-15')):
-            breakdown = processor.get_yearly_bonus_nights_breakdown('personal')
+        fixed_now(FEB_15)
+        breakdown = processor.get_yearly_bonus_nights_breakdown('personal')
+
+        # Both should be posted (before Feb 23rd)
+        assert breakdown['posted'] == 2
+        assert breakdown['pending'] == 0
+        assert breakdown['total'] == 2
+
+
+    def test_breakdown_reads_current_time_once(self, fixed_now):
+        """Without an explicit today, the breakdown should call Timestamp.now only once."""
+        processor = CardProcessor()
+        processor.personal_df = pd.DataFrame({
+            'Post Date': pd.to_datetime(['01/15/2025']),
+            'year': [2025],
+            'nights': [2.0],
+        })
+
+        now = fixed_now(FEB_15)
+        breakdown = processor.get_yearly_bonus_nights_breakdown('personal')
 
-            # Both should be posted (before Feb 23rd)
-            assert breakdown['posted'] == 2
-            assert breakdown['pending'] == 0
-            assert breakdown['total'] == 2
+        assert now.call_count == 1
+        assert breakdown == {'posted': 2, 'pending': 0, 'total': 2}
 
 
 class TestSpendingSummary:
     """Test spending summary calculations."""
 
-    def test_personal_spending_summary(self):
+    def test_personal_spending_summary(self, fixed_now):
         """Test personal card spending summary."""
-        from unittest.mock import patch
         processor = CardProcessor()
 
         # Mock current time to match test data
-        with patch('pandas.Timestamp.now', return_value=pd.Timestamp('2025-02-15')):
-            # Create simple test data
-            df = pd.DataFrame({
-                'Transaction Date': pd.to_datetime(['01/10/2025', '01/15/2025']),
-                'Post Date': pd.to_datetime(['01/12/2025', '01/17/2025']),
-                'Description': ['Store A', 'Store B'],
-                'Category': ['Shopping', 'Shopping'],
-                'Type': ['Sale', 'Sale'],
-                'Amount': [3000.0, 2500.0],
-                'Memo': ['', ''],
-                'year': [2025, 2025]
-            })
-
-            df['cumsum'] = df['Amount'].cumsum()
-            df['cumsum_year'] = df.groupby('year')['Amount'].cumsum()
-            df['previous_cumsum'] = df['cumsum'].shift(1)
-            df['nights'] = df.apply(processor._calculate_personal_bonus, axis=1)
-
-            processor.personal_df = df
-
-            summary = processor.get_spending_summary('personal')
-
-            assert summary['total_spending'] == 5500.0
-            assert summary['ytd_spending'] == 5500.0
-            assert summary['current_tier'] == 1  # Hit first tier
-            assert summary['spend_to_next_bonus'] == 4500.0  # Need $4.5k more for tier 2
-            assert summary['spend_to_certificate'] == 9500.0  # Need $9.5k more for $15k cert
-
-    def test_business_spending_summary(self):
+        fixed_now(FEB_15)
+
+        # Create simple test data
+        df = pd.DataFrame({
+            'Transaction Date': pd.to_datetime(['01/10/2025', '01/15/2025']),
+            'Post Date': pd.to_datetime(['01/12/2025', '01/17/2025']),
+            'Description': ['Store A', 'Store B'],
+            'Category': ['Shopping', 'Shopping'],
+            'Type': ['Sale', 'Sale'],
+            'Amount': [3000.0, 2500.0],
+            'Memo': ['', ''],
+            'year': [2025, 2025]
+        })
+
+        processor._prepare_bonus_columns(df, 'personal')
+
+        processor.personal_df = df
+
+        summary = processor.get_spending_summary('personal')
+
+        assert summary['total_spending'] == 5500.0
+        assert summary['ytd_spending'] == 5500.0
+        assert summary['current_tier'] == 1  # Hit first tier
+        assert summary['spend_to_next_bonus'] == 4500.0  # Need $4.5k more for tier 2
+        assert summary['spend_to_certificate'] == 9500.0  # Need $9.5k more for $15k cert
+
+    def test_business_spending_summary(self, fixed_now):
         """Test business card spending summary."""
-        from unittest.mock import patch
         processor = CardProcessor()
 
         # Mock current time to match test data
-        with patch('pandas.Timestamp.now', return_value=pd.Timestamp('2025-02-15')):
-            df = pd.DataFrame({
-                'Transaction Date': pd.to_datetime(['01/10/2025']),
-                'Post Date': pd.to_datetime(['01/12/2025']),
-                'Description': ['Business expense'],
-                'Category': ['Shopping'],
-                'Type': ['Sale'],
-                'Amount': [12000.0],
-                'Memo': [''],
-                'year': [2025]
-            })
-
-            df['cumsum_year'] = df.groupby('year')['Amount'].cumsum()
-            df['previous_cumsum_year'] = df.groupby('year')['cumsum_year'].shift(1)
-            df['nights'] = df.apply(processor._calculate_business_bonus, axis=1)
-
-            processor.business_df = df
-
-            summary = processor.get_spending_summary('business')
-
-            assert summary['ytd_spending'] == 12000.0
-            assert summary['current_tier'] == 1
-            assert summary['spend_to_next_bonus'] == 8000.0  # Need $8k more for tier 2
+        fixed_now(FEB_15)
+
+        df = pd.DataFrame({
+            'Transaction Date': pd.to_datetime(['01/10/2025']),
+            'Post Date': pd.to_datetime(['01/12/2025']),
+            'Description': ['Business expense'],
+            'Category': ['Shopping'],
+            'Type': ['Sale'],
+            'Amount': [12000.0],
+            'Memo': [''],
+            'year': [2025]
+        })
+
+        processor._prepare_bonus_columns(df, 'business')
+
+        processor.business_df = df
+
+        summary = processor.get_spending_summary('business')
+
+        assert summary['ytd_spending'] == 12000.0
+        assert summary['current_tier'] == 1
+        assert summary['spend_to_next_bonus'] == 8000.0  # Need $8k more for tier 2
 
     def test_empty_dataframe_returns_empty_dict(self):
         """Empty dataframe should return empty summary."""
@@ -410,13 +412,8 @@ class TestIntegration:
         personal_folder = tmp_path / "transactions" / "hyatt personal"
         personal_folder.mkdir(parents=True)
 
-        csv_content = """Transaction Date,Post Date,Description,Category,Type,Amount,Memo
-01/10/2025,01/12/2025,Store A,Shopping,Sale,-5100.00,
-01/20/2025,01/22/2025,Store B,Dining,Sale,-1000.00,
-02/05/2025,02/07/2025,Store C,Shopping,Sale,-5200.00,"""
-
         csv_file = personal_folder / "test.CSV"
-        csv_file.write_text(csv_content)
+        csv_file.write_bytes(PERSONAL_CSV)
 
         # Use the temp path
         processor = CardProcessor(base_path=tmp_path)
@@ -428,17 +425,67 @@ class TestIntegration:
         # Third transaction crosses tier 2 (2 nights, single tier crossing)
         assert df['nights'].sum() == 4
 
+    def test_process_personal_card_default_csv_engine(self, tmp_path, monkeypatch):
+        """Without pyarrow the default pandas parser gives the same result."""
+        monkeypatch.setattr('benefits.card_processor._CSV_ENGINE', None)
+        personal_folder = tmp_path / "transactions" / "hyatt personal"
+        personal_folder.mkdir(parents=True)
+
+        (personal_folder / "test.CSV").write_bytes(PERSONAL_CSV)
+
+        processor = CardProcessor(base_path=tmp_path)
+        df = processor.process_personal_card()
+
+        assert len(df) == 3
+        assert df['cumsum'].iloc[-1] == 11300.0
+        assert df['nights'].sum() == 4
+
+    def test_process_personal_card_reuses_unchanged_files(self, tmp_path):
+        """A second call with untouched CSVs returns the cached result without a version bump."""
+        personal_folder = tmp_path / "transactions" / "hyatt personal"
+        personal_folder.mkdir(parents=True)
+        csv_file = personal_folder / "test.CSV"
+        csv_file.write_bytes(PERSONAL_CSV)
+
+        processor = CardProcessor(base_path=tmp_path)
+        df = processor.process_personal_card()
+        version = processor.version
+
+        assert processor.process_personal_card() is df
+        assert processor.version == version
+
+        # Rewriting the file invalidates the cache
+        csv_file.write_bytes(PERSONAL_CSV + b"\n03/01/2025,03/03/2025,Store D,Dining,Sale,-100.00,")
+        df = processor.process_personal_card()
+
+        assert len(df) == 4
+        assert processor.version == version + 1
+
+    def test_process_all(self, tmp_path):
+        """Both cards are processed and each bumps the version."""
+        personal_folder = tmp_path / "transactions" / "hyatt personal"
+        business_folder = tmp_path / "transactions" / "hyatt business"
+        personal_folder.mkdir(parents=True)
+        business_folder.mkdir(parents=True)
+        (personal_folder / "test.CSV").write_bytes(PERSONAL_CSV)
+        (business_folder / "test.CSV").write_bytes(BUSINESS_CSV)
+
+        processor = CardProcessor(base_path=tmp_path)
+        personal_df, business_df = processor.process_all()
+
+        assert personal_df is processor.personal_df
+        assert business_df is processor.business_df
+        assert personal_df['nights'].sum() == 4
+        assert business_df['nights'].sum() == 10
+        assert processor.version == 2
+
     def test_process_business_card_with_year_reset(self, tmp_path):
         """Test business card with year-to-year reset."""
         business_folder = tmp_path / "transactions" / "hyatt business"
         business_folder.mkdir(parents=True)
 
-        csv_content = """Transaction Date,Post Date,Description,Category,Type,Amount,Memo
-12/10/2024,12/12/2024,Store A,Shopping,Sale,-12000.00,
-01/10/2025,01/12/2025,Store B,Shopping,Sale,-11000.00,"""
-
         csv_file = business_folder / "test.CSV"
-        csv_file.write_text(csv_content)
+        csv_file.write_bytes(BUSINESS_CSV)
 
         processor = CardProcessor(base_path=tmp_path)
         df = processor.process_business_card()
@@ -449,9 +496,8 @@ class TestIntegration:
         assert df['nights'].sum() == 10
 
         # Check that cumsum_year resets
-        assert df[df['year'] == 2024]['cumsum_year'].iloc[0] == 12000.0
-        assert df[df['year'] == 2025]['cumsum_year'].iloc[0] == 11000.0
-
+        first_row = processor._first_row_per_year(df)
+        cumsum_year = df['cumsum_year'].to_numpy()
+        assert cumsum_year[first_row[2024]] == 12000.0
+        assert cumsum_year[first_row[2025]] == 11000.0
 
-# Mock patch helper
-from unittest.mock import patch
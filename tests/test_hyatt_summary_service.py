@@ -7,307 +7,314 @@ performs accurate summary calculations.
 """
 
 import pytest
+import pandas as pd
 from datetime import date
-from unittest.mock import Mock
 from hyatt.hyatt_summary_service import HyattSummaryService
 
+# The service and its stubs are plain Python; any deprecation is a real failure
+pytestmark = pytest.mark.filterwarnings("error::DeprecationWarning")
+
+# "Today" for the nights summary cases; stay and GOH dates are relative to it
+REFERENCE_DATE = date(2025, 6, 15)
+# Current time for the test that leaves the reference date to the service
+PINNED_NOW = pd.Timestamp('2026-06-15')
 
-@pytest.fixture
-def mock_card_processor():
-    """Mock CardProcessor with default behavior."""
-    mock = Mock()
-    # Default: return empty/zero values
-    mock.get_yearly_bonus_nights_breakdown.return_value = {
-        'posted': 0,
-        'pending': 0,
-        'total': 0
-    }
-    return mock
+# Benefits as returned by BenefitsCalculator.get_card_benefits; tests copy
+# them with {**BASE, ...} overrides rather than mutating the shared dicts
+TRAVEL_CREDIT = {
+    'category': 'Travel Credit',
+    'period': '2025-A07',
+    'amount': 300,
+    'posted': False,
+    'card_key': 'card_2025',
+}
+UBER_CREDIT = {
+    'category': 'Uber Credit',
+    'period': '2025-Jan',
+    'amount': 15,
+    'posted': False,
+    'card_key': 'card_2025',
+}
 
+# Benefits as passed to calculate_year_summary
+YEARLY_BENEFIT = {'amount': 300, 'custom_amount': None, 'posted': True, 'frequency': 'yearly'}
+EVERY_4_YEARS_BENEFIT = {'amount': 100, 'custom_amount': None, 'posted': False, 'frequency': 'every_4_years'}
+MONTHLY_BENEFIT = {'amount': 15, 'custom_amount': None, 'posted': False, 'frequency': 'monthly'}
 
-@pytest.fixture
-def mock_benefits_calculator():
-    """Mock BenefitsCalculator."""
-    return Mock()
 
+class StubCardProcessor:
+    """CardProcessor stand-in; queued breakdowns are returned in call order, then zeros."""
 
-@pytest.fixture
-def mock_stays_manager():
-    """Mock StaysManager with default empty data."""
-    mock = Mock()
-    mock.get_stays.return_value = []
-    mock.get_goh_nights.return_value = []
-    return mock
+    def reset(self):
+        self.breakdown_queue = []
 
+    def get_yearly_bonus_nights_breakdown(self, card_type, today=None):
+        if self.breakdown_queue:
+            return self.breakdown_queue.pop(0)
+        return {'posted': 0, 'pending': 0, 'total': 0}
 
-@pytest.fixture
-def summary_service(mock_card_processor, mock_benefits_calculator, mock_stays_manager):
-    """Create HyattSummaryService with mocks."""
-    return HyattSummaryService(
-        mock_card_processor,
-        mock_benefits_calculator,
-        mock_stays_manager
-    )
 
+class StubBenefitsCalculator:
+    """
+    BenefitsCalculator stand-in returning whatever the test configured.
+    Queued anniversary years and overlap answers are used in call order
+    before falling back to the fixed value.
+    """
 
-class TestCalculateNightsSummary:
-    """Test nights summary aggregation from all sources."""
+    def reset(self):
+        self.card_benefits = []
+        self.renewal_type = None
+        self.anniversary_year_queue = []
+        self.anniversary_year = None
+        self.overlap_queue = []
+        self.overlaps = False
+        self.last_overlap_call = None
+        self.every_4_years_info = None
 
-    def test_minimal_setup_only_yearly_start(self, summary_service):
-        """With no stays or CC nights, only yearly start is counted."""
-        # Act
-        summary = summary_service.calculate_nights_summary(date(2025, 6, 15))
+    def get_card_benefits(self, card_key):
+        return self.card_benefits
 
-        # Assert
-        assert summary['cc_yearly_start'] == 5
-        assert summary['cc_nights_posted'] == 0
-        assert summary['cc_nights_pending'] == 0
-        assert summary['current_nights'] == 0
-        assert summary['upcoming_nights'] == 0
-        assert summary['goh_nights'] == 0
-        assert summary['goh_nights_upcoming'] == 0
-        assert summary['nights_posted'] == 5  # Only yearly start
-        assert summary['nights_total'] == 5
-
-    def test_only_cc_bonus_nights(self, summary_service, mock_card_processor):
-        """With only CC bonus nights, calculates correctly."""
-        # Arrange
-        mock_card_processor.get_yearly_bonus_nights_breakdown.side_effect = [
-            {'posted': 10, 'pending': 5, 'total': 15},  # personal
-            {'posted': 20, 'pending': 10, 'total': 30}, # business
-        ]
+    def get_benefit_renewal_type(self, benefit):
+        return self.renewal_type
 
-        # Act
-        summary = summary_service.calculate_nights_summary(date(2025, 6, 15))
+    def get_benefit_period_anniversary_year(self, benefit):
+        if self.anniversary_year_queue:
+            return self.anniversary_year_queue.pop(0)
+        return self.anniversary_year
 
-        # Assert
-        assert summary['cc_nights_posted'] == 30  # 10 + 20
-        assert summary['cc_nights_pending'] == 15  # 5 + 10
-        assert summary['nights_posted'] == 35  # 5 + 30
-        assert summary['nights_total'] == 50  # 5 + 15 + 30
+    def calendar_period_overlaps_anniversary_year(self, *args):
+        self.last_overlap_call = args
+        if self.overlap_queue:
+            return self.overlap_queue.pop(0)
+        return self.overlaps
 
-    def test_with_completed_stays(self, summary_service, mock_stays_manager):
-        """Completed stays add to current nights."""
-        # Arrange
-        mock_stays_manager.get_stays.return_value = [
-            {'check_in': date(2025, 1, 10), 'check_out': date(2025, 1, 13)},  # 3 nights
-            {'check_in': date(2025, 3, 5), 'check_out': date(2025, 3, 8)},    # 3 nights
-        ]
+    def get_every_4_years_benefit_info(self, benefit):
+        return self.every_4_years_info
 
-        # Act
-        summary = summary_service.calculate_nights_summary(date(2025, 6, 15))
 
-        # Assert
-        assert summary['current_nights'] == 6  # 3 + 3
-        assert summary['upcoming_nights'] == 0
-        assert summary['nights_posted'] == 11  # 5 + 6
+class StubStaysManager:
+    """StaysManager stand-in holding plain lists of stays and GOH nights."""
 
-    def test_with_upcoming_stays(self, summary_service, mock_stays_manager):
-        """Future stays add to upcoming nights, not current."""
-        # Arrange
-        mock_stays_manager.get_stays.return_value = [
-            {'check_in': date(2025, 7, 1), 'check_out': date(2025, 7, 5)},   # 4 nights (future)
-            {'check_in': date(2025, 8, 10), 'check_out': date(2025, 8, 15)}, # 5 nights (future)
-        ]
+    def reset(self):
+        self.stays = []
+        self.goh_nights = []
 
-        # Act
-        summary = summary_service.calculate_nights_summary(date(2025, 6, 15))
+    def get_stays(self):
+        return self.stays
 
-        # Assert
-        assert summary['current_nights'] == 0
-        assert summary['upcoming_nights'] == 9  # 4 + 5
-        assert summary['nights_total'] == 14  # 5 + 9
-        assert summary['nights_posted'] == 5  # Does NOT include upcoming
+    def get_goh_nights(self):
+        return self.goh_nights
 
-    def test_with_mixed_past_and_future_stays(self, summary_service, mock_stays_manager):
-        """Correctly splits past and future stays."""
-        # Arrange
-        mock_stays_manager.get_stays.return_value = [
-            {'check_in': date(2025, 1, 10), 'check_out': date(2025, 1, 13)},  # 3 past
-            {'check_in': date(2025, 6, 14), 'check_out': date(2025, 6, 15)},  # 1 past (checkout on ref date)
-            {'check_in': date(2025, 7, 1), 'check_out': date(2025, 7, 5)},    # 4 future
-        ]
 
-        # Act
-        summary = summary_service.calculate_nights_summary(date(2025, 6, 15))
+# The stubs are built once per module and reset between tests by _reset_stubs
+@pytest.fixture(scope="module")
+def stub_card_processor():
+    """Stub CardProcessor with no bonus nights by default."""
+    return StubCardProcessor()
+
+
+@pytest.fixture(scope="module")
+def stub_benefits_calculator():
+    """Stub BenefitsCalculator."""
+    return StubBenefitsCalculator()
 
-        # Assert
-        assert summary['current_nights'] == 4  # 3 + 1
-        assert summary['upcoming_nights'] == 4
 
-    def test_with_goh_nights(self, summary_service, mock_stays_manager):
-        """GOH nights are counted separately."""
-        # Arrange
-        mock_stays_manager.get_goh_nights.return_value = [
-            {'date': date(2025, 2, 1)},  # past
-            {'date': date(2025, 4, 15)}, # past
-            {'date': date(2025, 9, 1)},  # future
-        ]
+@pytest.fixture(scope="module")
+def stub_stays_manager():
+    """Stub StaysManager with default empty data."""
+    return StubStaysManager()
 
-        # Act
-        summary = summary_service.calculate_nights_summary(date(2025, 6, 15))
 
-        # Assert
-        assert summary['goh_nights'] == 2
-        assert summary['goh_nights_upcoming'] == 1
-        assert summary['nights_posted'] == 7  # 5 + 2
-        assert summary['nights_total'] == 8  # 5 + 2 + 1
+@pytest.fixture(scope="module")
+def summary_service(stub_card_processor, stub_benefits_calculator, stub_stays_manager):
+    """Create HyattSummaryService with stubs."""
+    return HyattSummaryService(
+        stub_card_processor,
+        stub_benefits_calculator,
+        stub_stays_manager
+    )
 
-    def test_with_goh_night_on_reference_date(self, summary_service, mock_stays_manager):
-        """GOH night on reference date counts as occurred."""
-        # Arrange
-        mock_stays_manager.get_goh_nights.return_value = [
-            {'date': date(2025, 6, 15)},  # On reference date
-        ]
 
-        # Act
-        summary = summary_service.calculate_nights_summary(date(2025, 6, 15))
+@pytest.fixture(autouse=True)
+def _reset_stubs(stub_card_processor, stub_benefits_calculator, stub_stays_manager):
+    """Clear anything the previous test configured."""
+    for stub in (stub_card_processor, stub_benefits_calculator, stub_stays_manager):
+        stub.reset()
 
-        # Assert
-        assert summary['goh_nights'] == 1
-        assert summary['goh_nights_upcoming'] == 0
 
-    def test_all_sources_combined(self, summary_service, mock_card_processor, mock_stays_manager):
-        """Integration test with all sources contributing."""
-        # Arrange
-        mock_card_processor.get_yearly_bonus_nights_breakdown.side_effect = [
+class TestCalculateNightsSummary:
+    """Test nights summary aggregation from all sources."""
+
+    @pytest.mark.parametrize("breakdowns,stays,goh_nights,expected", [
+        # With no stays or CC nights, only yearly start is counted
+        pytest.param([], [], [], {
+            'cc_yearly_start': 5,
+            'cc_nights_posted': 0,
+            'cc_nights_pending': 0,
+            'current_nights': 0,
+            'upcoming_nights': 0,
+            'goh_nights': 0,
+            'goh_nights_upcoming': 0,
+            'nights_posted': 5,  # Only yearly start
+            'nights_total': 5,
+        }, id="minimal_setup_only_yearly_start"),
+        pytest.param([
             {'posted': 10, 'pending': 5, 'total': 15},  # personal
             {'posted': 20, 'pending': 10, 'total': 30}, # business
-        ]
-        mock_stays_manager.get_stays.return_value = [
+        ], [], [], {
+            'cc_nights_posted': 30,  # 10 + 20
+            'cc_nights_pending': 15,  # 5 + 10
+            'nights_posted': 35,  # 5 + 30
+            'nights_total': 50,  # 5 + 15 + 30
+        }, id="only_cc_bonus_nights"),
+        # Completed stays add to current nights
+        pytest.param([], [
+            {'check_in': date(2025, 1, 10), 'check_out': date(2025, 1, 13)},  # 3 nights
+            {'check_in': date(2025, 3, 5), 'check_out': date(2025, 3, 8)},    # 3 nights
+        ], [], {
+            'current_nights': 6,  # 3 + 3
+            'upcoming_nights': 0,
+            'nights_posted': 11,  # 5 + 6
+        }, id="with_completed_stays"),
+        # Future stays add to upcoming nights, not current
+        pytest.param([], [
+            {'check_in': date(2025, 7, 1), 'check_out': date(2025, 7, 5)},   # 4 nights (future)
+            {'check_in': date(2025, 8, 10), 'check_out': date(2025, 8, 15)}, # 5 nights (future)
+        ], [], {
+            'current_nights': 0,
+            'upcoming_nights': 9,  # 4 + 5
+            'nights_total': 14,  # 5 + 9
+            'nights_posted': 5,  # Does NOT include upcoming
+        }, id="with_upcoming_stays"),
+        pytest.param([], [
+            {'check_in': date(2025, 1, 10), 'check_out': date(2025, 1, 13)},  # 3 past
+            {'check_in': date(2025, 6, 14), 'check_out': REFERENCE_DATE},  # 1 past (checkout on ref date)
+            {'check_in': date(2025, 7, 1), 'check_out': date(2025, 7, 5)},    # 4 future
+        ], [], {
+            'current_nights': 4,  # 3 + 1
+            'upcoming_nights': 4,
+        }, id="with_mixed_past_and_future_stays"),
+        pytest.param([], [
+            {'check_in': date(2025, 1, 10), 'check_out': date(2025, 1, 11)},  # 1 night
+            {'check_in': date(2025, 2, 5), 'check_out': date(2025, 2, 6)},    # 1 night
+        ], [], {'current_nights': 2}, id="with_one_night_stays"),
+        pytest.param([], [
+            {'check_in': date(2025, 1, 1), 'check_out': date(2025, 1, 31)},  # 30 nights
+        ], [], {'current_nights': 30}, id="with_long_stay"),
+        # GOH nights are counted separately
+        pytest.param([], [], [
+            {'date': date(2025, 2, 1)},  # past
+            {'date': date(2025, 4, 15)}, # past
+            {'date': date(2025, 9, 1)},  # future
+        ], {
+            'goh_nights': 2,
+            'goh_nights_upcoming': 1,
+            'nights_posted': 7,  # 5 + 2
+            'nights_total': 8,  # 5 + 2 + 1
+        }, id="with_goh_nights"),
+        # GOH night on reference date counts as occurred
+        pytest.param([], [], [
+            {'date': REFERENCE_DATE},
+        ], {
+            'goh_nights': 1,
+            'goh_nights_upcoming': 0,
+        }, id="with_goh_night_on_reference_date"),
+        pytest.param([], [], [], {
+            'current_nights': 0,
+            'upcoming_nights': 0,
+            'goh_nights': 0,
+            'goh_nights_upcoming': 0,
+        }, id="empty_stays_empty_goh"),
+        pytest.param([
+            {'posted': 10, 'pending': 5, 'total': 15},  # personal
+            {'posted': 20, 'pending': 10, 'total': 30}, # business
+        ], [
             {'check_in': date(2025, 1, 1), 'check_out': date(2025, 1, 4)},   # 3 past
             {'check_in': date(2025, 8, 1), 'check_out': date(2025, 8, 6)},   # 5 future
-        ]
-        mock_stays_manager.get_goh_nights.return_value = [
+        ], [
             {'date': date(2025, 3, 1)},  # 1 past
             {'date': date(2025, 10, 1)}, # 1 future
-        ]
+        ], {
+            'cc_yearly_start': 5,
+            'cc_nights_posted': 30,
+            'cc_nights_pending': 15,
+            'current_nights': 3,
+            'upcoming_nights': 5,
+            'goh_nights': 1,
+            'goh_nights_upcoming': 1,
+            # Posted: 5 (yearly) + 30 (CC posted) + 3 (current) + 1 (GOH)
+            'nights_posted': 39,
+            # Total: 5 + 30 + 15 + 3 + 5 + 1 + 1 = 60
+            'nights_total': 60,
+        }, id="all_sources_combined"),
+        # Matches app.py lines 128-129:
+        # nights_posted = cc_yearly_start + current_nights + goh_nights + cc_nights_posted
+        # nights_total = cc_yearly_start + current_nights + goh_nights + upcoming_goh_nights +
+        #                personal_breakdown['total'] + business_breakdown['total'] + upcoming_nights
+        pytest.param([
+            {'posted': 8, 'pending': 4, 'total': 12},  # personal
+            {'posted': 12, 'pending': 6, 'total': 18}, # business
+        ], [
+            {'check_in': date(2025, 1, 1), 'check_out': date(2025, 1, 3)},  # 2 past
+            {'check_in': date(2025, 12, 1), 'check_out': date(2025, 12, 4)}, # 3 future
+        ], [
+            {'date': date(2025, 2, 1)},  # 1 past
+            {'date': date(2025, 11, 1)}, # 1 future
+        ], {
+            'nights_posted': 5 + 2 + 1 + 20,
+            'nights_total': 5 + 2 + 1 + 1 + 12 + 18 + 3,
+        }, id="calculation_matches_app_formula"),
+    ])
+    def test_nights_summary(
+        self, summary_service, stub_card_processor, stub_stays_manager,
+        breakdowns, stays, goh_nights, expected
+    ):
+        """Nights from every source are split into posted and total as of the reference date."""
+        # Arrange
+        stub_card_processor.breakdown_queue = list(breakdowns)
+        stub_stays_manager.stays = stays
+        stub_stays_manager.goh_nights = goh_nights
 
         # Act
-        summary = summary_service.calculate_nights_summary(date(2025, 6, 15))
+        summary = summary_service.calculate_nights_summary(REFERENCE_DATE)
 
         # Assert
-        assert summary['cc_yearly_start'] == 5
-        assert summary['cc_nights_posted'] == 30
-        assert summary['cc_nights_pending'] == 15
-        assert summary['current_nights'] == 3
-        assert summary['upcoming_nights'] == 5
-        assert summary['goh_nights'] == 1
-        assert summary['goh_nights_upcoming'] == 1
-        # Posted: 5 (yearly) + 30 (CC posted) + 3 (current) + 1 (GOH)
-        assert summary['nights_posted'] == 39
-        # Total: 5 + 30 + 15 + 3 + 5 + 1 + 1 = 60
-        # Or: 5 + 3 + 1 + 1 + 15 + 30 + 5 = 60
-        assert summary['nights_total'] == 60
-
-    def test_uses_default_reference_date_if_not_provided(self, summary_service, mock_stays_manager):
+        assert {field: getattr(summary, field) for field in expected} == expected
+        assert stub_card_processor.breakdown_queue == []  # Personal and business both read
+
+    def test_uses_default_reference_date_if_not_provided(
+        self, summary_service, stub_stays_manager, monkeypatch
+    ):
         """When reference_date is None, uses current date."""
-        # Arrange
-        mock_stays_manager.get_stays.return_value = [
+        # Arrange - pin "now" so the past/upcoming split doesn't depend on the clock
+        monkeypatch.setattr(pd.Timestamp, 'now', classmethod(lambda cls, tz=None: PINNED_NOW))
+        stub_stays_manager.stays = [
             {'check_in': date(2020, 1, 1), 'check_out': date(2020, 1, 3)},  # Far past
+            {'check_in': date(2026, 7, 1), 'check_out': date(2026, 7, 3)},  # After the pinned date
         ]
 
         # Act
         summary = summary_service.calculate_nights_summary()  # No reference_date
 
-        # Assert - should count as past since we're in 2026
-        assert summary['current_nights'] == 2
-
-    def test_with_one_night_stays(self, summary_service, mock_stays_manager):
-        """One night stays (checkout next day) counted correctly."""
-        # Arrange
-        mock_stays_manager.get_stays.return_value = [
-            {'check_in': date(2025, 1, 10), 'check_out': date(2025, 1, 11)},  # 1 night
-            {'check_in': date(2025, 2, 5), 'check_out': date(2025, 2, 6)},    # 1 night
-        ]
-
-        # Act
-        summary = summary_service.calculate_nights_summary(date(2025, 6, 15))
-
-        # Assert
-        assert summary['current_nights'] == 2
-
-    def test_with_long_stay(self, summary_service, mock_stays_manager):
-        """Long stays calculated correctly."""
-        # Arrange
-        mock_stays_manager.get_stays.return_value = [
-            {'check_in': date(2025, 1, 1), 'check_out': date(2025, 1, 31)},  # 30 nights
-        ]
-
-        # Act
-        summary = summary_service.calculate_nights_summary(date(2025, 6, 15))
-
         # Assert
-        assert summary['current_nights'] == 30
-
-    def test_empty_stays_empty_goh(self, summary_service, mock_stays_manager):
-        """Empty stays and GOH lists handled correctly."""
-        # Arrange - defaults already empty
-        # Act
-        summary = summary_service.calculate_nights_summary(date(2025, 6, 15))
-
-        # Assert
-        assert summary['current_nights'] == 0
-        assert summary['upcoming_nights'] == 0
-        assert summary['goh_nights'] == 0
-        assert summary['goh_nights_upcoming'] == 0
-
-    def test_calculation_matches_app_formula(self, summary_service, mock_card_processor, mock_stays_manager):
-        """Verify calculation matches app.py lines 128-129."""
-        # Arrange
-        mock_card_processor.get_yearly_bonus_nights_breakdown.side_effect = [
-            {'posted': 8, 'pending': 4, 'total': 12},  # personal
-            {'posted': 12, 'pending': 6, 'total': 18}, # business
-        ]
-        mock_stays_manager.get_stays.return_value = [
-            {'check_in': date(2025, 1, 1), 'check_out': date(2025, 1, 3)},  # 2 past
-            {'check_in': date(2025, 12, 1), 'check_out': date(2025, 12, 4)}, # 3 future
-        ]
-        mock_stays_manager.get_goh_nights.return_value = [
-            {'date': date(2025, 2, 1)},  # 1 past
-            {'date': date(2025, 11, 1)}, # 1 future
-        ]
+        assert summary.current_nights == 2
+        assert summary.upcoming_nights == 2
 
-        # Act
-        summary = summary_service.calculate_nights_summary(date(2025, 6, 15))
-
-        # Assert - app.py line 128
-        # nights_posted = cc_yearly_start + current_nights + goh_nights + cc_nights_posted
-        expected_posted = 5 + 2 + 1 + 20
-        assert summary['nights_posted'] == expected_posted
-
-        # Assert - app.py line 129
-        # nights_total = cc_yearly_start + current_nights + goh_nights + upcoming_goh_nights +
-        #                personal_breakdown['total'] + business_breakdown['total'] + upcoming_nights
-        expected_total = 5 + 2 + 1 + 1 + 12 + 18 + 3
-        assert summary['nights_total'] == expected_total
 
 class TestGetFilteredBenefitsForYear:
     """Test benefit filtering with deduplication for anniversary years."""
 
     def test_filters_anniversary_benefits_by_period_year(
-        self, summary_service, mock_benefits_calculator
+        self, summary_service, stub_benefits_calculator
     ):
         """Anniversary benefits filtered by year in period."""
         # Arrange
-        mock_benefits_calculator.get_card_benefits.return_value = [
-            {
-                'category': 'Travel Credit',
-                'period': '2025-A07',
-                'amount': 300,
-                'posted': False,
-                'card_key': 'card_2025',
-            },
-            {
-                'category': 'Travel Credit',
-                'period': '2026-A07',
-                'amount': 300,
-                'posted': False,
-                'card_key': 'card_2025',
-            },
+        stub_benefits_calculator.card_benefits = [
+            dict(TRAVEL_CREDIT),
+            {**TRAVEL_CREDIT, 'period': '2026-A07'},
         ]
-        mock_benefits_calculator.get_benefit_renewal_type.return_value = 'card_anniversary'
-        mock_benefits_calculator.get_benefit_period_anniversary_year.side_effect = [2025, 2026]
+        stub_benefits_calculator.renewal_type = 'card_anniversary'
+        stub_benefits_calculator.anniversary_year_queue = [2025, 2026]
 
         # Act
         benefits = summary_service.get_filtered_benefits_for_year('card_2025', 2025)
@@ -315,37 +322,20 @@ class TestGetFilteredBenefitsForYear:
         # Assert
         assert len(benefits) == 1
         assert benefits[0]['period'] == '2025-A07'
+        assert stub_benefits_calculator.anniversary_year_queue == []  # One lookup per benefit
 
     def test_deduplicates_by_category_and_period(
-        self, summary_service, mock_benefits_calculator
+        self, summary_service, stub_benefits_calculator
     ):
         """Duplicate benefits by (category, period) are removed."""
         # Arrange
-        mock_benefits_calculator.get_card_benefits.return_value = [
-            {
-                'category': 'Travel Credit',
-                'period': '2025-A07',
-                'amount': 300,
-                'posted': False,
-                'card_key': 'card_2025',
-            },
-            {
-                'category': 'Travel Credit',
-                'period': '2025-A07',  # Duplicate
-                'amount': 300,
-                'posted': False,
-                'card_key': 'card_2025',
-            },
-            {
-                'category': 'Hotel Credit',
-                'period': '2025-A07',  # Different category, keep
-                'amount': 200,
-                'posted': False,
-                'card_key': 'card_2025',
-            },
+        stub_benefits_calculator.card_benefits = [
+            dict(TRAVEL_CREDIT),
+            dict(TRAVEL_CREDIT),  # Duplicate
+            {**TRAVEL_CREDIT, 'category': 'Hotel Credit', 'amount': 200},  # Different category, keep
         ]
-        mock_benefits_calculator.get_benefit_renewal_type.return_value = 'card_anniversary'
-        mock_benefits_calculator.get_benefit_period_anniversary_year.return_value = 2025
+        stub_benefits_calculator.renewal_type = 'card_anniversary'
+        stub_benefits_calculator.anniversary_year = 2025
 
         # Act
         benefits = summary_service.get_filtered_benefits_for_year('card_2025', 2025)
@@ -357,21 +347,13 @@ class TestGetFilteredBenefitsForYear:
         assert 'Hotel Credit' in categories
 
     def test_posted_anniversary_benefits_use_actual_year(
-        self, summary_service, mock_benefits_calculator
+        self, summary_service, stub_benefits_calculator
     ):
         """Posted anniversary benefits filtered by their actual anniversary year."""
         # Arrange
-        mock_benefits_calculator.get_card_benefits.return_value = [
-            {
-                'category': 'Travel Credit',
-                'period': '2025-A07',
-                'amount': 300,
-                'posted': True,
-                'card_key': 'card_2025',
-            },
-        ]
-        mock_benefits_calculator.get_benefit_renewal_type.return_value = 'card_anniversary'
-        mock_benefits_calculator.get_benefit_period_anniversary_year.return_value = 2025
+        stub_benefits_calculator.card_benefits = [{**TRAVEL_CREDIT, 'posted': True}]
+        stub_benefits_calculator.renewal_type = 'card_anniversary'
+        stub_benefits_calculator.anniversary_year = 2025
 
         # Act - filter for 2025
         benefits_2025 = summary_service.get_filtered_benefits_for_year('card_2025', 2025)
@@ -382,29 +364,17 @@ class TestGetFilteredBenefitsForYear:
         assert len(benefits_2026) == 0
 
     def test_calendar_year_benefits_check_overlap(
-        self, summary_service, mock_benefits_calculator
+        self, summary_service, stub_benefits_calculator
     ):
         """Calendar year benefits filtered by overlap with anniversary year."""
         # Arrange
-        mock_benefits_calculator.get_card_benefits.return_value = [
-            {
-                'category': 'Uber Credit',
-                'period': '2025-Jan',
-                'amount': 15,
-                'posted': False,
-                'card_key': 'card_2025',
-            },
-            {
-                'category': 'Uber Credit',
-                'period': '2025-Dec',
-                'amount': 15,
-                'posted': False,
-                'card_key': 'card_2025',
-            },
+        stub_benefits_calculator.card_benefits = [
+            dict(UBER_CREDIT),
+            {**UBER_CREDIT, 'period': '2025-Dec'},
         ]
-        mock_benefits_calculator.get_benefit_renewal_type.return_value = 'calendar_year'
-        # Mock overlap: Jan overlaps with 2025, Dec doesn't
-        mock_benefits_calculator.calendar_period_overlaps_anniversary_year.side_effect = [True, False]
+        stub_benefits_calculator.renewal_type = 'calendar_year'
+        # Overlap answers in call order: Jan overlaps with 2025, Dec doesn't
+        stub_benefits_calculator.overlap_queue = [True, False]
 
         # Act
         benefits = summary_service.get_filtered_benefits_for_year('card_2025', 2025)
@@ -412,13 +382,14 @@ class TestGetFilteredBenefitsForYear:
         # Assert
         assert len(benefits) == 1
         assert benefits[0]['period'] == '2025-Jan'
+        assert stub_benefits_calculator.overlap_queue == []  # One overlap check per benefit
 
     def test_empty_benefits_returns_empty_list(
-        self, summary_service, mock_benefits_calculator
+        self, summary_service, stub_benefits_calculator
     ):
         """No benefits returns empty list."""
         # Arrange
-        mock_benefits_calculator.get_card_benefits.return_value = []
+        stub_benefits_calculator.card_benefits = []
 
         # Act
         benefits = summary_service.get_filtered_benefits_for_year('card_2025', 2025)
@@ -427,21 +398,16 @@ class TestGetFilteredBenefitsForYear:
         assert benefits == []
 
     def test_uses_benefit_card_key_for_overlap_check(
-        self, summary_service, mock_benefits_calculator
+        self, summary_service, stub_benefits_calculator
     ):
         """Uses each benefit's card_key for anniversary calculations."""
         # Arrange
-        mock_benefits_calculator.get_card_benefits.return_value = [
-            {
-                'category': 'Uber Credit',
-                'period': '2025-Jun',
-                'amount': 15,
-                'posted': True,
-                'card_key': 'specific_card_key',  # Different from query key
-            },
+        stub_benefits_calculator.card_benefits = [
+            # card_key is different from the query key
+            {**UBER_CREDIT, 'period': '2025-Jun', 'posted': True, 'card_key': 'specific_card_key'},
         ]
-        mock_benefits_calculator.get_benefit_renewal_type.return_value = 'calendar_year'
-        mock_benefits_calculator.calendar_period_overlaps_anniversary_year.return_value = True
+        stub_benefits_calculator.renewal_type = 'calendar_year'
+        stub_benefits_calculator.overlaps = True
 
         # Act
         benefits = summary_service.get_filtered_benefits_for_year('card_2025', 2025)
@@ -449,27 +415,18 @@ class TestGetFilteredBenefitsForYear:
         # Assert
         assert len(benefits) == 1
         # Verify it used the benefit's card_key
-        mock_benefits_calculator.calendar_period_overlaps_anniversary_year.assert_called_with(
-            'specific_card_key', '2025-Jun', 2025
-        )
+        assert stub_benefits_calculator.last_overlap_call == ('specific_card_key', '2025-Jun', 2025)
 
 
 class TestCalculateYearSummary:
     """Test year-specific benefit calculations."""
 
-    def test_posted_benefits_use_custom_amount(self, summary_service, mock_benefits_calculator):
+    def test_posted_benefits_use_custom_amount(self, summary_service, stub_benefits_calculator):
         """Posted benefits use custom amount if set."""
         # Arrange
-        benefits = [
-            {
-                'amount': 300,
-                'custom_amount': 250,  # Partially used
-                'posted': True,
-                'frequency': 'yearly',
-                'posted_anniversary_year': 2025,
-            }
-        ]
-        mock_benefits_calculator.get_benefit_renewal_type.return_value = 'card_anniversary'
+        # Partially used
+        benefits = [{**YEARLY_BENEFIT, 'custom_amount': 250, 'posted_anniversary_year': 2025}]
+        stub_benefits_calculator.renewal_type = 'card_anniversary'
 
         # Act
         summary = summary_service.calculate_year_summary(benefits, 695, 2025)
@@ -479,19 +436,12 @@ class TestCalculateYearSummary:
         assert summary['total_potential_year'] == 300  # Uses full amount
 
     def test_posted_benefits_use_full_amount_if_no_custom(
-        self, summary_service, mock_benefits_calculator
+        self, summary_service, stub_benefits_calculator
     ):
         """Posted benefits use full amount if custom not set."""
         # Arrange
-        benefits = [
-            {
-                'amount': 300,
-                'custom_amount': None,
-                'posted': True,
-                'frequency': 'yearly',
-            }
-        ]
-        mock_benefits_calculator.get_benefit_renewal_type.return_value = 'card_anniversary'
+        benefits = [dict(YEARLY_BENEFIT)]
+        stub_benefits_calculator.renewal_type = 'card_anniversary'
 
         # Act
         summary = summary_service.calculate_year_summary(benefits, 695, 2025)
@@ -500,20 +450,13 @@ class TestCalculateYearSummary:
         assert summary['total_posted_year'] == 300
 
     def test_every_4_years_benefit_not_available(
-        self, summary_service, mock_benefits_calculator
+        self, summary_service, stub_benefits_calculator
     ):
         """Every 4 years benefit doesn't count if not available."""
         # Arrange
-        benefits = [
-            {
-                'amount': 100,
-                'custom_amount': None,
-                'posted': False,
-                'frequency': 'every_4_years',
-            }
-        ]
-        mock_benefits_calculator.get_benefit_renewal_type.return_value = 'card_anniversary'
-        mock_benefits_calculator.get_every_4_years_benefit_info.return_value = {
+        benefits = [dict(EVERY_4_YEARS_BENEFIT)]
+        stub_benefits_calculator.renewal_type = 'card_anniversary'
+        stub_benefits_calculator.every_4_years_info = {
             'is_available': False
         }
 
@@ -524,20 +467,13 @@ class TestCalculateYearSummary:
         assert summary['total_potential_year'] == 0  # Not counted
 
     def test_every_4_years_benefit_counts_when_available(
-        self, summary_service, mock_benefits_calculator
+        self, summary_service, stub_benefits_calculator
     ):
         """Every 4 years benefit counts when available."""
         # Arrange
-        benefits = [
-            {
-                'amount': 100,
-                'custom_amount': None,
-                'posted': False,
-                'frequency': 'every_4_years',
-            }
-        ]
-        mock_benefits_calculator.get_benefit_renewal_type.return_value = 'card_anniversary'
-        mock_benefits_calculator.get_every_4_years_benefit_info.return_value = {
+        benefits = [dict(EVERY_4_YEARS_BENEFIT)]
+        stub_benefits_calculator.renewal_type = 'card_anniversary'
+        stub_benefits_calculator.every_4_years_info = {
             'is_available': True
         }
 
@@ -547,18 +483,11 @@ class TestCalculateYearSummary:
         # Assert
         assert summary['total_potential_year'] == 100
 
-    def test_calculates_roi_correctly(self, summary_service, mock_benefits_calculator):
+    def test_calculates_roi_correctly(self, summary_service, stub_benefits_calculator):
         """ROI is calculated as (posted - fee) / fee * 100."""
         # Arrange
-        benefits = [
-            {
-                'amount': 1000,
-                'custom_amount': None,
-                'posted': True,
-                'frequency': 'yearly'
-            }
-        ]
-        mock_benefits_calculator.get_benefit_renewal_type.return_value = 'card_anniversary'
+        benefits = [{**YEARLY_BENEFIT, 'amount': 1000}]
+        stub_benefits_calculator.renewal_type = 'card_anniversary'
 
         # Act
         summary = summary_service.calculate_year_summary(benefits, 500, 2025)
@@ -568,18 +497,11 @@ class TestCalculateYearSummary:
         assert summary['net_value_posted_year'] == 500  # 1000 - 500
         assert summary['roi_posted_year'] == 100.0  # (500 / 500) * 100
 
-    def test_roi_is_zero_when_fee_is_zero(self, summary_service, mock_benefits_calculator):
+    def test_roi_is_zero_when_fee_is_zero(self, summary_service, stub_benefits_calculator):
         """ROI is 0 when annual fee is 0."""
         # Arrange
-        benefits = [
-            {
-                'amount': 300,
-                'custom_amount': None,
-                'posted': True,
-                'frequency': 'yearly'
-            }
-        ]
-        mock_benefits_calculator.get_benefit_renewal_type.return_value = 'card_anniversary'
+        benefits = [dict(YEARLY_BENEFIT)]
+        stub_benefits_calculator.renewal_type = 'card_anniversary'
 
         # Act
         summary = summary_service.calculate_year_summary(benefits, 0, 2025)
@@ -588,20 +510,13 @@ class TestCalculateYearSummary:
         assert summary['roi_posted_year'] == 0
 
     def test_calendar_year_posted_in_different_year_not_counted(
-        self, summary_service, mock_benefits_calculator
+        self, summary_service, stub_benefits_calculator
     ):
         """Calendar year benefits posted in different anniversary year not counted."""
         # Arrange
-        benefits = [
-            {
-                'amount': 15,
-                'custom_amount': None,
-                'posted': True,
-                'frequency': 'monthly',
-                'posted_anniversary_year': 2024,  # Posted in different year
-            }
-        ]
-        mock_benefits_calculator.get_benefit_renewal_type.return_value = 'calendar_year'
+        # Posted in different year
+        benefits = [{**MONTHLY_BENEFIT, 'posted': True, 'posted_anniversary_year': 2024}]
+        stub_benefits_calculator.renewal_type = 'calendar_year'
 
         # Act
         summary = summary_service.calculate_year_summary(benefits, 695, 2025)
@@ -611,19 +526,12 @@ class TestCalculateYearSummary:
         assert summary['total_potential_year'] == 0  # Not this year
 
     def test_pending_calendar_benefits_count_as_potential(
-        self, summary_service, mock_benefits_calculator
+        self, summary_service, stub_benefits_calculator
     ):
         """Pending calendar year benefits count as potential."""
         # Arrange
-        benefits = [
-            {
-                'amount': 15,
-                'custom_amount': None,
-                'posted': False,
-                'frequency': 'monthly',
-            }
-        ]
-        mock_benefits_calculator.get_benefit_renewal_type.return_value = 'calendar_year'
+        benefits = [dict(MONTHLY_BENEFIT)]
+        stub_benefits_calculator.renewal_type = 'calendar_year'
 
         # Act
         summary = summary_service.calculate_year_summary(benefits, 695, 2025)
@@ -633,19 +541,12 @@ class TestCalculateYearSummary:
         assert summary['total_potential_year'] == 15
 
     def test_anniversary_benefits_always_counted_when_posted(
-        self, summary_service, mock_benefits_calculator
+        self, summary_service, stub_benefits_calculator
     ):
         """Anniversary benefits always counted if posted."""
         # Arrange
-        benefits = [
-            {
-                'amount': 300,
-                'custom_amount': 275,
-                'posted': True,
-                'frequency': 'yearly',
-            }
-        ]
-        mock_benefits_calculator.get_benefit_renewal_type.return_value = 'card_anniversary'
+        benefits = [{**YEARLY_BENEFIT, 'custom_amount': 275}]
+        stub_benefits_calculator.renewal_type = 'card_anniversary'
 
         # Act
         summary = summary_service.calculate_year_summary(benefits, 695, 2025)
@@ -653,7 +554,7 @@ class TestCalculateYearSummary:
         # Assert
         assert summary['total_posted_year'] == 275
 
-    def test_empty_benefits_list(self, summary_service, mock_benefits_calculator):
+    def test_empty_benefits_list(self, summary_service, stub_benefits_calculator):
         """Empty benefits list returns zeros."""
         # Act
         summary = summary_service.calculate_year_summary([], 695, 2025)
@@ -665,31 +566,16 @@ class TestCalculateYearSummary:
         assert summary['roi_posted_year'] < 0  # Negative ROI
 
     def test_multiple_benefits_summed_correctly(
-        self, summary_service, mock_benefits_calculator
+        self, summary_service, stub_benefits_calculator
     ):
         """Multiple benefits summed correctly."""
         # Arrange
         benefits = [
-            {
-                'amount': 300,
-                'custom_amount': None,
-                'posted': True,
-                'frequency': 'yearly',
-            },
-            {
-                'amount': 200,
-                'custom_amount': None,
-                'posted': True,
-                'frequency': 'yearly',
-            },
-            {
-                'amount': 150,
-                'custom_amount': None,
-                'posted': False,
-                'frequency': 'yearly',
-            },
+            dict(YEARLY_BENEFIT),
+            {**YEARLY_BENEFIT, 'amount': 200},
+            {**YEARLY_BENEFIT, 'amount': 150, 'posted': False},
         ]
-        mock_benefits_calculator.get_benefit_renewal_type.return_value = 'card_anniversary'
+        stub_benefits_calculator.renewal_type = 'card_anniversary'
 
         # Act
         summary = summary_service.calculate_year_summary(benefits, 695, 2025)
@@ -699,19 +585,12 @@ class TestCalculateYearSummary:
         assert summary['total_potential_year'] == 650  # 300 + 200 + 150
 
     def test_custom_amount_zero_uses_full_amount(
-        self, summary_service, mock_benefits_calculator
+        self, summary_service, stub_benefits_calculator
     ):
         """Custom amount of 0 is treated as not set, uses full amount."""
         # Arrange
-        benefits = [
-            {
-                'amount': 300,
-                'custom_amount': 0,  # Zero means not used
-                'posted': True,
-                'frequency': 'yearly',
-            }
-        ]
-        mock_benefits_calculator.get_benefit_renewal_type.return_value = 'card_anniversary'
+        benefits = [{**YEARLY_BENEFIT, 'custom_amount': 0}]  # Zero means not used
+        stub_benefits_calculator.renewal_type = 'card_anniversary'
 
         # Act
         summary = summary_service.calculate_year_summary(benefits, 695, 2025)
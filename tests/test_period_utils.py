@@ -6,7 +6,7 @@ chronologically across various formats (monthly, quarterly, yearly, anniversary)
 """
 
 import pytest
-from benefits.period_utils import parse_period_for_sorting, sort_benefits_by_period
+from benefits.period_utils import SortedBenefits, parse_period_for_sorting, sort_benefits_by_period
 
 
 class TestParsePeriodForSorting:
@@ -65,6 +65,8 @@ class TestParsePeriodForSorting:
         assert parse_period_for_sorting("") == (0, 0)
         assert parse_period_for_sorting("not-a-date") == (0, 0)
         assert parse_period_for_sorting("2025-XYZ") == (0, 0)
+        assert parse_period_for_sorting("2025-Q5") == (0, 0)
+        assert parse_period_for_sorting("2025-H3") == (0, 0)
 
     def test_handles_different_years(self):
         """Parsing works correctly across different years."""
@@ -73,6 +75,16 @@ class TestParsePeriodForSorting:
         assert parse_period_for_sorting("2025-Mar") == (2025, 3)
         assert parse_period_for_sorting("2026-Apr") == (2026, 4)
 
+    def test_repeated_periods_are_parsed_once(self):
+        """Each distinct period string is parsed once and then served from the cache."""
+        parse_period_for_sorting.cache_clear()
+
+        for _ in range(3):
+            assert parse_period_for_sorting("2025-Jan") == (2025, 1)
+
+        info = parse_period_for_sorting.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
+
 
 class TestSortBenefitsByPeriod:
     """Test benefit sorting by period."""
@@ -203,3 +215,37 @@ class TestSortBenefitsByPeriod:
         periods = [b['period'] for b in sorted_benefits]
 
         assert periods == ['invalid', '2025-Jan', '2025-Jun']
+
+
+class TestSortedBenefits:
+    """Test the incrementally sorted benefit list."""
+
+    def test_add_keeps_period_order(self):
+        """Benefits added one at a time come out in period order."""
+        benefits = SortedBenefits([{'period': '2025-Q4'}, {'period': '2025-Jan'}])
+
+        benefits.add({'period': '2025-A07'})
+        benefits.add({'period': '2024-Dec'})
+        benefits.add({'period': '2026'})
+
+        assert [b['period'] for b in benefits] == [
+            '2024-Dec', '2025-Jan', '2025-A07', '2025-Q4', '2026'
+        ]
+        assert len(benefits) == 5
+        assert benefits[0]['period'] == '2024-Dec'
+
+    def test_matches_sort_benefits_by_period(self):
+        """Ties keep insertion order, exactly like a full stable sort."""
+        added = [
+            {'period': '2025-Q3', 'id': 1},
+            {'period': '2025-Jan', 'id': 2},
+            {'period': '2025-H2', 'id': 3},
+            {'period': 'invalid', 'id': 4},
+            {'period': '2025-Q1', 'id': 5},
+            {'period': '2025-Jul', 'id': 6},
+        ]
+        benefits = SortedBenefits(added[:2])
+        for benefit in added[2:]:
+            benefits.add(benefit)
+
+        assert list(benefits) == sort_benefits_by_period(added)
@@ -10,6 +10,7 @@ This tests:
 
 import pytest
 import json
+import pandas as pd
 from datetime import date
 from pathlib import Path
 from hyatt.stays_manager import StaysManager
@@ -145,6 +146,30 @@ class TestStaysOperations:
 
         assert result is False
 
+    def test_delete_stays_batch(self, empty_state_file):
+        """Deleting several stays at once should keep the rest in order."""
+        manager = StaysManager(state_path=empty_state_file)
+
+        manager.add_stay("Hotel 1", date(2025, 3, 10), date(2025, 3, 13))
+        manager.add_stay("Hotel 2", date(2025, 4, 10), date(2025, 4, 12))
+        manager.add_stay("Hotel 3", date(2025, 5, 10), date(2025, 5, 15))
+
+        deleted = manager.delete_stays([2, 0, 99])
+
+        assert deleted == 2
+        assert [s['name'] for s in manager.get_stays()] == ["Hotel 2"]
+
+    def test_delete_stays_batch_nothing_valid(self, empty_state_file):
+        """A batch with no valid indices should leave state and version alone."""
+        manager = StaysManager(state_path=empty_state_file)
+        manager.add_stay("Hotel", date(2025, 3, 10), date(2025, 3, 13))
+        version = manager.version
+
+        assert manager.delete_stays([]) == 0
+        assert manager.delete_stays([-1, 5]) == 0
+        assert len(manager.get_stays()) == 1
+        assert manager.version == version
+
 
 class TestGOHNightsOperations:
     """Test CRUD operations for GOH nights."""
@@ -227,6 +252,19 @@ class TestGOHNightsOperations:
 
         assert result is False
 
+    def test_delete_goh_nights_batch(self, empty_state_file):
+        """Deleting several GOH nights at once should persist the survivors."""
+        manager = StaysManager(state_path=empty_state_file)
+
+        manager.add_goh_night("Guest 1", date(2025, 4, 15))
+        manager.add_goh_night("Guest 2", date(2025, 5, 20))
+        manager.add_goh_night("Guest 3", date(2025, 6, 25))
+
+        assert manager.delete_goh_nights([0, 1]) == 2
+
+        reloaded = StaysManager(state_path=empty_state_file)
+        assert [g['name'] for g in reloaded.get_goh_nights()] == ["Guest 3"]
+
 
 class TestDateConversion:
     """Test date conversion from ISO strings to date objects."""
@@ -252,6 +290,73 @@ class TestDateConversion:
         assert isinstance(goh_nights[0]['date'], date)
         assert not isinstance(goh_nights[0]['date'], str)
 
+    def test_repeated_dates_are_parsed_once(self, empty_state_file):
+        """Each distinct stored date string should be parsed once and reused."""
+        manager = StaysManager(state_path=empty_state_file)
+
+        manager.add_stay("Hotel", date(2025, 3, 10), date(2025, 3, 13))
+        manager.add_goh_night("Guest", date(2025, 3, 10))
+        first = manager.get_stays()
+        second = manager.get_stays()
+
+        assert second == first
+        assert second[0]['check_in'] is first[0]['check_in']
+        assert manager.get_goh_nights()[0]['date'] is first[0]['check_in']
+        assert len(manager._date_cache) == 2
+
+    def test_get_stays_columns_rebuilt_after_mutation(self, empty_state_file):
+        """Stays should come from parallel columns that refresh after each change."""
+        manager = StaysManager(state_path=empty_state_file)
+
+        manager.add_stay("Hotel", date(2025, 3, 10), date(2025, 3, 13))
+        manager.get_stays()[0]['name'] = "Changed by caller"
+        assert manager.get_stays()[0]['name'] == "Hotel"
+
+        manager.add_stay("Resort", date(2025, 4, 1), date(2025, 4, 3))
+        manager.delete_stay(0)
+        assert manager.get_stays() == [
+            {'name': "Resort", 'check_in': date(2025, 4, 1), 'check_out': date(2025, 4, 3)}
+        ]
+
+    def test_get_stays_df_columns_are_datetime(self, empty_state_file):
+        """Stays DataFrame should expose check-in/out as datetime64 columns."""
+        manager = StaysManager(state_path=empty_state_file)
+
+        manager.add_stay("Hotel", date(2025, 3, 10), date(2025, 3, 13))
+        stays_df = manager.get_stays_df()
+
+        assert list(stays_df['name']) == ["Hotel"]
+        assert pd.api.types.is_datetime64_any_dtype(stays_df['check_in'])
+        assert stays_df['nights'].tolist() == [3]
+
+    def test_get_stays_df_cached_until_mutation(self, empty_state_file):
+        """Stays DataFrame should be reused until a stay is added or deleted."""
+        manager = StaysManager(state_path=empty_state_file)
+
+        manager.add_stay("Hotel", date(2025, 3, 10), date(2025, 3, 13))
+        first = manager.get_stays_df()
+        assert manager.get_stays_df() is first
+
+        manager.add_stay("Resort", date(2025, 4, 1), date(2025, 4, 3))
+        second = manager.get_stays_df()
+        assert second is not first
+        assert len(second) == 2
+
+        manager.delete_stay(0)
+        assert list(manager.get_stays_df()['name']) == ["Resort"]
+
+    def test_get_goh_df_cached_until_mutation(self, empty_state_file):
+        """GOH DataFrame should be reused until a GOH night is added or deleted."""
+        manager = StaysManager(state_path=empty_state_file)
+
+        manager.add_goh_night("Guest", date(2025, 4, 15))
+        first = manager.get_goh_df()
+        assert manager.get_goh_df() is first
+        assert pd.api.types.is_datetime64_any_dtype(first['date'])
+
+        manager.delete_goh_night(0)
+        assert manager.get_goh_df().empty
+
 
 class TestStatePersistence:
     """Test state saving and loading."""
@@ -286,6 +391,144 @@ class TestStatePersistence:
         assert len(goh_nights) == 1
         assert goh_nights[0]['name'] == "Guest"
 
+    def test_mutations_append_to_log_and_replay(self, empty_state_file):
+        """Adds and deletes should append to the log, leaving the snapshot alone."""
+        snapshot = empty_state_file.read_text()
+        manager = StaysManager(state_path=empty_state_file)
+        manager.add_stay("Hotel A", date(2025, 3, 10), date(2025, 3, 13))
+        manager.add_stay("Hotel B", date(2025, 4, 15), date(2025, 4, 18))
+        manager.add_goh_night("Guest", date(2025, 4, 15))
+        manager.delete_stay(0)
+
+        assert empty_state_file.read_text() == snapshot
+        assert len(manager.log_path.read_text().splitlines()) == 4
+
+        reloaded = StaysManager(state_path=empty_state_file)
+        assert reloaded.state == manager.state
+
+    def test_log_compacts_into_snapshot(self, empty_state_file, monkeypatch):
+        """A log that outgrows the snapshot should be folded back into it."""
+        monkeypatch.setattr("hyatt.stays_manager._COMPACT_MIN_ENTRIES", 2)
+        manager = StaysManager(state_path=empty_state_file)
+        manager.add_stay("Hotel A", date(2025, 3, 10), date(2025, 3, 13))
+        manager.add_stay("Hotel B", date(2025, 4, 15), date(2025, 4, 18))
+        assert manager.log_path.exists()
+
+        manager.add_goh_night("Guest", date(2025, 4, 15))
+
+        assert not manager.log_path.exists()
+        assert json.loads(empty_state_file.read_text()) == {**manager.state, "log_seq": 3}
+        reloaded = StaysManager(state_path=empty_state_file)
+        assert reloaded.state == manager.state
+
+    def test_batch_writes_log_once(self, empty_state_file):
+        """Mutations inside batch() should reach the log together when it ends."""
+        manager = StaysManager(state_path=empty_state_file)
+
+        with manager.batch():
+            manager.add_stay("Hotel A", date(2025, 3, 10), date(2025, 3, 13))
+            manager.add_stay("Hotel B", date(2025, 4, 15), date(2025, 4, 18))
+            manager.add_goh_night("Guest", date(2025, 4, 15))
+            assert len(manager.get_stays()) == 2
+            assert not manager.log_path.exists()
+
+        assert len(manager.log_path.read_text().splitlines()) == 3
+        reloaded = StaysManager(state_path=empty_state_file)
+        assert reloaded.state == manager.state
+
+    def test_truncated_log_line_is_ignored(self, empty_state_file):
+        """A log line cut short by a crash should not block loading earlier entries."""
+        manager = StaysManager(state_path=empty_state_file)
+        manager.add_stay("Hotel A", date(2025, 3, 10), date(2025, 3, 13))
+        with open(manager.log_path, 'a') as f:
+            f.write('{"op": "add_stay", "st')
+
+        reloaded = StaysManager(state_path=empty_state_file)
+        assert [s['name'] for s in reloaded.get_stays()] == ["Hotel A"]
+
+    def test_appends_after_torn_log_line_survive_reload(self, empty_state_file):
+        """Loading should cut a torn line off the log so later appends are readable."""
+        manager = StaysManager(state_path=empty_state_file)
+        manager.add_stay("Hotel A", date(2025, 3, 10), date(2025, 3, 13))
+        with open(manager.log_path, 'a') as f:
+            f.write('{"op": "add_stay", "st')
+
+        recovered = StaysManager(state_path=empty_state_file)
+        recovered.add_stay("Hotel B", date(2025, 4, 15), date(2025, 4, 18))
+        recovered.add_stay("Hotel C", date(2025, 5, 20), date(2025, 5, 22))
+
+        reloaded = StaysManager(state_path=empty_state_file)
+        assert [s['name'] for s in reloaded.get_stays()] == ["Hotel A", "Hotel B", "Hotel C"]
+
+    def test_log_already_in_snapshot_is_not_replayed(self, empty_state_file):
+        """A crash between writing the snapshot and removing the log must not reapply it."""
+        manager = StaysManager(state_path=empty_state_file)
+        manager.add_stay("Hotel A", date(2025, 3, 10), date(2025, 3, 13))
+        manager.add_stay("Hotel B", date(2025, 4, 15), date(2025, 4, 18))
+        manager.add_stay("Hotel C", date(2025, 5, 20), date(2025, 5, 22))
+        manager.delete_stay(0)
+        log = manager.log_path.read_bytes()
+
+        # Compact, then put the log back as if the unlink never happened
+        manager.save_state()
+        manager.log_path.write_bytes(log)
+
+        reloaded = StaysManager(state_path=empty_state_file)
+        assert [s['name'] for s in reloaded.get_stays()] == ["Hotel B", "Hotel C"]
+
+        reloaded.add_goh_night("Guest", date(2025, 4, 15))
+        again = StaysManager(state_path=empty_state_file)
+        assert again.state == reloaded.state
+
+    def test_failed_snapshot_write_keeps_previous_snapshot(self, empty_state_file, monkeypatch):
+        """A crash while writing the snapshot should leave the old one loadable."""
+        manager = StaysManager(state_path=empty_state_file)
+        manager.add_stay("Hotel A", date(2025, 3, 10), date(2025, 3, 13))
+        manager.save_state()
+        manager.add_stay("Hotel B", date(2025, 4, 15), date(2025, 4, 18))
+
+        def write_half(path, data):
+            with open(path, 'wb') as f:
+                f.write(data[:len(data) // 2])
+            raise OSError("disk full")
+
+        monkeypatch.setattr(Path, "write_bytes", write_half)
+        with pytest.raises(OSError):
+            manager.save_state()
+        monkeypatch.undo()
+
+        reloaded = StaysManager(state_path=empty_state_file)
+        assert [s['name'] for s in reloaded.get_stays()] == ["Hotel A", "Hotel B"]
+
+    def test_unchanged_snapshot_is_not_parsed_again(self, empty_state_file, monkeypatch):
+        """A second manager for an unchanged snapshot should reuse the first parse."""
+        first = StaysManager(state_path=empty_state_file)
+        first.save_state()
+
+        def fail(data):
+            raise AssertionError("snapshot parsed again")
+
+        monkeypatch.setattr("hyatt.stays_manager._loads_state", fail)
+        second = StaysManager(state_path=empty_state_file)
+        assert second.state == first.state
+        monkeypatch.undo()
+
+        # The cached copy is not shared with either manager
+        second.state["stays"].append({"name": "Hotel A"})
+        assert first.state["stays"] == []
+        assert StaysManager(state_path=empty_state_file).state["stays"] == []
+
+    def test_rewritten_snapshot_is_parsed_again(self, empty_state_file):
+        """Changing the snapshot on disk should invalidate the shared parse."""
+        StaysManager(state_path=empty_state_file)
+        empty_state_file.write_text(json.dumps({
+            "stays": [{"name": "Hotel A", "check_in": "2025-03-10", "check_out": "2025-03-13"}],
+            "goh_nights": [],
+        }))
+
+        manager = StaysManager(state_path=empty_state_file)
+        assert [s['name'] for s in manager.get_stays()] == ["Hotel A"]
+
     def test_missing_state_file_creates_empty_state(self, tmp_path):
         """Missing state file should create empty state."""
         state_path = tmp_path / "nonexistent.json"
@@ -344,6 +587,45 @@ class TestMixedOperations:
         assert len(manager.get_goh_nights()) == 0
 
 
+    def test_has_stays_and_has_goh(self, empty_state_file):
+        """has_stays/has_goh should track whether each list is non-empty."""
+        manager = StaysManager(state_path=empty_state_file)
+        assert manager.has_stays() is False
+        assert manager.has_goh() is False
+
+        manager.add_stay("Hotel", date(2025, 3, 10), date(2025, 3, 13))
+        assert manager.has_stays() is True
+        assert manager.has_goh() is False
+
+        manager.add_goh_night("Guest", date(2025, 4, 15))
+        manager.delete_stay(0)
+        assert manager.has_stays() is False
+        assert manager.has_goh() is True
+
+    def test_version_bumps_on_each_mutation(self, empty_state_file):
+        """Successful adds and deletes should bump the version counter."""
+        manager = StaysManager(state_path=empty_state_file)
+        assert manager.version == 0
+
+        manager.add_stay("Hotel A", date(2025, 3, 10), date(2025, 3, 13))
+        manager.add_goh_night("Guest", date(2025, 4, 15))
+        manager.delete_stay(0)
+        manager.delete_goh_night(0)
+
+        assert manager.version == 4
+
+    def test_version_unchanged_on_failed_mutation(self, empty_state_file):
+        """Rejected adds and deletes should not bump the version counter."""
+        manager = StaysManager(state_path=empty_state_file)
+
+        manager.add_stay("Hotel", date(2025, 3, 13), date(2025, 3, 10))
+        manager.add_goh_night("", date(2025, 4, 15))
+        manager.delete_stay(0)
+        manager.delete_goh_night(0)
+
+        assert manager.version == 0
+
+
 class TestEdgeCases:
     """Test edge cases and boundary conditions."""
 